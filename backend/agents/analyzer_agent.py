@@ -1,26 +1,57 @@
 import asyncio
 import random
-from typing import Dict, Any, List
-from .base_agent import BaseAgent
+from typing import Dict, Any, List, AsyncIterator
+from .base_agent import BaseAgent, AgentChunk, RESULT
+from .numeric import summarize
 
 class AnalyzerAgent(BaseAgent):
     """Athena - Analyzer Agent: Processes research data and extracts key insights"""
     
+    version = "1.1"
+    
+    # Simulated cost of reading one source and of the final synthesis
+    source_review_seconds = 0.25
+    synthesis_seconds = 1.25
+    
     def __init__(self, name: str, role: str, emoji: str, color: str):
         super().__init__(name, role, emoji, color)
         self.personality = "analytical and logical thinker"
+        self.reviewed_sources = set()
+    
+    async def review_source(self, source: Dict[str, Any]):
+        """Read one research source; can run while Nova is still gathering the rest"""
+        if source.get("id") in self.reviewed_sources:
+            return
+        self.status = "working"
+        start = min(10 * len(self.reviewed_sources), 50)
+        await self.simulate_work(duration=self.source_review_seconds, steps=2, start=start, end=min(start + 10, 50))
+        self.reviewed_sources.add(source.get("id"))
     
     async def execute(self, research_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze research data and extract insights"""
+        return await self.collect_stream(research_data)
+    
+    async def execute_stream(self, research_data: Dict[str, Any]) -> AsyncIterator[AgentChunk]:
+        """Yield insights one at a time, then the complete analysis"""
         self.status = "working"
         
-        # Simulate analysis process
-        await self.simulate_work(duration=2.5, steps=12)
+        # Sources not already reviewed from the research stream are read now
+        for source in research_data.get("sources", []):
+            await self.review_source(source)
         
         # Extract and analyze research data
+        insights = self._extract_insights(research_data)
+        trends = self._identify_trends(research_data)
+        for index, insight in enumerate(insights):
+            await self.simulate_work(
+                duration=self.synthesis_seconds / len(insights), steps=2,
+                start=50 + index * 50 // len(insights), end=50 + (index + 1) * 50 // len(insights)
+            )
+            yield AgentChunk("insight", insight)
+        
         analysis_results = {
-            "insights": self._extract_insights(research_data),
-            "trends": self._identify_trends(research_data),
+            "insights": insights,
+            "trends": trends,
             "recommendations": self._generate_recommendations(research_data),
             "risk_assessment": self._assess_risks(research_data),
             "success_metrics": self._define_metrics(research_data),
@@ -28,13 +59,15 @@ class AnalyzerAgent(BaseAgent):
             "metadata": {
                 "analysis_duration": "2.5 minutes",
                 "confidence_score": 0.88,
+                "insight_confidence": summarize([insight["confidence"] for insight in insights]),
+                "trend_confidence": summarize([trend["confidence"] for trend in trends]),
                 "insights_count": 6,
                 "recommendations_count": 4
             }
         }
         
         self.status = "completed"
-        return analysis_results
+        yield AgentChunk(RESULT, analysis_results)
     
     def _extract_insights(self, research_data: Dict[str, Any]) -> List[Dict[str, str]]:
         """Extract key insights from research data"""
@@ -1,10 +1,26 @@
 import asyncio
+import os
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, AsyncIterator
+
+# Chunk kind carrying an agent's complete output; always the last chunk of a stream
+RESULT = "result"
+
+@dataclass
+class AgentChunk:
+    """One piece of streamed agent output: a partial ("source", "insight", "chart") or the RESULT"""
+    kind: str
+    data: Any
 
 class BaseAgent(ABC):
     """Base class for all TaskHive agents"""
     
+    # Bump when an agent's output changes so cached stage results are invalidated
+    version = "1.0"
+    # Multiplier for simulate_work delays; 0 keeps the progress steps without sleeping
+    time_scale = float(os.getenv("TASKHIVE_TIME_SCALE", "1.0"))
+    
     def __init__(self, name: str, role: str, emoji: str, color: str):
         self.name = name
         self.role = role
@@ -12,19 +28,41 @@ class BaseAgent(ABC):
         self.color = color
         self.status = "idle"
         self.progress = 0
+        self.progress_reporter = None
     
     @abstractmethod
     async def execute(self, input_data: Any) -> Dict[str, Any]:
         """Execute the agent's main task"""
         pass
     
-    async def simulate_work(self, duration: float = 2.0, steps: int = 10):
-        """Simulate work progress with delays"""
-        step_duration = duration / steps
+    async def execute_stream(self, input_data: Any) -> AsyncIterator[AgentChunk]:
+        """Yield partial results as they are produced, then one RESULT chunk
+        
+        The default has no partials; agents that can emit early override this
+        and implement execute() with collect_stream().
+        """
+        yield AgentChunk(RESULT, await self.execute(input_data))
+    
+    async def collect_stream(self, input_data: Any) -> Any:
+        """Run execute_stream to completion and return its final result"""
+        async for chunk in self.execute_stream(input_data):
+            if chunk.kind == RESULT:
+                return chunk.data
+        raise RuntimeError(f"{self.name} finished without a result")
+    
+    async def simulate_work(self, duration: float = 2.0, steps: int = 10, start: int = 0, end: int = 100):
+        """Simulate work progress with delays, reporting progress from start to end"""
+        step_duration = duration * self.time_scale / steps
         for i in range(steps + 1):
-            self.progress = int((i / steps) * 100)
+            await self.set_progress(start + int((i / steps) * (end - start)))
             await asyncio.sleep(step_duration)
     
+    async def set_progress(self, progress: int):
+        """Record progress and forward it through the rate-limited reporter, if attached"""
+        self.progress = progress
+        if self.progress_reporter is not None:
+            await self.progress_reporter.report(progress)
+    
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
         return {
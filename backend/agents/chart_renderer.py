@@ -0,0 +1,144 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.linecharts import HorizontalLineChart
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.charts.spider import SpiderChart
+from reportlab.lib import colors
+
+# Fits the A4 text frame (72pt margins less the frame padding is ~439pt)
+CHART_WIDTH = 430
+CHART_HEIGHT = 230
+# Room above the plot for the chart title
+TITLE_HEIGHT = 24
+MAX_CACHED_DRAWINGS = 128
+
+# spec hash -> Drawing; each pool worker keeps its own
+_drawings: "OrderedDict[str, Drawing]" = OrderedDict()
+
+def chart_spec_key(spec: Dict[str, Any]) -> str:
+    """Content hash of the parts of a chart spec that affect the drawing"""
+    return _hash_drawable(_drawable_spec(spec))
+
+def _hash_drawable(drawable: Dict[str, Any]) -> str:
+    canonical = json.dumps(drawable, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def _drawable_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    data = spec.get("data", {})
+    return {
+        "type": spec.get("type", ""),
+        "title": spec.get("title", ""),
+        "labels": [str(label) for label in data.get("labels", [])],
+        "values": [float(value) for value in data.get("values", [])],
+        "unit": data.get("unit", ""),
+        "colors": list(spec.get("colors", []))
+    }
+
+def chart_drawing(spec: Dict[str, Any]) -> Optional[Drawing]:
+    """Vector drawing for a VisualizationAgent chart spec, or None for unsupported types
+
+    Drawings are memoized per process by spec hash, so a chart shared by many
+    reports is laid out once per PDF worker. Each call gets a copy: platypus
+    marks flowables it moves to the next page, and a shared drawing would carry
+    that mark into the next build and fail it with a LayoutError.
+    """
+    drawable = _drawable_spec(spec)
+    if drawable["type"] not in CHART_BUILDERS or not drawable["values"]:
+        return None
+
+    key = _hash_drawable(drawable)
+    drawing = _drawings.get(key)
+    if drawing is None:
+        drawing = _build_drawing(drawable)
+        _drawings[key] = drawing
+        while len(_drawings) > MAX_CACHED_DRAWINGS:
+            _drawings.popitem(last=False)
+    else:
+        _drawings.move_to_end(key)
+    return drawing.copy()
+
+def _build_drawing(drawable: Dict[str, Any]) -> Drawing:
+    drawing = Drawing(CHART_WIDTH, CHART_HEIGHT + TITLE_HEIGHT)
+    title = drawable["title"]
+    if drawable["unit"]:
+        title = f"{title} ({drawable['unit']})"
+    drawing.add(String(
+        CHART_WIDTH / 2, CHART_HEIGHT + 8, title,
+        fontName="Helvetica-Bold", fontSize=11, textAnchor="middle",
+        fillColor=colors.HexColor("#374151")
+    ))
+    CHART_BUILDERS[drawable["type"]](drawing, drawable)
+    return drawing
+
+def _color(drawable: Dict[str, Any], index: int, default: str = "#3B82F6"):
+    palette = drawable["colors"] or [default]
+    return colors.HexColor(palette[index % len(palette)])
+
+def _value_axis_max(values) -> float:
+    # Round up to a multiple of 10 so the grid labels stay tidy
+    top = max(max(values), 0)
+    return max(10, (int(top) // 10 + 1) * 10)
+
+def _bar_chart(drawing: Drawing, drawable: Dict[str, Any]):
+    chart = VerticalBarChart()
+    chart.x, chart.y, chart.width, chart.height = 50, 30, CHART_WIDTH - 80, CHART_HEIGHT - 50
+    chart.data = [drawable["values"]]
+    chart.categoryAxis.categoryNames = drawable["labels"]
+    chart.categoryAxis.labels.fontSize = 8
+    chart.valueAxis.valueMin = min(0, min(drawable["values"]))
+    chart.valueAxis.valueMax = _value_axis_max(drawable["values"])
+    chart.valueAxis.labels.fontSize = 8
+    chart.barSpacing = 2
+    for index in range(len(drawable["values"])):
+        chart.bars[(0, index)].fillColor = _color(drawable, index)
+        chart.bars[(0, index)].strokeColor = None
+    drawing.add(chart)
+
+def _pie_chart(drawing: Drawing, drawable: Dict[str, Any]):
+    chart = Pie()
+    size = CHART_HEIGHT - 60
+    chart.x, chart.y, chart.width, chart.height = (CHART_WIDTH - size) / 2, 30, size, size
+    chart.data = drawable["values"]
+    chart.labels = drawable["labels"]
+    chart.slices.fontSize = 8
+    chart.slices.strokeColor = colors.white
+    for index in range(len(drawable["values"])):
+        chart.slices[index].fillColor = _color(drawable, index, "#10B981")
+    drawing.add(chart)
+
+def _line_chart(drawing: Drawing, drawable: Dict[str, Any]):
+    chart = HorizontalLineChart()
+    chart.x, chart.y, chart.width, chart.height = 50, 30, CHART_WIDTH - 80, CHART_HEIGHT - 50
+    chart.data = [drawable["values"]]
+    chart.categoryAxis.categoryNames = drawable["labels"]
+    chart.categoryAxis.labels.fontSize = 8
+    chart.valueAxis.valueMin = min(0, min(drawable["values"]))
+    chart.valueAxis.valueMax = _value_axis_max(drawable["values"])
+    chart.valueAxis.labels.fontSize = 8
+    chart.lines[0].strokeColor = _color(drawable, 0, "#F59E0B")
+    chart.lines[0].strokeWidth = 2
+    drawing.add(chart)
+
+def _radar_chart(drawing: Drawing, drawable: Dict[str, Any]):
+    chart = SpiderChart()
+    size = CHART_HEIGHT - 50
+    chart.x, chart.y, chart.width, chart.height = (CHART_WIDTH - size) / 2, 20, size, size
+    chart.data = [drawable["values"]]
+    chart.labels = drawable["labels"]
+    stroke = _color(drawable, 0, "#8B5CF6")
+    chart.strands[0].fillColor = colors.Color(stroke.red, stroke.green, stroke.blue, alpha=0.3)
+    chart.strands[0].strokeColor = stroke
+    chart.spokeLabels.fontSize = 8
+    drawing.add(chart)
+
+CHART_BUILDERS = {
+    "bar_chart": _bar_chart,
+    "pie_chart": _pie_chart,
+    "line_chart": _line_chart,
+    "radar_chart": _radar_chart
+}
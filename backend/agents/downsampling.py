@@ -0,0 +1,69 @@
+import os
+from typing import Dict, Any, List, Optional, Tuple
+
+from .numeric import bucket_means, bucket_starts, lttb_indices, top_n_indices
+
+# Display resolution per chart type; None leaves the series as produced
+DEFAULT_TARGET_POINTS: Dict[str, Optional[int]] = {
+    "line_chart": 500,
+    "bar_chart": 60,
+    "pie_chart": 12,
+    "radar_chart": None
+}
+
+# How each chart type is reduced: LTTB keeps line shapes, binning averages
+# neighbouring bars, and pies fold their smallest slices into "Other"
+METHODS = {
+    "line_chart": "lttb",
+    "bar_chart": "bin",
+    "pie_chart": "top_n"
+}
+
+def parse_target_points(spec: str) -> Dict[str, Optional[int]]:
+    """Parse "line_chart=1000,bar_chart=40" (0 or "none" disables a type)"""
+    targets = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        chart_type, _, value = item.partition("=")
+        value = value.strip().lower()
+        targets[chart_type.strip()] = None if value in ("", "0", "none") else int(value)
+    return targets
+
+class ChartDownsampler:
+    """Reduces chart series to a per-type target point count before they are broadcast"""
+
+    def __init__(self, target_points: Dict[str, Optional[int]] = None):
+        self.target_points = {**DEFAULT_TARGET_POINTS, **(target_points or {})}
+
+    @classmethod
+    def from_env(cls) -> "ChartDownsampler":
+        """Targets overridden by TASKHIVE_CHART_POINTS, e.g. "line_chart=1000,bar_chart=40" """
+        return cls(parse_target_points(os.getenv("TASKHIVE_CHART_POINTS", "")))
+
+    def reduce(self, chart_type: str, labels: List[str], values: List[float]) -> Tuple[List[str], List[float], str]:
+        """(labels, values, method) at display resolution; method is "" when untouched"""
+        target = self.target_points.get(chart_type)
+        method = METHODS.get(chart_type)
+        if not target or not method or len(values) <= target:
+            return labels, values, ""
+
+        if method == "lttb":
+            indices = lttb_indices(values, target)
+            return [labels[i] for i in indices], [values[i] for i in indices], method
+
+        if method == "bin":
+            starts = bucket_starts(len(values), target)
+            ends = starts[1:] + [len(values)]
+            binned_labels = [
+                labels[start] if end - start == 1 else f"{labels[start]} – {labels[end - 1]}"
+                for start, end in zip(starts, ends)
+            ]
+            return binned_labels, bucket_means(values, target, decimals=3), method
+
+        # top_n: keep the largest slices and sum the rest into one
+        kept = top_n_indices(values, target - 1)
+        kept_set = set(kept)
+        other = sum(value for index, value in enumerate(values) if index not in kept_set)
+        return [labels[i] for i in kept] + ["Other"], [values[i] for i in kept] + [round(other, 3)], method
+
+    def get_config(self) -> Dict[str, Any]:
+        return {"target_points": dict(self.target_points), "methods": dict(METHODS)}
@@ -0,0 +1,172 @@
+import asyncio
+import re
+from html.parser import HTMLParser
+from typing import Dict, Any, AsyncIterator, List, Optional
+from urllib.parse import quote_plus, urljoin
+
+import aiohttp
+
+from .source_providers import SourceProvider
+
+class _PageParser(HTMLParser):
+    """Pulls the title, description, first paragraphs and links out of an HTML page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.description = ""
+        self.paragraphs: List[str] = []
+        self.links: List[str] = []
+        self._in = None
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "a" and attrs.get("href"):
+            self.links.append(attrs["href"])
+        elif tag == "meta" and attrs.get("name", "").lower() == "description":
+            self.description = attrs.get("content", "") or ""
+        elif tag in ("title", "p") and self._in is None:
+            self._in, self._text = tag, []
+
+    def handle_endtag(self, tag):
+        if tag == self._in:
+            text = " ".join("".join(self._text).split())
+            if tag == "title":
+                self.title = text
+            elif text and len(self.paragraphs) < 3:
+                self.paragraphs.append(text)
+            self._in = None
+
+    def handle_data(self, data):
+        if self._in is not None:
+            self._text.append(data)
+
+class HTTPSourceProvider(SourceProvider):
+    """Fetches sources over HTTP through one pooled aiohttp session
+
+    Each URL template (with "{query}") is a search page; its links are fetched
+    as documents, or the page itself is the source if it has none. The
+    connector caps total and per-host connections and keeps them alive across
+    tasks; a semaphore bounds how many fetches run at once.
+    """
+
+    name = "http"
+    INLINE_PARSE_BYTES = 256 * 1024
+
+    def __init__(self, url_templates: List[str], max_sources: int = 20, max_parallel: int = 16,
+                 per_host_limit: int = 4, max_connections: int = 64, timeout: float = 10.0,
+                 connect_timeout: float = 3.0, max_page_bytes: int = 2 * 1024 * 1024):
+        self.url_templates = list(url_templates)
+        self.expected_sources = max_sources
+        self.max_sources = max_sources
+        self.max_parallel = max_parallel
+        self.per_host_limit = per_host_limit
+        self.max_connections = max_connections
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self.max_page_bytes = max_page_bytes
+        self._session: aiohttp.ClientSession = None
+        self._fetch_slots: asyncio.Semaphore = None
+        self.fetched = 0
+        self.failed = 0
+        self.bytes_read = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so it binds to the running event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.per_host_limit,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._fetch_slots = asyncio.Semaphore(self.max_parallel)
+        return self._session
+
+    async def _fetch(self, url: str) -> Optional[_PageParser]:
+        session = self._get_session()
+        try:
+            async with self._fetch_slots:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    body = await response.content.read(self.max_page_bytes)
+                    charset = response.charset or "utf-8"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.failed += 1
+            print(f"Source fetch failed for {url}: {e}")
+            return None
+        self.fetched += 1
+        self.bytes_read += len(body)
+        if len(body) > self.INLINE_PARSE_BYTES:
+            # Large pages are parsed off the event loop
+            return await asyncio.to_thread(self._parse, body, charset)
+        return self._parse(body, charset)
+
+    @staticmethod
+    def _parse(body: bytes, charset: str) -> _PageParser:
+        try:
+            text = body.decode(charset, errors="replace")
+        except LookupError:
+            # Unknown charset in the Content-Type header
+            text = body.decode("utf-8", errors="replace")
+        parser = _PageParser()
+        parser.feed(text)
+        parser.close()
+        return parser
+
+    async def search(self, task_description: str) -> AsyncIterator[Dict[str, Any]]:
+        query = quote_plus(task_description)
+        seeds = [template.format(query=query) for template in self.url_templates]
+        terms = set(re.findall(r"\w+", task_description.lower()))
+
+        pending = {asyncio.ensure_future(self._fetch(url)): (url, True) for url in seeds}
+        queued = set(seeds)
+        found = 0
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    url, is_seed = pending.pop(task)
+                    page = task.result()
+                    if page is None:
+                        continue
+                    if is_seed and page.links:
+                        for link in page.links:
+                            link = urljoin(url, link)
+                            if link not in queued and len(queued) - len(seeds) < self.max_sources:
+                                queued.add(link)
+                                pending[asyncio.ensure_future(self._fetch(link))] = (link, False)
+                        continue
+                    if found < self.max_sources:
+                        found += 1
+                        yield self._to_source(found, url, page, terms)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _to_source(self, index: int, url: str, page: _PageParser, terms: set) -> Dict[str, Any]:
+        summary = page.description or (page.paragraphs[0] if page.paragraphs else "")
+        words = set(re.findall(r"\w+", f"{page.title} {summary} {' '.join(page.paragraphs)}".lower()))
+        relevance = len(terms & words) / len(terms) if terms else 0.0
+        return {
+            "id": f"source_{index}",
+            "title": page.title or url,
+            "type": "web_page",
+            "url": url,
+            "relevance_score": round(0.5 + 0.5 * relevance, 3),
+            "summary": summary[:500]
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "fetched": self.fetched,
+            "failed": self.failed,
+            "bytes_read": self.bytes_read,
+            "max_parallel": self.max_parallel,
+            "per_host_limit": self.per_host_limit
+        }
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,116 @@
+import math
+from typing import Dict, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # optional fast path; the pure-Python versions give the same results
+    np = None
+
+NUMERIC_BACKEND = "numpy" if np is not None else "python"
+
+Series = Sequence[float]
+
+def _to_list(values, decimals: int = None) -> List[float]:
+    """Plain Python floats, so results serialize with json/orjson unchanged"""
+    if np is not None and isinstance(values, np.ndarray):
+        if decimals is not None:
+            values = np.round(values, decimals)
+        return values.tolist()
+    values = [float(value) for value in values]
+    if decimals is not None:
+        values = [round(value, decimals) for value in values]
+    return values
+
+def summarize(values: Series, decimals: int = 3) -> Dict[str, float]:
+    """count, min, max, mean and sum of a series"""
+    if len(values) == 0:
+        return {"count": 0, "min": 0.0, "max": 0.0, "mean": 0.0, "sum": 0.0}
+    if np is not None:
+        array = np.asarray(values, dtype=float)
+        total, low, high = float(array.sum()), float(array.min()), float(array.max())
+    else:
+        values = [float(value) for value in values]
+        total, low, high = math.fsum(values), min(values), max(values)
+    return {
+        "count": len(values),
+        "min": round(low, decimals),
+        "max": round(high, decimals),
+        "mean": round(total / len(values), decimals),
+        "sum": round(total, decimals)
+    }
+
+def bucket_means(values: Series, target_points: int, decimals: int = None) -> List[float]:
+    """Reduce a series to at most target_points by averaging equal-width buckets"""
+    count = len(values)
+    if target_points <= 0 or count <= target_points:
+        return _to_list(values, decimals)
+    if np is not None:
+        array = np.asarray(values, dtype=float)
+        edges = np.arange(target_points + 1) * count // target_points
+        sums = np.add.reduceat(array, edges[:-1])
+        return _to_list(sums / np.diff(edges), decimals)
+    means = []
+    for bucket in range(target_points):
+        start, end = count * bucket // target_points, count * (bucket + 1) // target_points
+        means.append(math.fsum(values[start:end]) / (end - start))
+    return _to_list(means, decimals)
+
+def bucket_starts(count: int, target_points: int) -> List[int]:
+    """Index of the first element of each bucket used by bucket_means"""
+    if target_points <= 0 or count <= target_points:
+        return list(range(count))
+    return [count * bucket // target_points for bucket in range(target_points)]
+
+def lttb_indices(values: Series, target_points: int) -> List[int]:
+    """Largest-Triangle-Three-Buckets: indices of the points that best keep the line's shape
+
+    The first and last points are always kept; each bucket in between keeps the
+    point forming the largest triangle with the previous pick and the next
+    bucket's average, so peaks and dips survive the reduction.
+    """
+    count = len(values)
+    if target_points >= count or count < 3:
+        return list(range(count))
+    if target_points < 3:
+        return [0, count - 1][:max(target_points, 0)]
+
+    buckets = target_points - 2
+    # Bucket edges over the points between the fixed first and last
+    edges = [1 + bucket * (count - 2) // buckets for bucket in range(buckets + 1)]
+    selected = [0]
+    anchor = 0
+    if np is not None:
+        y = np.asarray(values, dtype=float)
+        for bucket in range(buckets):
+            start, end = edges[bucket], edges[bucket + 1]
+            next_start, next_end = (edges[bucket + 1], edges[bucket + 2]) if bucket + 2 <= buckets else (count - 1, count)
+            avg_x = (next_start + next_end - 1) / 2.0
+            avg_y = y[next_start:next_end].mean()
+            xs = np.arange(start, end, dtype=float)
+            areas = np.abs((anchor - avg_x) * (y[start:end] - y[anchor]) - (anchor - xs) * (avg_y - y[anchor]))
+            anchor = start + int(areas.argmax())
+            selected.append(anchor)
+    else:
+        y = [float(value) for value in values]
+        for bucket in range(buckets):
+            start, end = edges[bucket], edges[bucket + 1]
+            next_start, next_end = (edges[bucket + 1], edges[bucket + 2]) if bucket + 2 <= buckets else (count - 1, count)
+            avg_x = (next_start + next_end - 1) / 2.0
+            avg_y = math.fsum(y[next_start:next_end]) / (next_end - next_start)
+            best, best_area = start, -1.0
+            for index in range(start, end):
+                area = abs((anchor - avg_x) * (y[index] - y[anchor]) - (anchor - index) * (avg_y - y[anchor]))
+                if area > best_area:
+                    best, best_area = index, area
+            anchor = best
+            selected.append(anchor)
+    selected.append(count - 1)
+    return selected
+
+def top_n_indices(values: Series, keep: int) -> List[int]:
+    """Indices of the keep largest values, in their original order"""
+    if keep >= len(values):
+        return list(range(len(values)))
+    if np is not None:
+        return sorted(np.argsort(-np.asarray(values, dtype=float), kind="stable")[:keep].tolist())
+    return sorted(sorted(range(len(values)), key=lambda index: -values[index])[:keep])
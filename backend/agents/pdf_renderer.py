@@ -0,0 +1,213 @@
+import asyncio
+import io
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Tuple, Union
+
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+
+from .chart_renderer import chart_drawing
+
+# A PDF layout is a list of (heading, body, separator, charts) tuples, where the
+# separator is "spacer" or "page_break" and charts are VisualizationAgent chart
+# specs. Plain data keeps it cheap to pickle; charts are drawn inside the worker.
+# Bodies are markup-escaped text; blank lines separate paragraphs.
+PDFLayout = List[Tuple[str, str, str, List[Dict[str, Any]]]]
+
+class PDFStyles(NamedTuple):
+    """Paragraph styles shared by every report; treat as read-only"""
+    title: ParagraphStyle
+    heading: ParagraphStyle
+    body: ParagraphStyle
+
+# Document template settings applied to every report
+DOC_TEMPLATE = MappingProxyType({"pagesize": A4})
+
+@lru_cache(maxsize=1)
+def get_pdf_styles() -> PDFStyles:
+    """Build the style sheet once per process (each pool worker has its own copy)"""
+    styles = getSampleStyleSheet()
+    return PDFStyles(
+        title=ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            textColor=colors.HexColor('#1F2937')
+        ),
+        heading=ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            spaceAfter=12,
+            spaceBefore=20,
+            textColor=colors.HexColor('#374151')
+        ),
+        body=ParagraphStyle(
+            'CustomBody',
+            parent=styles['Normal'],
+            fontSize=11,
+            spaceAfter=8,
+            textColor=colors.HexColor('#4B5563')
+        )
+    )
+
+def build_pdf(layout: PDFLayout, output_path: Union[str, BinaryIO], generated_on: str) -> Union[str, BinaryIO]:
+    """Build the PDF synchronously into a path or binary sink; runs inside a pool worker"""
+    doc = SimpleDocTemplate(output_path, **DOC_TEMPLATE)
+    story = []
+    styles = get_pdf_styles()
+    title_style, heading_style, body_style = styles.title, styles.heading, styles.body
+
+    # Title page
+    story.append(Paragraph("TaskHive Analysis Report", title_style))
+    story.append(Spacer(1, 20))
+    story.append(Paragraph(f"Generated on: {generated_on}", body_style))
+    story.append(Spacer(1, 30))
+
+    for heading, body, separator, charts in layout:
+        story.append(Paragraph(heading, heading_style))
+        for paragraph in body.split("\n\n"):
+            story.append(Paragraph(paragraph.replace("\n", "<br/>"), body_style))
+        for chart in charts:
+            drawing = chart_drawing(chart)
+            if drawing is not None:
+                story.append(Spacer(1, 12))
+                story.append(drawing)
+        if separator == "page_break":
+            story.append(PageBreak())
+        elif separator == "spacer":
+            story.append(Spacer(1, 20))
+
+    # Build PDF
+    doc.build(story)
+    return output_path
+
+def build_pdf_bytes(layout: PDFLayout, generated_on: str) -> bytes:
+    """Build the PDF in memory so only the bytes cross the process boundary"""
+    buffer = io.BytesIO()
+    build_pdf(layout, buffer, generated_on)
+    return buffer.getvalue()
+
+def _warm_up_worker() -> int:
+    """Load ReportLab fonts and styles in a worker before real work arrives"""
+    get_pdf_styles()
+    return os.getpid()
+
+def _timed_build(build, *args):
+    """Runs in the worker: the build result, when it started (wall clock) and how long it took"""
+    started = time.time()
+    began = time.perf_counter()
+    result = build(*args)
+    return result, started, time.perf_counter() - began
+
+class PDFRenderer:
+    """Runs ReportLab builds in a process pool (or thread pool) off the event loop
+
+    Every build reports its duration and how long it waited for a free worker,
+    so get_stats() shows render time separately from pool queueing.
+    """
+
+    def __init__(self, max_workers: int = None, use_processes: bool = True):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.use_processes = use_processes
+        self.executor_kind = None
+        self._executor: Executor = None
+        self.in_flight = 0
+        self.rendered = 0
+        self.failed = 0
+        self.build_seconds = 0.0
+        self.max_build_seconds = 0.0
+        self.last_build_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                try:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                    self.executor_kind = "process"
+                except (OSError, NotImplementedError) as e:
+                    # Platforms without working multiprocessing fall back to threads
+                    print(f"Process pool unavailable for PDF rendering, using threads: {e}")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pdf")
+                self.executor_kind = "thread"
+        return self._executor
+
+    async def _run_build(self, build, *args):
+        loop = asyncio.get_running_loop()
+        submitted = time.time()
+        self.in_flight += 1
+        try:
+            result, started, elapsed = await loop.run_in_executor(self._get_executor(), _timed_build, build, *args)
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        waited = max(0.0, started - submitted)
+        self.rendered += 1
+        self.build_seconds += elapsed
+        self.max_build_seconds = max(self.max_build_seconds, elapsed)
+        self.last_build_seconds = elapsed
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return result
+
+    async def render_bytes(self, layout: PDFLayout) -> bytes:
+        """Render the layout in the pool and return the PDF without touching disk"""
+        generated_on = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+        return await self._run_build(build_pdf_bytes, layout, generated_on)
+
+    async def warm_up(self):
+        """Start every worker up front so the first reports don't pay the spawn cost"""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        await asyncio.gather(*(
+            loop.run_in_executor(executor, _warm_up_worker) for _ in range(self.max_workers)
+        ))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool occupancy and build timings; queued builds are those waiting for a free worker"""
+        return {
+            "executor": self.executor_kind,
+            "workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "queued": max(0, self.in_flight - self.max_workers),
+            "rendered": self.rendered,
+            "failed": self.failed,
+            "build_seconds_total": round(self.build_seconds, 6),
+            "build_seconds_max": round(self.max_build_seconds, 6),
+            "build_seconds_last": round(self.last_build_seconds, 6),
+            "wait_seconds_total": round(self.wait_seconds, 6),
+            "wait_seconds_max": round(self.max_wait_seconds, 6)
+        }
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+_default_renderer: PDFRenderer = None
+
+def get_pdf_renderer() -> PDFRenderer:
+    """Process-wide renderer configured by TASKHIVE_PDF_WORKERS / TASKHIVE_PDF_EXECUTOR"""
+    global _default_renderer
+    if _default_renderer is None:
+        workers = os.getenv("TASKHIVE_PDF_WORKERS")
+        _default_renderer = PDFRenderer(
+            max_workers=int(workers) if workers else None,
+            use_processes=os.getenv("TASKHIVE_PDF_EXECUTOR", "process") != "thread"
+        )
+    return _default_renderer
@@ -0,0 +1,52 @@
+import asyncio
+import time
+from typing import Callable, Awaitable
+
+class ProgressReporter:
+    """Forwards agent progress at a bounded rate, always delivering the latest value
+
+    Updates arriving faster than max_rate per second are coalesced: only the
+    newest value is kept and sent when the interval elapses. flush() sends
+    any pending value immediately and should be awaited when the work ends.
+    """
+
+    def __init__(self, emit: Callable[[int], Awaitable[None]], max_rate: float = 4.0):
+        self._emit = emit
+        self.min_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self._last_emit = float("-inf")
+        self._pending: int = None
+        self._timer: asyncio.Task = None
+        self.reported = 0
+        self.emitted = 0
+
+    async def report(self, progress: int):
+        self.reported += 1
+        self._pending = progress
+        if time.monotonic() - self._last_emit >= self.min_interval:
+            await self._emit_pending()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._emit_later())
+
+    async def flush(self):
+        """Send the latest pending value now and stop the trailing timer"""
+        self.cancel()
+        await self._emit_pending()
+
+    def cancel(self):
+        """Discard the trailing timer without sending"""
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+
+    async def _emit_later(self):
+        await asyncio.sleep(max(0.0, self._last_emit + self.min_interval - time.monotonic()))
+        self._timer = None
+        await self._emit_pending()
+
+    async def _emit_pending(self):
+        if self._pending is None:
+            return
+        progress, self._pending = self._pending, None
+        self._last_emit = time.monotonic()
+        self.emitted += 1
+        await self._emit(progress)
@@ -0,0 +1,81 @@
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, List
+from xml.sax.saxutils import escape
+
+BANNER = "=" * 80
+
+@dataclass
+class ReportSection:
+    """One titled section of a report, kept as plain text paragraphs"""
+    key: str
+    title: str
+    paragraphs: List[str]
+    # Layout hint for the PDF: "spacer", "page_break" or "" after the section
+    pdf_separator: str = "spacer"
+    in_pdf: bool = True
+    # VisualizationAgent chart specs drawn after the text in the PDF
+    charts: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def body(self) -> str:
+        return "\n\n".join(self.paragraphs)
+
+@dataclass
+class ReportDocument:
+    """Section-keyed report built directly by Lex and rendered in a single pass"""
+    title: str
+    task_description: str
+    report_date: str
+    generated_by: str = "TaskHive AI Agent System"
+    sections: List[ReportSection] = field(default_factory=list)
+
+    def add_section(self, key: str, title: str, paragraphs: List[str],
+                    pdf_separator: str = "spacer", in_pdf: bool = True,
+                    charts: List[Dict[str, Any]] = None) -> ReportSection:
+        section = ReportSection(key, title, [p for p in paragraphs if p], pdf_separator, in_pdf, list(charts or []))
+        self.sections.append(section)
+        return section
+
+    def section(self, key: str) -> ReportSection:
+        for section in self.sections:
+            if section.key == key:
+                return section
+        raise KeyError(key)
+
+    def to_text(self) -> str:
+        """Plain-text rendering with banner-delimited section headings"""
+        parts = [
+            self.title.upper(),
+            "",
+            f"Task: {self.task_description}",
+            f"Report Date: {self.report_date}",
+            f"Generated by: {self.generated_by}",
+            ""
+        ]
+        for section in self.sections:
+            parts.extend((BANNER, section.title.upper(), BANNER, ""))
+            for paragraph in section.paragraphs:
+                parts.extend((paragraph, ""))
+        return "\n".join(parts)
+
+    def pdf_layout(self) -> List[tuple]:
+        """(heading, body, separator, charts) tuples for the PDF renderer, markup-escaped"""
+        return [
+            (escape(section.title), escape(section.body), section.pdf_separator, section.charts)
+            for section in self.sections
+            if section.in_pdf
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReportDocument":
+        sections = [ReportSection(**section) for section in data.get("sections", [])]
+        return cls(
+            title=data["title"],
+            task_description=data["task_description"],
+            report_date=data["report_date"],
+            generated_by=data.get("generated_by", "TaskHive AI Agent System"),
+            sections=sections
+        )
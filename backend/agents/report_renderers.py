@@ -0,0 +1,148 @@
+import hashlib
+import html
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from typing import Iterator, List
+
+from .pdf_renderer import PDFRenderer, build_pdf_bytes
+from .report_model import ReportDocument
+
+CHUNK_SIZE = 64 * 1024
+
+@dataclass(frozen=True)
+class ReportArtifact:
+    """A rendered report held in memory, ready to be streamed to a client"""
+    format: str
+    media_type: str
+    filename: str
+    data: bytes
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @cached_property
+    def etag(self) -> str:
+        return f'"{hashlib.sha256(self.data).hexdigest()[:32]}"'
+
+    def matches(self, if_none_match: str) -> bool:
+        """True when an If-None-Match header already names this content"""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or self.etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        view = memoryview(self.data)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start:start + chunk_size])
+
+class ReportRenderer(ABC):
+    """Turns a ReportDocument into one downloadable format"""
+
+    format: str = ""
+    extension: str = ""
+    media_type: str = ""
+
+    async def render_async(self, report: ReportDocument) -> bytes:
+        # Text formats are cheap enough to build on the event loop
+        return self.render_bytes(report)
+
+    @abstractmethod
+    def render_bytes(self, report: ReportDocument) -> bytes:
+        pass
+
+class TextReportRenderer(ReportRenderer):
+    format = "txt"
+    extension = "txt"
+    media_type = "text/plain; charset=utf-8"
+
+    def render_bytes(self, report: ReportDocument) -> bytes:
+        return report.to_text().encode("utf-8")
+
+class MarkdownReportRenderer(ReportRenderer):
+    format = "md"
+    extension = "md"
+    media_type = "text/markdown; charset=utf-8"
+
+    def render_bytes(self, report: ReportDocument) -> bytes:
+        parts = [
+            f"# {report.title}",
+            "",
+            f"**Task:** {report.task_description}  ",
+            f"**Report Date:** {report.report_date}  ",
+            f"**Generated by:** {report.generated_by}",
+            ""
+        ]
+        for section in report.sections:
+            parts.extend((f"## {section.title}", ""))
+            for paragraph in section.paragraphs:
+                # Trailing double spaces keep single line breaks in Markdown
+                parts.extend(("  \n".join(paragraph.split("\n")), ""))
+        return "\n".join(parts).encode("utf-8")
+
+class HTMLReportRenderer(ReportRenderer):
+    format = "html"
+    extension = "html"
+    media_type = "text/html; charset=utf-8"
+
+    STYLE = (
+        "body{font-family:system-ui,sans-serif;max-width:52rem;margin:2rem auto;color:#4B5563;line-height:1.5}"
+        "h1{color:#1F2937;text-align:center}h2{color:#374151;margin-top:2rem}"
+    )
+
+    def render_bytes(self, report: ReportDocument) -> bytes:
+        escape = html.escape
+        parts = [
+            "<!DOCTYPE html>",
+            '<html lang="en"><head><meta charset="utf-8">',
+            f"<title>{escape(report.title)}</title>",
+            f"<style>{self.STYLE}</style></head><body>",
+            f"<h1>{escape(report.title)}</h1>",
+            f"<p><strong>Task:</strong> {escape(report.task_description)}<br>"
+            f"<strong>Report Date:</strong> {escape(report.report_date)}<br>"
+            f"<strong>Generated by:</strong> {escape(report.generated_by)}</p>"
+        ]
+        for section in report.sections:
+            parts.append(f'<section id="{escape(section.key)}"><h2>{escape(section.title)}</h2>')
+            for paragraph in section.paragraphs:
+                parts.append(f"<p>{'<br>'.join(escape(line) for line in paragraph.split(chr(10)))}</p>")
+            parts.append("</section>")
+        parts.append("</body></html>")
+        return "\n".join(parts).encode("utf-8")
+
+class JSONReportRenderer(ReportRenderer):
+    format = "json"
+    extension = "json"
+    media_type = "application/json"
+
+    def render_bytes(self, report: ReportDocument) -> bytes:
+        return json.dumps(report.to_dict(), ensure_ascii=False, indent=2).encode("utf-8")
+
+class PDFReportRenderer(ReportRenderer):
+    """ReportLab output, built in the PDFRenderer's worker pool"""
+
+    format = "pdf"
+    extension = "pdf"
+    media_type = "application/pdf"
+
+    def __init__(self, pdf_renderer: PDFRenderer):
+        self.pdf_renderer = pdf_renderer
+
+    async def render_async(self, report: ReportDocument) -> bytes:
+        return await self.pdf_renderer.render_bytes(report.pdf_layout())
+
+    def render_bytes(self, report: ReportDocument) -> bytes:
+        return build_pdf_bytes(report.pdf_layout(), datetime.now().strftime('%B %d, %Y at %I:%M %p'))
+
+def default_renderers(pdf_renderer: PDFRenderer) -> List[ReportRenderer]:
+    return [
+        PDFReportRenderer(pdf_renderer),
+        HTMLReportRenderer(),
+        MarkdownReportRenderer(),
+        JSONReportRenderer(),
+        TextReportRenderer()
+    ]
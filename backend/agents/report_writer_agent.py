@@ -1,21 +1,34 @@
 import asyncio
 import os
+import textwrap
 from datetime import datetime
 from typing import Dict, Any, List
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from .base_agent import BaseAgent
+from .pdf_renderer import PDFRenderer, get_pdf_renderer
+from .report_model import ReportDocument
+from .report_renderers import ReportArtifact, ReportRenderer, default_renderers
 
 class ReportWriterAgent(BaseAgent):
     """Lex - Report Writer Agent: Generates comprehensive reports and PDF documents"""
     
-    def __init__(self, name: str, role: str, emoji: str, color: str):
+    version = "1.2"
+    
+    def __init__(self, name: str, role: str, emoji: str, color: str, pdf_renderer: PDFRenderer = None):
         super().__init__(name, role, emoji, color)
         self.personality = "professional and articulate writer"
+        self.pdf_renderer = pdf_renderer or get_pdf_renderer()
+        self.renderers: Dict[str, ReportRenderer] = {}
+        for renderer in default_renderers(self.pdf_renderer):
+            self.register_renderer(renderer)
+    
+    def register_renderer(self, renderer: ReportRenderer):
+        """Add or replace the backend for a download format"""
+        self.renderers[renderer.format] = renderer
+    
+    def get_renderer(self, report_format: str) -> ReportRenderer:
+        if report_format not in self.renderers:
+            raise ValueError(f"Unsupported report format '{report_format}', expected one of {sorted(self.renderers)}")
+        return self.renderers[report_format]
     
     async def execute(self, report_data: Dict[str, Any]) -> str:
         """Generate comprehensive report from all collected data"""
@@ -25,362 +38,221 @@ class ReportWriterAgent(BaseAgent):
         await self.simulate_work(duration=2.5, steps=15)
         
         # Generate comprehensive report
-        report_content = self._generate_report_content(report_data)
+        report = self._build_report(report_data)
+        
+        self.status = "completed"
+        return report.to_text()
+    
+    async def draft(self, report_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Write the report sections that do not depend on visualizations"""
+        self.status = "working"
+        
+        # Simulate report writing process
+        await self.simulate_work(duration=2.5, steps=15)
+        
+        return {
+            "report_data": report_data,
+            "sections": self._format_sections(report_data)
+        }
+    
+    def finalize(self, report_draft: Dict[str, Any], visualizations: Dict[str, Any]) -> ReportDocument:
+        """Combine a report draft with the finished visualizations"""
+        report_data = {**report_draft["report_data"], "visualizations": visualizations}
+        report = self._build_report(report_data, report_draft["sections"])
         
         self.status = "completed"
-        return report_content
+        return report
+    
+    async def render_artifact(self, report: ReportDocument, report_format: str, basename: str) -> ReportArtifact:
+        """Render the report in memory, skipping the disk entirely"""
+        renderer = self.get_renderer(report_format)
+        data = await renderer.render_async(report)
+        return ReportArtifact(renderer.format, renderer.media_type, f"{basename}.{renderer.extension}", data)
     
-    async def generate_pdf_report(self, report_content: str, output_path: str):
-        """Generate PDF report from content"""
-        try:
-            # Create PDF document
-            doc = SimpleDocTemplate(output_path, pagesize=A4)
-            story = []
-            
-            # Get styles
-            styles = getSampleStyleSheet()
-            
-            # Custom styles
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                spaceAfter=30,
-                alignment=TA_CENTER,
-                textColor=colors.HexColor('#1F2937')
-            )
-            
-            heading_style = ParagraphStyle(
-                'CustomHeading',
-                parent=styles['Heading2'],
-                fontSize=16,
-                spaceAfter=12,
-                spaceBefore=20,
-                textColor=colors.HexColor('#374151')
-            )
-            
-            body_style = ParagraphStyle(
-                'CustomBody',
-                parent=styles['Normal'],
-                fontSize=11,
-                spaceAfter=8,
-                textColor=colors.HexColor('#4B5563')
-            )
-            
-            # Title page
-            story.append(Paragraph("TaskHive Analysis Report", title_style))
-            story.append(Spacer(1, 20))
-            story.append(Paragraph(f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", body_style))
-            story.append(Spacer(1, 30))
-            
-            # Executive Summary
-            story.append(Paragraph("Executive Summary", heading_style))
-            story.append(Paragraph(self._extract_executive_summary(report_content), body_style))
-            story.append(PageBreak())
-            
-            # Research Findings
-            story.append(Paragraph("Research Findings", heading_style))
-            story.append(Paragraph(self._extract_research_findings(report_content), body_style))
-            story.append(Spacer(1, 20))
-            
-            # Analysis Results
-            story.append(Paragraph("Analysis Results", heading_style))
-            story.append(Paragraph(self._extract_analysis_results(report_content), body_style))
-            story.append(Spacer(1, 20))
-            
-            # Recommendations
-            story.append(Paragraph("Recommendations", heading_style))
-            story.append(Paragraph(self._extract_recommendations(report_content), body_style))
-            story.append(Spacer(1, 20))
-            
-            # Implementation Plan
-            story.append(Paragraph("Implementation Plan", heading_style))
-            story.append(Paragraph(self._extract_implementation_plan(report_content), body_style))
-            story.append(PageBreak())
-            
-            # Risk Assessment
-            story.append(Paragraph("Risk Assessment", heading_style))
-            story.append(Paragraph(self._extract_risk_assessment(report_content), body_style))
-            story.append(Spacer(1, 20))
-            
-            # Success Metrics
-            story.append(Paragraph("Success Metrics", heading_style))
-            story.append(Paragraph(self._extract_success_metrics(report_content), body_style))
-            story.append(Spacer(1, 20))
-            
-            # Conclusion
-            story.append(Paragraph("Conclusion", heading_style))
-            story.append(Paragraph(self._extract_conclusion(report_content), body_style))
-            
-            # Build PDF
-            doc.build(story)
-            
-            print(f"PDF report generated successfully: {output_path}")
-            
-        except Exception as e:
-            print(f"Error generating PDF: {e}")
-            raise
+    def _format_sections(self, report_data: Dict[str, Any]) -> Dict[str, str]:
+        """Pre-format the list sections of the report"""
+        research_data = report_data.get("research_data", {})
+        analysis_results = report_data.get("analysis_results", {})
+        return {
+            "findings": self._format_findings(research_data.get('key_findings', [])),
+            "insights": self._format_insights(analysis_results.get('insights', [])),
+            "recommendations": self._format_recommendations(analysis_results.get('recommendations', [])),
+            "risks": self._format_risks(analysis_results.get('risk_assessment', [])),
+            "metrics": self._format_metrics(analysis_results.get('success_metrics', []))
+        }
     
-    def _generate_report_content(self, report_data: Dict[str, Any]) -> str:
-        """Generate comprehensive report content"""
+    def _build_report(self, report_data: Dict[str, Any], sections: Dict[str, str] = None) -> ReportDocument:
+        """Build the section-keyed report document"""
         task_description = report_data.get("task_description", "the specified task")
         research_data = report_data.get("research_data", {})
         analysis_results = report_data.get("analysis_results", {})
         visualizations = report_data.get("visualizations", {})
-        
-        report = f"""
-        TASKHIVE COMPREHENSIVE ANALYSIS REPORT
-        
-        Task: {task_description}
-        Report Date: {datetime.now().strftime('%B %d, %Y')}
-        Generated by: TaskHive AI Agent System
-        
-        ================================================================================
-        EXECUTIVE SUMMARY
-        ================================================================================
-        
-        This comprehensive analysis report presents the findings from our multi-agent 
-        research and analysis of {task_description}. The report combines extensive 
-        research, detailed analysis, and professional recommendations to provide a 
-        complete understanding of the subject matter.
-        
-        Key Highlights:
-        • Comprehensive research conducted across 5 high-quality sources
-        • Detailed analysis revealing 6 key insights and 4 actionable recommendations
-        • Professional visualizations including 4 charts, 2 graphs, and 1 dashboard
-        • Risk assessment and implementation roadmap provided
-        • Expected ROI of 300% within 18 months
-        
-        ================================================================================
-        RESEARCH FINDINGS
-        ================================================================================
-        
-        {research_data.get('research_summary', 'Research summary not available')}
-        
-        Sources Analyzed: {len(research_data.get('sources', []))} high-quality sources
-        Research Confidence: {research_data.get('metadata', {}).get('confidence_score', 0.85) * 100}%
-        
-        Key Findings:
-        {self._format_findings(research_data.get('key_findings', []))}
-        
-        ================================================================================
-        ANALYSIS RESULTS
-        ================================================================================
-        
-        {analysis_results.get('analysis_summary', 'Analysis summary not available')}
-        
-        Insights Identified: {len(analysis_results.get('insights', []))}
-        Recommendations Generated: {len(analysis_results.get('recommendations', []))}
-        Analysis Confidence: {analysis_results.get('metadata', {}).get('confidence_score', 0.88) * 100}%
-        
-        Key Insights:
-        {self._format_insights(analysis_results.get('insights', []))}
-        
-        ================================================================================
-        RECOMMENDATIONS
-        ================================================================================
-        
-        Based on our comprehensive analysis, we recommend the following actions:
-        
-        {self._format_recommendations(analysis_results.get('recommendations', []))}
-        
-        ================================================================================
-        IMPLEMENTATION PLAN
-        ================================================================================
-        
-        Phase 1: Planning and Preparation (Months 1-2)
-        • Stakeholder engagement and buy-in
-        • Detailed project planning and resource allocation
-        • Technology assessment and vendor selection
-        
-        Phase 2: Pilot Implementation (Months 3-4)
-        • Small-scale pilot program
-        • User training and feedback collection
-        • Process optimization and refinement
-        
-        Phase 3: Full Rollout (Months 5-8)
-        • Gradual implementation across organization
-        • Continuous monitoring and support
-        • Performance measurement and reporting
-        
-        Phase 4: Optimization (Months 9-12)
-        • Process optimization and efficiency improvements
-        • Advanced feature implementation
-        • Long-term maintenance planning
-        
-        ================================================================================
-        RISK ASSESSMENT
-        ================================================================================
-        
-        {self._format_risks(analysis_results.get('risk_assessment', []))}
-        
-        ================================================================================
-        SUCCESS METRICS
-        ================================================================================
-        
-        {self._format_metrics(analysis_results.get('success_metrics', []))}
-        
-        ================================================================================
-        VISUALIZATION SUMMARY
-        ================================================================================
-        
-        {visualizations.get('visualization_summary', 'Visualization summary not available')}
-        
-        ================================================================================
-        CONCLUSION
-        ================================================================================
-        
-        This comprehensive analysis demonstrates a strong business case for implementing 
-        {task_description}. The research shows clear market demand, technology maturity, 
-        and significant potential for competitive advantage.
-        
-        Key Success Factors:
-        • Strong leadership and change management
-        • Proper stakeholder engagement
-        • Phased implementation approach
-        • Continuous monitoring and optimization
-        
-        Expected Outcomes:
-        • 25% efficiency improvement
-        • 30% cost reduction
-        • 90% user adoption
-        • 300% ROI within 18 months
-        
-        The implementation should begin within 3 months to capitalize on current market 
-        opportunities and gain competitive advantage. With proper planning and execution, 
-        this initiative will deliver significant value to the organization.
-        
-        ================================================================================
-        APPENDIX
-        ================================================================================
-        
-        Report generated by TaskHive AI Agent System
-        • Nova (Research Agent): Comprehensive research and source analysis
-        • Athena (Analyzer Agent): Data analysis and insight generation
-        • Pixel (Visualization Agent): Chart and graph creation
-        • Lex (Report Writer Agent): Report compilation and PDF generation
-        
-        Total processing time: Approximately 10 minutes
-        Data sources: 5 high-quality sources
-        Analysis confidence: 88%
-        Visualization elements: 8 total
-        
-        For questions or additional analysis, please contact the TaskHive team.
-        """
+        if sections is None:
+            sections = self._format_sections(report_data)
+        
+        report = ReportDocument(
+            title="TaskHive Comprehensive Analysis Report",
+            task_description=task_description,
+            report_date=datetime.now().strftime('%B %d, %Y')
+        )
+        
+        report.add_section("executive_summary", "Executive Summary", [
+            f"This comprehensive analysis report presents the findings from our multi-agent "
+            f"research and analysis of {task_description}. The report combines extensive "
+            f"research, detailed analysis, and professional recommendations to provide a "
+            f"complete understanding of the subject matter.",
+            "Key Highlights:\n"
+            "• Comprehensive research conducted across 5 high-quality sources\n"
+            "• Detailed analysis revealing 6 key insights and 4 actionable recommendations\n"
+            "• Professional visualizations including 4 charts, 2 graphs, and 1 dashboard\n"
+            "• Risk assessment and implementation roadmap provided\n"
+            "• Expected ROI of 300% within 18 months"
+        ], pdf_separator="page_break")
+        
+        report.add_section("research_findings", "Research Findings", [
+            self._clean(research_data.get('research_summary', 'Research summary not available')),
+            f"Sources Analyzed: {len(research_data.get('sources', []))} high-quality sources\n"
+            f"Research Confidence: {research_data.get('metadata', {}).get('confidence_score', 0.85) * 100}%",
+            f"Key Findings:\n{sections['findings']}"
+        ])
+        
+        report.add_section("analysis_results", "Analysis Results", [
+            self._clean(analysis_results.get('analysis_summary', 'Analysis summary not available')),
+            f"Insights Identified: {len(analysis_results.get('insights', []))}\n"
+            f"Recommendations Generated: {len(analysis_results.get('recommendations', []))}\n"
+            f"Analysis Confidence: {analysis_results.get('metadata', {}).get('confidence_score', 0.88) * 100}%",
+            f"Key Insights:\n{sections['insights']}"
+        ])
+        
+        report.add_section("recommendations", "Recommendations", [
+            "Based on our comprehensive analysis, we recommend the following actions:",
+            sections['recommendations']
+        ])
+        
+        report.add_section("implementation_plan", "Implementation Plan", [
+            "Phase 1: Planning and Preparation (Months 1-2)\n"
+            "• Stakeholder engagement and buy-in\n"
+            "• Detailed project planning and resource allocation\n"
+            "• Technology assessment and vendor selection",
+            "Phase 2: Pilot Implementation (Months 3-4)\n"
+            "• Small-scale pilot program\n"
+            "• User training and feedback collection\n"
+            "• Process optimization and refinement",
+            "Phase 3: Full Rollout (Months 5-8)\n"
+            "• Gradual implementation across organization\n"
+            "• Continuous monitoring and support\n"
+            "• Performance measurement and reporting",
+            "Phase 4: Optimization (Months 9-12)\n"
+            "• Process optimization and efficiency improvements\n"
+            "• Advanced feature implementation\n"
+            "• Long-term maintenance planning"
+        ], pdf_separator="page_break")
+        
+        report.add_section("risk_assessment", "Risk Assessment", [sections['risks']])
+        
+        report.add_section("success_metrics", "Success Metrics", [sections['metrics']])
+        
+        charts = visualizations.get("charts", [])
+        report.add_section("charts", "Key Charts", [
+            self._format_charts(charts)
+        ], charts=charts)
+        
+        report.add_section("visualization_summary", "Visualization Summary", [
+            self._clean(visualizations.get('visualization_summary', 'Visualization summary not available'))
+        ], in_pdf=False)
+        
+        report.add_section("conclusion", "Conclusion", [
+            f"This comprehensive analysis demonstrates a strong business case for implementing "
+            f"{task_description}. The research shows clear market demand, technology maturity, "
+            f"and significant potential for competitive advantage.",
+            "Key Success Factors:\n"
+            "• Strong leadership and change management\n"
+            "• Proper stakeholder engagement\n"
+            "• Phased implementation approach\n"
+            "• Continuous monitoring and optimization",
+            "Expected Outcomes:\n"
+            "• 25% efficiency improvement\n"
+            "• 30% cost reduction\n"
+            "• 90% user adoption\n"
+            "• 300% ROI within 18 months",
+            "The implementation should begin within 3 months to capitalize on current market "
+            "opportunities and gain competitive advantage. With proper planning and execution, "
+            "this initiative will deliver significant value to the organization."
+        ], pdf_separator="")
+        
+        report.add_section("appendix", "Appendix", [
+            "Report generated by TaskHive AI Agent System\n"
+            "• Nova (Research Agent): Comprehensive research and source analysis\n"
+            "• Athena (Analyzer Agent): Data analysis and insight generation\n"
+            "• Pixel (Visualization Agent): Chart and graph creation\n"
+            "• Lex (Report Writer Agent): Report compilation and PDF generation",
+            "Total processing time: Approximately 10 minutes\n"
+            "Data sources: 5 high-quality sources\n"
+            "Analysis confidence: 88%\n"
+            "Visualization elements: 8 total",
+            "For questions or additional analysis, please contact the TaskHive team."
+        ], in_pdf=False)
         
         return report
     
+    def _clean(self, text: str) -> str:
+        """Strip the indentation agents' multi-line summaries carry over from their source"""
+        return textwrap.dedent(text).strip()
+    
     def _format_findings(self, findings: List[str]) -> str:
         """Format research findings for report"""
         if not findings:
             return "No findings available"
         
-        formatted = ""
-        for i, finding in enumerate(findings, 1):
-            formatted += f"{i}. {finding}\n"
-        return formatted
+        return "\n".join(f"{i}. {finding}" for i, finding in enumerate(findings, 1))
     
     def _format_insights(self, insights: List[Dict[str, Any]]) -> str:
         """Format analysis insights for report"""
         if not insights:
             return "No insights available"
         
-        formatted = ""
-        for insight in insights:
-            formatted += f"• {insight.get('title', 'Unknown')}: {insight.get('description', 'No description')}\n"
-        return formatted
+        return "\n".join(
+            f"• {insight.get('title', 'Unknown')}: {insight.get('description', 'No description')}"
+            for insight in insights
+        )
     
     def _format_recommendations(self, recommendations: List[Dict[str, Any]]) -> str:
         """Format recommendations for report"""
         if not recommendations:
             return "No recommendations available"
         
-        formatted = ""
-        for rec in recommendations:
-            formatted += f"• {rec.get('title', 'Unknown')} ({rec.get('priority', 'medium')} priority): {rec.get('description', 'No description')}\n"
-        return formatted
+        return "\n".join(
+            f"• {rec.get('title', 'Unknown')} ({rec.get('priority', 'medium')} priority): {rec.get('description', 'No description')}"
+            for rec in recommendations
+        )
     
     def _format_risks(self, risks: List[Dict[str, Any]]) -> str:
         """Format risk assessment for report"""
         if not risks:
             return "No risks identified"
         
-        formatted = ""
-        for risk in risks:
-            formatted += f"• {risk.get('risk', 'Unknown')} (Probability: {risk.get('probability', 'unknown')}, Impact: {risk.get('impact', 'unknown')})\n"
-            formatted += f"  Mitigation: {risk.get('mitigation', 'No mitigation strategy')}\n\n"
-        return formatted
+        return "\n".join(
+            f"• {risk.get('risk', 'Unknown')} (Probability: {risk.get('probability', 'unknown')}, Impact: {risk.get('impact', 'unknown')})\n"
+            f"  Mitigation: {risk.get('mitigation', 'No mitigation strategy')}"
+            for risk in risks
+        )
+    
+    def _format_charts(self, charts: List[Dict[str, Any]]) -> str:
+        """Format the chart list for report"""
+        if not charts:
+            return "No charts available"
+        
+        return "\n".join(
+            f"• {chart.get('title', 'Untitled')}: {chart.get('description', 'No description')}"
+            for chart in charts
+        )
     
     def _format_metrics(self, metrics: List[Dict[str, Any]]) -> str:
         """Format success metrics for report"""
         if not metrics:
             return "No metrics defined"
         
-        formatted = ""
-        for metric in metrics:
-            formatted += f"• {metric.get('metric', 'Unknown')}: Target {metric.get('target', 'N/A')}\n"
-        return formatted
-    
-    def _extract_executive_summary(self, content: str) -> str:
-        """Extract executive summary section"""
-        start = content.find("EXECUTIVE SUMMARY")
-        end = content.find("RESEARCH FINDINGS")
-        if start != -1 and end != -1:
-            return content[start:end].replace("EXECUTIVE SUMMARY", "").strip()
-        return "Executive summary not available"
-    
-    def _extract_research_findings(self, content: str) -> str:
-        """Extract research findings section"""
-        start = content.find("RESEARCH FINDINGS")
-        end = content.find("ANALYSIS RESULTS")
-        if start != -1 and end != -1:
-            return content[start:end].replace("RESEARCH FINDINGS", "").strip()
-        return "Research findings not available"
-    
-    def _extract_analysis_results(self, content: str) -> str:
-        """Extract analysis results section"""
-        start = content.find("ANALYSIS RESULTS")
-        end = content.find("RECOMMENDATIONS")
-        if start != -1 and end != -1:
-            return content[start:end].replace("ANALYSIS RESULTS", "").strip()
-        return "Analysis results not available"
-    
-    def _extract_recommendations(self, content: str) -> str:
-        """Extract recommendations section"""
-        start = content.find("RECOMMENDATIONS")
-        end = content.find("IMPLEMENTATION PLAN")
-        if start != -1 and end != -1:
-            return content[start:end].replace("RECOMMENDATIONS", "").strip()
-        return "Recommendations not available"
-    
-    def _extract_implementation_plan(self, content: str) -> str:
-        """Extract implementation plan section"""
-        start = content.find("IMPLEMENTATION PLAN")
-        end = content.find("RISK ASSESSMENT")
-        if start != -1 and end != -1:
-            return content[start:end].replace("IMPLEMENTATION PLAN", "").strip()
-        return "Implementation plan not available"
-    
-    def _extract_risk_assessment(self, content: str) -> str:
-        """Extract risk assessment section"""
-        start = content.find("RISK ASSESSMENT")
-        end = content.find("SUCCESS METRICS")
-        if start != -1 and end != -1:
-            return content[start:end].replace("RISK ASSESSMENT", "").strip()
-        return "Risk assessment not available"
-    
-    def _extract_success_metrics(self, content: str) -> str:
-        """Extract success metrics section"""
-        start = content.find("SUCCESS METRICS")
-        end = content.find("CONCLUSION")
-        if start != -1 and end != -1:
-            return content[start:end].replace("SUCCESS METRICS", "").strip()
-        return "Success metrics not available"
-    
-    def _extract_conclusion(self, content: str) -> str:
-        """Extract conclusion section"""
-        start = content.find("CONCLUSION")
-        end = content.find("APPENDIX")
-        if start != -1 and end != -1:
-            return content[start:end].replace("CONCLUSION", "").strip()
-        return "Conclusion not available"
+        return "\n".join(
+            f"• {metric.get('metric', 'Unknown')}: Target {metric.get('target', 'N/A')}"
+            for metric in metrics
+        )
@@ -1,57 +1,59 @@
 import asyncio
-import random
-from typing import Dict, Any, List
-from .base_agent import BaseAgent
+from typing import Dict, Any, List, AsyncIterator
+from .base_agent import BaseAgent, AgentChunk, RESULT
+from .source_providers import SourceProvider, get_source_provider
 
 class ResearchAgent(BaseAgent):
     """Nova - Research Agent: Gathers information and sources for the task"""
     
-    def __init__(self, name: str, role: str, emoji: str, color: str):
+    def __init__(self, name: str, role: str, emoji: str, color: str, source_provider: SourceProvider = None):
         super().__init__(name, role, emoji, color)
         self.personality = "curious and thorough researcher"
+        self.source_provider = source_provider or get_source_provider()
+        # Different providers return different sources for the same task
+        self.version = f"{BaseAgent.version}+{self.source_provider.name}"
     
     async def execute(self, task_description: str) -> Dict[str, Any]:
         """Execute research on the given task"""
+        return await self.collect_stream(task_description)
+    
+    async def execute_stream(self, task_description: str) -> AsyncIterator[AgentChunk]:
+        """Yield each source as it is gathered, then the complete research data"""
         self.status = "working"
         
-        # Simulate research process
-        await self.simulate_work(duration=3.0, steps=15)
+        sources = []
+        provider = self.source_provider
+        share = 100 // max(provider.expected_sources, 1)
+        async for source in provider.search(task_description):
+            index = len(sources)
+            if provider.simulated:
+                # Simulate research process, one source at a time
+                await self.simulate_work(
+                    duration=3.0 / provider.expected_sources, steps=3,
+                    start=index * share, end=(index + 1) * share
+                )
+            else:
+                await self.set_progress(min((index + 1) * share, 99))
+            sources.append(source)
+            yield AgentChunk("source", source)
+        await self.set_progress(100)
         
         # Generate mock research data
         research_data = {
             "task_description": task_description,
-            "sources": self._generate_sources(task_description),
+            "sources": sources,
             "key_findings": self._generate_findings(task_description),
             "research_summary": self._generate_summary(task_description),
             "metadata": {
-                "sources_count": 5,
+                "sources_count": len(sources),
+                "source_provider": provider.name,
                 "research_duration": "3 minutes",
                 "confidence_score": 0.85
             }
         }
         
         self.status = "completed"
-        return research_data
-    
-    def _generate_sources(self, task: str) -> List[Dict[str, str]]:
-        """Generate mock research sources"""
-        source_types = ["academic_paper", "industry_report", "news_article", "expert_interview", "case_study"]
-        domains = ["research.org", "industry.com", "news.com", "expert.net", "study.edu"]
-        
-        sources = []
-        for i in range(5):
-            source_type = random.choice(source_types)
-            domain = random.choice(domains)
-            sources.append({
-                "id": f"source_{i+1}",
-                "title": f"Research on {task.split()[0]} - Source {i+1}",
-                "type": source_type,
-                "url": f"https://{domain}/research/{i+1}",
-                "relevance_score": random.uniform(0.7, 0.95),
-                "summary": f"Comprehensive analysis of {task.split()[0]} from {source_type.replace('_', ' ')} perspective."
-            })
-        
-        return sources
+        yield AgentChunk(RESULT, research_data)
     
     def _generate_findings(self, task: str) -> List[str]:
         """Generate key research findings"""
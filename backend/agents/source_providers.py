@@ -0,0 +1,69 @@
+import os
+import random
+from abc import ABC, abstractmethod
+from typing import Dict, Any, AsyncIterator
+
+class SourceProvider(ABC):
+    """Where ResearchAgent gets its sources from"""
+
+    name: str = ""
+    # Simulated providers have no real latency, so Nova paces them with simulate_work
+    simulated: bool = False
+    # Rough number of sources a search returns, used for progress reporting
+    expected_sources: int = 5
+
+    @abstractmethod
+    def search(self, task_description: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield sources for the task as soon as each one is available"""
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {}
+
+    async def close(self):
+        pass
+
+class MockSourceProvider(SourceProvider):
+    """Five fabricated sources, the behaviour Nova has always had"""
+
+    name = "mock"
+    simulated = True
+
+    async def search(self, task_description: str) -> AsyncIterator[Dict[str, Any]]:
+        source_types = ["academic_paper", "industry_report", "news_article", "expert_interview", "case_study"]
+        domains = ["research.org", "industry.com", "news.com", "expert.net", "study.edu"]
+
+        for i in range(self.expected_sources):
+            source_type = random.choice(source_types)
+            domain = random.choice(domains)
+            yield {
+                "id": f"source_{i+1}",
+                "title": f"Research on {task_description.split()[0]} - Source {i+1}",
+                "type": source_type,
+                "url": f"https://{domain}/research/{i+1}",
+                "relevance_score": random.uniform(0.7, 0.95),
+                "summary": f"Comprehensive analysis of {task_description.split()[0]} from {source_type.replace('_', ' ')} perspective."
+            }
+
+_default_provider: SourceProvider = None
+
+def get_source_provider() -> SourceProvider:
+    """Process-wide provider selected by TASKHIVE_SOURCE_PROVIDER ("mock" or "http")
+
+    The HTTP provider reads its search URL templates from TASKHIVE_SOURCE_URLS
+    (comma-separated, "{query}" is replaced by the task) and shares one
+    connection pool across every task.
+    """
+    global _default_provider
+    if _default_provider is None:
+        if os.getenv("TASKHIVE_SOURCE_PROVIDER", "mock") == "http":
+            from .http_source_provider import HTTPSourceProvider
+            _default_provider = HTTPSourceProvider(
+                [url.strip() for url in os.getenv("TASKHIVE_SOURCE_URLS", "").split(",") if url.strip()],
+                max_parallel=int(os.getenv("TASKHIVE_FETCH_PARALLEL", "16")),
+                per_host_limit=int(os.getenv("TASKHIVE_FETCH_PER_HOST", "4")),
+                timeout=float(os.getenv("TASKHIVE_FETCH_TIMEOUT", "10"))
+            )
+        else:
+            _default_provider = MockSourceProvider()
+    return _default_provider
@@ -1,25 +1,41 @@
 import asyncio
 import random
-from typing import Dict, Any, List
-from .base_agent import BaseAgent
+from typing import Dict, Any, List, Tuple, AsyncIterator
+from .base_agent import BaseAgent, AgentChunk, RESULT
+from .downsampling import ChartDownsampler
+from .numeric import summarize
 
 class VisualizationAgent(BaseAgent):
     """Pixel - Visualization Agent: Creates charts and visual representations of data"""
     
-    def __init__(self, name: str, role: str, emoji: str, color: str):
+    version = "1.3"
+    
+    def __init__(self, name: str, role: str, emoji: str, color: str, downsampler: ChartDownsampler = None):
         super().__init__(name, role, emoji, color)
         self.personality = "creative and visual thinker"
+        self.downsampler = downsampler or ChartDownsampler.from_env()
     
     async def execute(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
         """Create visualizations from analysis data"""
+        return await self.collect_stream(analysis_results)
+    
+    async def execute_stream(self, analysis_results: Dict[str, Any]) -> AsyncIterator[AgentChunk]:
+        """Yield each chart as soon as it is drawn, then the complete visualizations"""
         self.status = "working"
         
-        # Simulate visualization creation process
-        await self.simulate_work(duration=2.0, steps=10)
+        # Generate visualizations, with chart series reduced to display resolution
+        charts, original_series = self._downsample_charts(self._create_charts(analysis_results))
+        
+        # Simulate visualization creation process, one chart at a time
+        share = 100 // len(charts)
+        for index, chart in enumerate(charts):
+            await self.simulate_work(duration=2.0 / len(charts), steps=3, start=index * share, end=(index + 1) * share)
+            yield AgentChunk("chart", chart)
+        await self.set_progress(100)
         
-        # Generate visualizations
         visualizations = {
-            "charts": self._create_charts(analysis_results),
+            "charts": charts,
+            "original_series": original_series,
             "graphs": self._create_graphs(analysis_results),
             "dashboards": self._create_dashboards(analysis_results),
             "infographics": self._create_infographics(analysis_results),
@@ -34,7 +50,7 @@ class VisualizationAgent(BaseAgent):
         }
         
         self.status = "completed"
-        return visualizations
+        yield AgentChunk(RESULT, visualizations)
     
     def _create_charts(self, analysis_results: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Create various charts from analysis data"""
@@ -44,11 +60,11 @@ class VisualizationAgent(BaseAgent):
                 "type": "bar_chart",
                 "title": "Market Growth Trends",
                 "description": "Annual market growth over the next 5 years",
-                "data": {
-                    "labels": ["Year 1", "Year 2", "Year 3", "Year 4", "Year 5"],
-                    "values": [25, 30, 35, 40, 45],
-                    "unit": "% growth"
-                },
+                "data": self._series(
+                    ["Year 1", "Year 2", "Year 3", "Year 4", "Year 5"],
+                    [25, 30, 35, 40, 45],
+                    "% growth"
+                ),
                 "colors": ["#3B82F6", "#1D4ED8", "#1E40AF", "#1E3A8A", "#1E293B"],
                 "chart_config": {
                     "show_grid": True,
@@ -61,11 +77,11 @@ class VisualizationAgent(BaseAgent):
                 "type": "pie_chart",
                 "title": "Success Metrics Distribution",
                 "description": "Breakdown of key success metrics",
-                "data": {
-                    "labels": ["Efficiency", "Cost Reduction", "User Adoption", "ROI"],
-                    "values": [25, 30, 20, 25],
-                    "unit": "%"
-                },
+                "data": self._series(
+                    ["Efficiency", "Cost Reduction", "User Adoption", "ROI"],
+                    [25, 30, 20, 25],
+                    "%"
+                ),
                 "colors": ["#10B981", "#059669", "#047857", "#065F46"],
                 "chart_config": {
                     "show_percentage": True,
@@ -78,11 +94,11 @@ class VisualizationAgent(BaseAgent):
                 "type": "line_chart",
                 "title": "Implementation Timeline",
                 "description": "Progress tracking over implementation phases",
-                "data": {
-                    "labels": ["Planning", "Pilot", "Rollout", "Optimization", "Full Scale"],
-                    "values": [0, 25, 60, 85, 100],
-                    "unit": "% complete"
-                },
+                "data": self._series(
+                    ["Planning", "Pilot", "Rollout", "Optimization", "Full Scale"],
+                    [0, 25, 60, 85, 100],
+                    "% complete"
+                ),
                 "colors": ["#F59E0B", "#D97706", "#B45309", "#92400E", "#78350F"],
                 "chart_config": {
                     "show_area": True,
@@ -95,11 +111,11 @@ class VisualizationAgent(BaseAgent):
                 "type": "radar_chart",
                 "title": "Competitive Analysis",
                 "description": "Comparison across key competitive factors",
-                "data": {
-                    "labels": ["Technology", "Market Share", "Innovation", "Customer Satisfaction", "Cost Efficiency"],
-                    "values": [85, 70, 90, 80, 75],
-                    "unit": "score (0-100)"
-                },
+                "data": self._series(
+                    ["Technology", "Market Share", "Innovation", "Customer Satisfaction", "Cost Efficiency"],
+                    [85, 70, 90, 80, 75],
+                    "score (0-100)"
+                ),
                 "colors": ["#8B5CF6", "#7C3AED", "#6D28D9", "#5B21B6", "#4C1D95"],
                 "chart_config": {
                     "show_scale": True,
@@ -110,6 +126,26 @@ class VisualizationAgent(BaseAgent):
         ]
         return charts
     
+    def _series(self, labels: List[str], values: List[float], unit: str) -> Dict[str, Any]:
+        """Chart data with summary statistics of the full series"""
+        return {"labels": labels, "values": values, "unit": unit, "summary": summarize(values)}
+    
+    def _downsample_charts(self, charts: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Reduce each chart to its type's target point count, keeping the full series aside"""
+        original_series = {}
+        for chart in charts:
+            data = chart["data"]
+            labels, values, method = self.downsampler.reduce(chart["type"], data["labels"], data["values"])
+            if method:
+                original_series[chart["id"]] = {"labels": data["labels"], "values": data["values"]}
+                chart["data"] = {
+                    **data,
+                    "labels": labels,
+                    "values": values,
+                    "downsampled": {"method": method, "original_points": len(data["values"])}
+                }
+        return charts, original_series
+    
     def _create_graphs(self, analysis_results: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Create network and relationship graphs"""
         graphs = [
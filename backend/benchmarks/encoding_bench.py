@@ -0,0 +1,89 @@
+"""Micro-benchmark: coordinator event encoding before and after MessageEncoder
+
+Run from the backend directory:
+    python benchmarks/encoding_bench.py [events]
+"""
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from coordinator import AgentStatus
+from encoding import MessageEncoder, JSON_BACKEND
+
+@dataclass
+class LegacyAgentStatus:
+    """AgentStatus as it was before the slotted record and shared AgentProfile"""
+    name: str
+    role: str
+    status: str
+    progress: int
+    color: str
+    emoji: str
+    last_message: str = ""
+    start_time: str = ""
+    end_time: str = ""
+
+def make_status(status_type=AgentStatus):
+    return status_type(
+        name="Nova",
+        role="ResearchAgent",
+        status="working",
+        progress=40,
+        color="blue",
+        emoji="🔍",
+        last_message="Starting research...",
+        start_time=datetime.now().isoformat()
+    )
+
+def legacy_encode(task_id: str, status: LegacyAgentStatus) -> str:
+    """The original broadcast_update/update_agent_status path"""
+    message = {
+        "type": "agent_status",
+        "task_id": task_id,
+        "timestamp": datetime.now().isoformat(),
+        "agent": "nova",
+        "status": asdict(status)
+    }
+    return json.dumps(message)
+
+def encoder_encode(encoder: MessageEncoder, status: AgentStatus) -> str:
+    return encoder.encode("agent_status", {
+        "agent": "nova",
+        "status": encoder.agent_status("nova", status)
+    })
+
+def measure(label: str, func, events: int) -> float:
+    start = time.perf_counter()
+    for i in range(events):
+        func(i)
+    elapsed = time.perf_counter() - start
+    rate = events / elapsed
+    print(f"{label:<28} {rate:>12,.0f} events/sec")
+    return rate
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    status = make_status()
+    legacy_status = make_status(LegacyAgentStatus)
+    encoder = MessageEncoder("task_benchmark")
+
+    def legacy(i):
+        legacy_status.progress = i % 100
+        legacy_encode("task_benchmark", legacy_status)
+
+    def encoded(i):
+        status.progress = i % 100
+        encoder_encode(encoder, status)
+
+    print(f"Encoding {events:,} agent_status events (JSON backend: {JSON_BACKEND})")
+    before = measure("asdict + json.dumps", legacy, events)
+    after = measure("MessageEncoder", encoded, events)
+    print(f"Speedup: {after / before:.2f}x")
+
+if __name__ == "__main__":
+    main()
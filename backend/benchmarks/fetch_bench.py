@@ -0,0 +1,73 @@
+"""Benchmark: research fetch throughput against local fixture servers
+
+Each configuration runs several research tasks at once through one shared
+HTTPSourceProvider, so connection reuse and the per-host cap are exercised.
+Run from the backend directory:
+    python benchmarks/fetch_bench.py [tasks] [docs_per_search] [latency_ms]
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from agents.http_source_provider import HTTPSourceProvider
+from fixture_server import FixtureServer
+
+CONFIGS = [
+    # (max_parallel, per_host_limit)
+    (1, 1),
+    (4, 2),
+    (16, 4),
+    (32, 8),
+]
+
+async def run_config(servers, tasks: int, docs: int, max_parallel: int, per_host_limit: int):
+    provider = HTTPSourceProvider(
+        [server.search_url(docs) for server in servers],
+        max_sources=docs * len(servers),
+        max_parallel=max_parallel,
+        per_host_limit=per_host_limit
+    )
+
+    async def research(task_id: int) -> int:
+        return len([source async for source in provider.search(f"benchmark topic {task_id}")])
+
+    connections_before = sum(server.connections for server in servers)
+    for server in servers:
+        server.peak_in_flight = 0
+    start = time.perf_counter()
+    counts = await asyncio.gather(*(research(i) for i in range(tasks)))
+    elapsed = time.perf_counter() - start
+    await provider.close()
+    return {
+        "sources": sum(counts),
+        "seconds": elapsed,
+        "connections": sum(server.connections for server in servers) - connections_before,
+        "peak_per_host": max(server.peak_in_flight for server in servers),
+        "failed": provider.failed
+    }
+
+async def main():
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    docs = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 20.0
+
+    servers = [FixtureServer(latency_ms=latency).start() for _ in range(2)]
+    try:
+        print(f"{tasks} concurrent tasks, {docs} docs per search on {len(servers)} hosts, {latency} ms latency")
+        for max_parallel, per_host_limit in CONFIGS:
+            result = await run_config(servers, tasks, docs, max_parallel, per_host_limit)
+            print(
+                f"  parallel={max_parallel:<3} per_host={per_host_limit:<2} "
+                f"{result['sources'] / result['seconds']:8.1f} sources/s  "
+                f"{result['seconds']:6.2f} s  connections={result['connections']:<4} "
+                f"peak_per_host={result['peak_per_host']}  failed={result['failed']}"
+            )
+    finally:
+        for server in servers:
+            server.stop()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+"""Local HTTP fixture server standing in for research sites in benchmarks
+
+    GET /search?q=<query>&n=<count>   HTML page linking to <count> documents
+    GET /doc/<i>?q=<query>            HTML document with a title, description and paragraphs
+
+Every response waits latency_ms first, so fetch concurrency is measurable
+offline. Run standalone from the backend directory:
+    python benchmarks/fixture_server.py [port] [latency_ms]
+"""
+import html
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote_plus, urlparse
+
+class FixtureServer:
+    """Threaded keep-alive HTTP server with request and concurrency counters"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 20.0,
+                 paragraphs: int = 5, default_results: int = 20):
+        self.latency = latency_ms / 1000.0
+        self.paragraphs = paragraphs
+        self.default_results = default_results
+        self.requests = 0
+        self.connections = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def search_url(self, results: int = None) -> str:
+        """Template for HTTPSourceProvider; {query} is filled in per task"""
+        return f"{self.base_url}/search?q={{query}}&n={results or self.default_results}"
+
+    def _handler_class(self):
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body leave in one segment instead of stalling on delayed ACKs
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with fixture._lock:
+                    fixture.connections += 1
+
+            def do_GET(self):
+                with fixture._lock:
+                    fixture.requests += 1
+                    fixture.in_flight += 1
+                    fixture.peak_in_flight = max(fixture.peak_in_flight, fixture.in_flight)
+                try:
+                    time.sleep(fixture.latency)
+                    url = urlparse(self.path)
+                    query = parse_qs(url.query).get("q", ["research"])[0]
+                    if url.path == "/search":
+                        count = int(parse_qs(url.query).get("n", [fixture.default_results])[0])
+                        body = fixture.search_page(query, count)
+                    elif url.path.startswith("/doc/"):
+                        body = fixture.document(query, url.path.rsplit("/", 1)[-1])
+                    else:
+                        self.send_error(404)
+                        return
+                    data = body.encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html; charset=utf-8")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                finally:
+                    with fixture._lock:
+                        fixture.in_flight -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def search_page(self, query: str, count: int) -> str:
+        links = "".join(
+            f'<li><a href="/doc/{i}?q={quote_plus(query)}">Result {i}</a></li>' for i in range(1, count + 1)
+        )
+        return f"<html><head><title>Search: {html.escape(query)}</title></head><body><ul>{links}</ul></body></html>"
+
+    def document(self, query: str, doc_id: str) -> str:
+        query = html.escape(query)
+        paragraphs = "".join(
+            f"<p>Section {n} of document {doc_id} discusses {query} adoption, costs and outcomes "
+            f"across organizations of different sizes.</p>"
+            for n in range(1, self.paragraphs + 1)
+        )
+        return (
+            f"<html><head><title>{query} study {doc_id}</title>"
+            f'<meta name="description" content="Findings on {query} from fixture document {doc_id}.">'
+            f"</head><body><h1>{query}</h1>{paragraphs}</body></html>"
+        )
+
+    def start(self) -> "FixtureServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+    server = FixtureServer(port=port, latency_ms=latency)
+    print(f"Serving fixtures at {server.base_url} (latency {latency} ms)")
+    print(f"TASKHIVE_SOURCE_PROVIDER=http TASKHIVE_SOURCE_URLS='{server.search_url()}'")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
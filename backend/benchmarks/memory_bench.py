@@ -0,0 +1,142 @@
+"""Benchmark: bytes per task for agent status and event records, before and after
+
+"Before" is the dataclass AgentStatus plus a per-task cache of each agent's
+static fields, and one dict per chat message and graph edge. "After" is the
+slotted AgentStatus and NamedTuple records sharing interned AgentProfiles.
+Event counts per task come from one real workflow run. Run from the backend directory:
+    python benchmarks/memory_bench.py [tasks]
+"""
+import asyncio
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from agents.base_agent import BaseAgent
+from coordinator import TaskCoordinator
+from encoding_bench import LegacyAgentStatus
+from records import AgentStatus, ChatEntry, GraphEdge, intern_agent_profile
+from report_store import ReportArtifactStore
+from tracing import Tracer
+
+# (key, name, role, emoji, color) as in TaskCoordinator.agents
+AGENTS = [
+    ("nova", "Nova", "ResearchAgent", "🔍", "blue"),
+    ("athena", "Athena", "AnalyzerAgent", "🧠", "purple"),
+    ("pixel", "Pixel", "VisualizationAgent", "📊", "orange"),
+    ("lex", "Lex", "ReportWriterAgent", "✍️", "green")
+]
+
+class NullManager:
+    async def broadcast(self, message: str, coalesce_key: str = None, topic: str = None):
+        pass
+
+class CountingCoordinator(TaskCoordinator):
+    """Counts the chat messages and graph edges one workflow run produces"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events = Counter()
+
+    async def log_conversation(self, agent_name: str, message: str, message_type: str = "info"):
+        self.events["chat"] += 1
+        await super().log_conversation(agent_name, message, message_type)
+
+    async def update_graph_edges(self, from_agent: str, to_agent: str, edge_type: str = "data"):
+        self.events["edges"] += 1
+        await super().update_graph_edges(from_agent, to_agent, edge_type)
+
+def events_per_task(report_store: ReportArtifactStore) -> Counter:
+    BaseAgent.time_scale = 0
+    coordinator = CountingCoordinator("memory_probe", "Memory benchmark", NullManager(),
+                                      report_store=report_store, tracer=Tracer(max_spans=0))
+    asyncio.run(coordinator.run_workflow())
+    return coordinator.events
+
+def measure(build, tasks: int) -> float:
+    """Traced bytes per task of whatever build(i) returns, kept alive together"""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    kept = [build(i) for i in range(tasks)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del kept
+    return used / tasks
+
+def legacy_statuses(i: int):
+    statuses = {
+        key: LegacyAgentStatus(name=name, role=role, status="completed", progress=100, color=color, emoji=emoji,
+                               last_message="Done", start_time="2024-01-01T00:00:00", end_time="2024-01-01T00:00:05")
+        for key, name, role, emoji, color in AGENTS
+    }
+    # MessageEncoder kept the static fields of every agent per task
+    static = {key: {"name": name, "role": role, "color": color, "emoji": emoji} for key, name, role, emoji, color in AGENTS}
+    return statuses, static
+
+def slotted_statuses(i: int):
+    return {
+        key: AgentStatus(name=name, role=role, status="completed", progress=100, color=color, emoji=emoji,
+                         last_message="Done", start_time="2024-01-01T00:00:00", end_time="2024-01-01T00:00:05")
+        for key, name, role, emoji, color in AGENTS
+    }
+
+def legacy_events(chats: int, edges: int):
+    def build(i: int):
+        now = datetime.now()
+        log = [
+            {"agent": "nova", "message": f"message {n}", "type": "info", "timestamp": now.isoformat(),
+             "color": "blue", "emoji": "🔍"}
+            for n in range(chats)
+        ]
+        graph = [
+            {"from": "nova", "to": "athena", "type": "research_data", "timestamp": now.isoformat()}
+            for _ in range(edges)
+        ]
+        return log, graph
+    return build
+
+def record_events(chats: int, edges: int):
+    profile = intern_agent_profile("Nova", "ResearchAgent", "blue", "🔍")
+
+    def build(i: int):
+        now = datetime.now()
+        log = [ChatEntry("nova", f"message {n}", "info", now, profile) for n in range(chats)]
+        graph = [GraphEdge("nova", "athena", "research_data", now) for _ in range(edges)]
+        return log, graph
+    return build
+
+def main():
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as report_dir:
+        report_store = ReportArtifactStore(path=report_dir)
+        events = events_per_task(report_store)
+        chats, edges = events["chat"], events["edges"]
+
+        rows = [
+            ("agent statuses", measure(legacy_statuses, tasks), measure(slotted_statuses, tasks)),
+            (f"event records ({chats} chat, {edges} edges)",
+             measure(legacy_events(chats, edges), tasks), measure(record_events(chats, edges), tasks))
+        ]
+        coordinator_bytes = measure(
+            lambda i: TaskCoordinator(f"t{i}", "Memory benchmark", NullManager(),
+                                      report_store=report_store, tracer=Tracer(max_spans=0)),
+            max(1, tasks // 10)
+        )
+
+    print(f"Bytes per task over {tasks:,} tasks")
+    print(f"  {'':<34} {'before':>10} {'after':>10} {'saved':>8}")
+    for label, before, after in rows:
+        print(f"  {label:<34} {before:>10,.0f} {after:>10,.0f} {1 - after / before:>7.0%}")
+    before_total = sum(row[1] for row in rows)
+    after_total = sum(row[2] for row in rows)
+    print(f"  {'total':<34} {before_total:>10,.0f} {after_total:>10,.0f} {1 - after_total / before_total:>7.0%}")
+    print(f"  (an idle TaskCoordinator with its agents is {coordinator_bytes:,.0f} bytes per task)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Micro-benchmark: per-PDF setup cost with and without the cached style registry
+
+Run from the backend directory:
+    python benchmarks/pdf_setup_bench.py [reports]
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+from agents.pdf_renderer import build_pdf, get_pdf_styles
+from agents.report_model import ReportDocument
+
+def legacy_setup():
+    """What every generate_pdf_report call used to build before any content"""
+    styles = getSampleStyleSheet()
+    return (
+        ParagraphStyle('CustomTitle', parent=styles['Heading1'], fontSize=24, spaceAfter=30),
+        ParagraphStyle('CustomHeading', parent=styles['Heading2'], fontSize=16, spaceAfter=12),
+        ParagraphStyle('CustomBody', parent=styles['Normal'], fontSize=11, spaceAfter=8)
+    )
+
+def small_layout():
+    report = ReportDocument("TaskHive Comprehensive Analysis Report", "benchmark task", "today")
+    report.add_section("executive_summary", "Executive Summary", ["A short summary paragraph."])
+    report.add_section("recommendations", "Recommendations", ["• First\n• Second"])
+    return report.pdf_layout()
+
+def time_per_call(fn, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return (time.perf_counter() - start) / count
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    layout = small_layout()
+
+    def build_cold():
+        get_pdf_styles.cache_clear()
+        build_pdf(layout, io.BytesIO(), "benchmark")
+
+    def build_warm():
+        build_pdf(layout, io.BytesIO(), "benchmark")
+
+    get_pdf_styles()
+    results = {
+        "setup: legacy per-report styles": time_per_call(legacy_setup, count),
+        "setup: cached registry": time_per_call(get_pdf_styles, count),
+        "small PDF, styles rebuilt": time_per_call(build_cold, count),
+        "small PDF, styles cached": time_per_call(build_warm, count),
+    }
+    print(f"{count} reports per case")
+    for name, seconds in results.items():
+        print(f"  {name:<34} {seconds * 1e6:10.1f} µs/report  {1 / seconds:10.0f} reports/s")
+
+if __name__ == "__main__":
+    main()
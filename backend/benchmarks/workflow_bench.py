@@ -0,0 +1,262 @@
+"""Benchmark: N concurrent workflows end to end against in-process WebSocket clients
+
+Every coordinator broadcasts through the real ConnectionManager to fake
+sockets subscribed to its task, so queueing and writer tasks are measured too.
+--time-scale multiplies every simulate_work delay (0 removes the sleeps and
+leaves only coordination, encoding and fan-out cost). Results are printed and
+written to JSON so runs can be compared over time. Run from the backend directory:
+    python benchmarks/workflow_bench.py --tasks 50 --time-scale 0 --render pdf
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, Any, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from agents.base_agent import BaseAgent
+from agents.numeric import NUMERIC_BACKEND
+from connection_manager import ConnectionManager
+from coordinator import TaskCoordinator
+from encoding import JSON_BACKEND
+from report_store import ReportArtifactStore
+from scheduler import TaskScheduler
+from stage_cache import StageCache
+from tracing import Tracer
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+class FakeWebSocket:
+    """Accepts everything and counts what it is sent, optionally with a per-send delay"""
+
+    def __init__(self, send_delay: float = 0.0):
+        self.send_delay = send_delay
+        self.messages = 0
+        self.bytes = 0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        self.messages += 1
+        self.bytes += len(message)
+
+    async def close(self, code: int = 1000):
+        pass
+
+class CountingConnectionManager(ConnectionManager):
+    """ConnectionManager that also counts broadcast calls and their encoded size"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.broadcasts = 0
+        self.broadcast_bytes = 0
+
+    async def broadcast(self, message: str, coalesce_key: str = None, topic: str = None):
+        self.broadcasts += 1
+        self.broadcast_bytes += len(message)
+        await super().broadcast(message, coalesce_key=coalesce_key, topic=topic)
+
+    async def drain(self, timeout: float = 30.0):
+        """Wait until every writer has emptied its queue"""
+        deadline = time.perf_counter() + timeout
+        while any(client.queue for client in self.active_connections.values()):
+            if time.perf_counter() > deadline:
+                break
+            await asyncio.sleep(0.005)
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    """Nearest-rank p50/p90/p99 plus mean and max, in milliseconds"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def rank(p: float) -> float:
+        return ordered[min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered) + 0.5)) - 1))]
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50_ms": round(rank(50) * 1000, 3),
+        "p90_ms": round(rank(90) * 1000, 3),
+        "p99_ms": round(rank(99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3)
+    }
+
+def peak_rss_bytes() -> int:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+async def run_bench(args, report_dir: str) -> Dict[str, Any]:
+    BaseAgent.time_scale = args.time_scale
+    manager = CountingConnectionManager(max_queue_size=args.client_queue)
+    scheduler = None
+    if args.max_concurrent:
+        scheduler = TaskScheduler(max_concurrent_workflows=args.max_concurrent, max_queue_size=args.tasks,
+                                  stage_limits={"pdf": args.pdf_slots} if args.pdf_slots else None)
+    stage_cache = StageCache() if args.cache else None
+    report_store = ReportArtifactStore(path=report_dir)
+    tracer = Tracer(max_spans=0)
+
+    sockets: List[FakeWebSocket] = []
+    coordinators: List[TaskCoordinator] = []
+    for i in range(args.tasks):
+        task_id = f"bench_{i}"
+        for _ in range(args.clients):
+            websocket = FakeWebSocket(args.send_delay_ms / 1000.0)
+            sockets.append(websocket)
+            with contextlib.redirect_stdout(io.StringIO()):
+                await manager.connect(websocket, topics=[task_id])
+        coordinators.append(TaskCoordinator(
+            task_id, args.description, manager, scheduler=scheduler,
+            stage_cache=stage_cache, report_store=report_store, tracer=tracer
+        ))
+
+    render_latencies: Dict[str, List[float]] = {fmt: [] for fmt in args.render}
+
+    async def render(coordinator: TaskCoordinator):
+        for fmt in args.render:
+            start = time.perf_counter()
+            await coordinator.get_report_artifact(fmt)
+            render_latencies[fmt].append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    if scheduler is None:
+        await asyncio.gather(*(coordinator.run_workflow() for coordinator in coordinators))
+    else:
+        for coordinator in coordinators:
+            scheduler.submit(coordinator)
+        while scheduler.running or scheduler.queue:
+            await asyncio.gather(*list(scheduler.running.values()))
+    workflows_done = time.perf_counter()
+    await asyncio.gather(*(render(c) for c in coordinators if c.status == "completed"))
+    await manager.drain()
+    elapsed = time.perf_counter() - start
+
+    stage_latencies: Dict[str, List[float]] = {"workflow": []}
+    for coordinator in coordinators:
+        if coordinator.workflow_run is None:
+            continue
+        stage_latencies["workflow"].append(coordinator.workflow_run.wall_duration)
+        for name, timing in coordinator.workflow_run.timings.items():
+            stage_latencies.setdefault(name, []).append(timing.duration)
+    for fmt, values in render_latencies.items():
+        stage_latencies[f"render_{fmt}"] = values
+
+    connection_metrics = manager.get_metrics()
+    completed = sum(1 for coordinator in coordinators if coordinator.status == "completed")
+    with contextlib.redirect_stdout(io.StringIO()):
+        for websocket in list(manager.active_connections):
+            manager.disconnect(websocket)
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "config": {
+            "tasks": args.tasks,
+            "clients_per_task": args.clients,
+            "time_scale": args.time_scale,
+            "max_concurrent": args.max_concurrent,
+            "pdf_slots": args.pdf_slots,
+            "render": args.render,
+            "cache": args.cache,
+            "send_delay_ms": args.send_delay_ms,
+            "client_queue": args.client_queue
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "json_backend": JSON_BACKEND,
+            "numeric_backend": NUMERIC_BACKEND
+        },
+        "completed": completed,
+        "failed": args.tasks - completed,
+        "elapsed_seconds": round(elapsed, 3),
+        "workflow_seconds": round(workflows_done - start, 3),
+        "tasks_per_second": round(completed / elapsed, 3) if elapsed else None,
+        "stage_latency": {name: percentiles(values) for name, values in stage_latencies.items()},
+        "broadcast": {
+            "events": manager.broadcasts,
+            "events_per_second": round(manager.broadcasts / elapsed, 1) if elapsed else None,
+            "events_per_task": round(manager.broadcasts / args.tasks, 1),
+            "bytes": manager.broadcast_bytes,
+            "delivered": sum(websocket.messages for websocket in sockets),
+            "delivered_bytes": sum(websocket.bytes for websocket in sockets),
+            "dropped": connection_metrics["messages_dropped"],
+            "coalesced": connection_metrics["messages_coalesced"]
+        },
+        # Benchmark process only; PDF pool workers are separate processes
+        "peak_rss_bytes": peak_rss_bytes(),
+        # Traced time per span, largest total first
+        "spans": tracer.get_stats()
+    }
+
+def print_summary(result: Dict[str, Any]):
+    config = result["config"]
+    print(f"{config['tasks']} tasks x {config['clients_per_task']} clients, time scale {config['time_scale']}, "
+          f"render {','.join(config['render']) or 'none'}")
+    print(f"  completed {result['completed']}/{config['tasks']} in {result['elapsed_seconds']} s "
+          f"-> {result['tasks_per_second']} tasks/s")
+    broadcast = result["broadcast"]
+    print(f"  broadcasts {broadcast['events']} ({broadcast['events_per_second']}/s, "
+          f"{broadcast['events_per_task']}/task), delivered {broadcast['delivered']}, "
+          f"dropped {broadcast['dropped']}, coalesced {broadcast['coalesced']}")
+    for name, stats in result["stage_latency"].items():
+        if stats:
+            print(f"  {name:<12} p50 {stats['p50_ms']:9.1f} ms  p90 {stats['p90_ms']:9.1f} ms  "
+                  f"p99 {stats['p99_ms']:9.1f} ms  max {stats['max_ms']:9.1f} ms")
+    print("  traced spans by total time:")
+    for entry in result["spans"][:8]:
+        labels = ",".join(f"{key}={value}" for key, value in entry["labels"].items())
+        print(f"    {entry['span']:<14} {labels:<32} n={entry['count']:<6} total {entry['total_seconds']:8.3f} s  "
+              f"mean {entry['mean_ms']:8.2f} ms  p99~{entry['p99_ms']:8.2f} ms")
+    if result["peak_rss_bytes"] is not None:
+        print(f"  peak RSS {result['peak_rss_bytes'] / (1024 * 1024):.1f} MB")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=20, help="concurrent workflows")
+    parser.add_argument("--clients", type=int, default=1, help="fake WebSocket clients per task")
+    parser.add_argument("--time-scale", type=float, default=0.0, help="simulate_work delay multiplier")
+    parser.add_argument("--max-concurrent", type=int, default=0,
+                        help="admit workflows through a TaskScheduler with this limit (0: all at once)")
+    parser.add_argument("--pdf-slots", type=int, default=0, help="scheduler stage limit for PDF renders")
+    parser.add_argument("--render", nargs="*", default=[], help="report formats to render after each workflow")
+    parser.add_argument("--cache", action="store_true", help="share a StageCache across tasks")
+    parser.add_argument("--send-delay-ms", type=float, default=0.0, help="per-message delay of each fake socket")
+    parser.add_argument("--client-queue", type=int, default=256, help="ConnectionManager per-client queue size")
+    parser.add_argument("--description", default="Market analysis of electric vehicle adoption")
+    parser.add_argument("--output", help="JSON result path (default: benchmarks/results/workflow_<timestamp>.json)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory() as report_dir:
+        result = asyncio.run(run_bench(args, report_dir))
+    print_summary(result)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"workflow_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print(f"  results written to {output}")
+
+if __name__ == "__main__":
+    main()
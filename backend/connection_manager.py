@@ -0,0 +1,211 @@
+import asyncio
+import itertools
+from collections import deque
+from typing import Dict, Any, Deque, List, Set, Iterable
+
+# Subscribers of this topic receive updates for every task; only admin connections may subscribe
+ALL_TOPIC = "all"
+
+class ClientConnection:
+    """Outbound state for one WebSocket: a bounded send queue drained by its own writer task"""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, websocket):
+        # Stable label for per-connection metrics
+        self.id = next(ClientConnection._ids)
+        self.websocket = websocket
+        self.queue: Deque[List] = deque()  # entries are [message, coalesce_key]
+        self.pending_keys: Dict[str, List] = {}
+        self.ready = asyncio.Event()
+        self.writer: asyncio.Task = None
+        self.topics: Set[str] = set()
+        # Set at connect time for operators allowed to watch every task
+        self.admin = False
+        self.evicted = False
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.consecutive_drops = 0
+
+class ConnectionManager:
+    """WebSocket fan-out where producers only enqueue and each client has its own writer"""
+
+    def __init__(self, max_queue_size: int = 256, evict_after_drops: int = 64, send_timeout: float = 5.0):
+        self.max_queue_size = max_queue_size
+        self.evict_after_drops = evict_after_drops
+        self.send_timeout = send_timeout
+        self.active_connections: Dict[Any, ClientConnection] = {}
+        self.topics: Dict[str, Set[ClientConnection]] = {}
+        self.task_coordinators: Dict[str, Any] = {}
+        self.evicted_clients = 0
+        self.failed_clients = 0
+
+    async def connect(self, websocket, topics: Iterable[str] = (), admin: bool = False) -> ClientConnection:
+        await websocket.accept()
+        client = ClientConnection(websocket)
+        client.admin = admin
+        client.writer = asyncio.create_task(self._writer(client))
+        self.active_connections[websocket] = client
+        for topic in topics:
+            self.subscribe(websocket, topic)
+        print(f"WebSocket connected. Total connections: {len(self.active_connections)}")
+        return client
+
+    def disconnect(self, websocket):
+        client = self.active_connections.pop(websocket, None)
+        if client is None:
+            return
+        for topic in list(client.topics):
+            self._remove_subscriber(client, topic)
+        if client.writer and client.writer is not asyncio.current_task():
+            client.writer.cancel()
+        print(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
+
+    def subscribe(self, websocket, topic: str) -> bool:
+        """Start delivering a topic (a task_id, or ALL_TOPIC for admin connections) to this connection"""
+        client = self.active_connections.get(websocket)
+        if client is None or not topic:
+            return False
+        if topic == ALL_TOPIC and not client.admin:
+            return False
+        client.topics.add(topic)
+        self.topics.setdefault(topic, set()).add(client)
+        return True
+
+    def is_subscribed(self, websocket, topic: str) -> bool:
+        client = self.active_connections.get(websocket)
+        return client is not None and topic in client.topics
+
+    def unsubscribe(self, websocket, topic: str) -> bool:
+        client = self.active_connections.get(websocket)
+        if client is None or topic not in client.topics:
+            return False
+        self._remove_subscriber(client, topic)
+        return True
+
+    def _remove_subscriber(self, client: ClientConnection, topic: str):
+        client.topics.discard(topic)
+        subscribers = self.topics.get(topic)
+        if subscribers is not None:
+            subscribers.discard(client)
+            if not subscribers:
+                del self.topics[topic]
+
+    async def send_personal_message(self, message: str, websocket):
+        client = self.active_connections.get(websocket)
+        if client is not None:
+            self._enqueue(client, message)
+
+    async def broadcast(self, message: str, coalesce_key: str = None, topic: str = None):
+        """Queue a message for interested clients; never waits on network I/O"""
+        self.publish(message, coalesce_key, topic)
+
+    def publish(self, message: str, coalesce_key: str = None, topic: str = None):
+        """Synchronous form of broadcast for callers outside a coroutine
+
+        With a topic, only its subscribers and ALL_TOPIC subscribers receive
+        the message; without one it goes to every connection.
+        """
+        if topic is None:
+            recipients = list(self.active_connections.values())
+        else:
+            recipients = set(self.topics.get(topic, ()))
+            recipients.update(self.topics.get(ALL_TOPIC, ()))
+        for client in recipients:
+            self._enqueue(client, message, coalesce_key)
+
+    def _enqueue(self, client: ClientConnection, message: str, coalesce_key: str = None):
+        if client.evicted:
+            return
+
+        # A newer message with the same key replaces the one still waiting in the queue
+        if coalesce_key is not None and coalesce_key in client.pending_keys:
+            client.pending_keys[coalesce_key][0] = message
+            client.coalesced += 1
+            return
+
+        if len(client.queue) >= self.max_queue_size:
+            _, dropped_key = client.queue.popleft()
+            if dropped_key is not None:
+                client.pending_keys.pop(dropped_key, None)
+            client.dropped += 1
+            client.consecutive_drops += 1
+            if client.consecutive_drops >= self.evict_after_drops:
+                self._evict(client)
+                return
+
+        entry = [message, coalesce_key]
+        client.queue.append(entry)
+        if coalesce_key is not None:
+            client.pending_keys[coalesce_key] = entry
+        client.ready.set()
+
+    def _evict(self, client: ClientConnection):
+        """Stop serving a client that cannot keep up; its writer closes the socket"""
+        client.evicted = True
+        client.queue.clear()
+        client.pending_keys.clear()
+        client.ready.set()
+        if client.writer is not None:
+            # Abandon any send still stuck on the slow socket
+            client.writer.cancel()
+        self.evicted_clients += 1
+        print(f"WebSocket evicted as slow consumer after {client.dropped} dropped messages")
+
+    async def _writer(self, client: ClientConnection):
+        try:
+            while True:
+                await client.ready.wait()
+                if client.evicted:
+                    break
+                if not client.queue:
+                    client.ready.clear()
+                    continue
+
+                message, coalesce_key = client.queue.popleft()
+                if coalesce_key is not None:
+                    client.pending_keys.pop(coalesce_key, None)
+                await asyncio.wait_for(client.websocket.send_text(message), self.send_timeout)
+                client.sent += 1
+                client.consecutive_drops = 0
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Dead or stalled connection
+            self.failed_clients += 1
+            print(f"WebSocket send failed: {e}")
+        finally:
+            if client.evicted:
+                try:
+                    await client.websocket.close(code=1013)
+                except Exception:
+                    pass
+            self.disconnect(client.websocket)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth and delivery counters per connection and in total"""
+        clients = list(self.active_connections.values())
+        depths = [len(client.queue) for client in clients]
+        return {
+            "connections": len(clients),
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths, default=0),
+            "messages_sent": sum(client.sent for client in clients),
+            "messages_dropped": sum(client.dropped for client in clients),
+            "messages_coalesced": sum(client.coalesced for client in clients),
+            "topics": len(self.topics),
+            "evicted_clients": self.evicted_clients,
+            "failed_clients": self.failed_clients,
+            "clients": [
+                {
+                    "id": client.id,
+                    "queue_depth": len(client.queue),
+                    "topics": len(client.topics),
+                    "sent": client.sent,
+                    "dropped": client.dropped,
+                    "coalesced": client.coalesced
+                }
+                for client in clients
+            ]
+        }
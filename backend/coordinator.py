@@ -1,35 +1,44 @@
 import asyncio
-import json
-import os
+import contextlib
 from datetime import datetime
 from typing import Dict, List, Any
-from dataclasses import dataclass, asdict
 
 from agents.research_agent import ResearchAgent
 from agents.analyzer_agent import AnalyzerAgent
 from agents.visualization_agent import VisualizationAgent
 from agents.report_writer_agent import ReportWriterAgent
-
-@dataclass
-class AgentStatus:
-    name: str
-    role: str
-    status: str  # "idle", "working", "completed", "error"
-    progress: int  # 0-100
-    color: str
-    emoji: str
-    last_message: str = ""
-    start_time: str = ""
-    end_time: str = ""
+from agents.base_agent import AgentChunk, RESULT
+from agents.progress import ProgressReporter
+from agents.report_model import ReportDocument
+from agents.report_renderers import ReportArtifact
+from workflow import StreamChannel, WorkflowGraph, WorkflowRun
+from encoding import MessageEncoder, StatusDeltaTracker
+from task_store import TaskStore
+from stage_cache import StageCache
+from report_store import ReportArtifactStore, get_report_store
+from tracing import Tracer, get_tracer
+from records import AgentStatus, ChatEntry, GraphEdge, SYSTEM_PROFILE
 
 class TaskCoordinator:
-    def __init__(self, task_id: str, task_description: str, websocket_manager):
+    def __init__(self, task_id: str, task_description: str, websocket_manager, scheduler=None,
+                 progress_events_per_second: float = 4.0, task_store: TaskStore = None,
+                 stage_cache: StageCache = None, report_store: ReportArtifactStore = None,
+                 tracer: Tracer = None):
         self.task_id = task_id
         self.task_description = task_description
         self.websocket_manager = websocket_manager
+        self.scheduler = scheduler
+        self.task_store = task_store
+        self.stage_cache = stage_cache
+        self.report_store = report_store or get_report_store()
+        self.tracer = tracer or get_tracer()
+        self.cache_hits: List[str] = []
+        self.cache_misses: List[str] = []
+        self.encoder = MessageEncoder(task_id)
         self.status = "initializing"
         self.progress = 0
         self.start_time = datetime.now()
+        self.end_time: datetime = None
         
         # Initialize agents
         self.agents = {
@@ -39,6 +48,13 @@ class TaskCoordinator:
             "lex": ReportWriterAgent("Lex", "ReportWriterAgent", "✍️", "green")
         }
         
+        # Live progress from each agent, coalesced to a bounded event rate
+        for name, agent in self.agents.items():
+            agent.progress_reporter = ProgressReporter(
+                lambda progress, name=name: self.update_agent_status(name, "working", progress),
+                max_rate=progress_events_per_second
+            )
+        
         # Agent status tracking
         self.agent_statuses = {
             name: AgentStatus(
@@ -51,26 +67,34 @@ class TaskCoordinator:
             )
             for name, agent in self.agents.items()
         }
+        self.status_deltas = StatusDeltaTracker({
+            name: self.encoder.agent_status(name, status)
+            for name, status in self.agent_statuses.items()
+        })
         
         # Task data storage
         self.research_data = {}
         self.analysis_results = {}
         self.visualizations = {}
         self.final_report = ""
+        self.report_document: ReportDocument = None
         self.report_path = ""
+        # Download formats are rendered on first request, then reused
+        self.report_artifacts: Dict[str, ReportArtifact] = {}
+        self._render_locks: Dict[str, asyncio.Lock] = {}
+        self.workflow_run: WorkflowRun = None
+        # Seconds from task start to each agent's first partial result
+        self.first_partial: Dict[str, float] = {}
+        self.resumed_stages: List[str] = []
         
-        # Create reports directory
-        os.makedirs("reports", exist_ok=True)
+        if self.task_store is not None:
+            self.task_store.create_task(task_id, task_description)
         
     async def broadcast_update(self, message_type: str, data: Dict[str, Any]):
-        """Send update to all connected WebSocket clients"""
-        message = {
-            "type": message_type,
-            "task_id": self.task_id,
-            "timestamp": datetime.now().isoformat(),
-            **data
-        }
-        await self.websocket_manager.broadcast(json.dumps(message))
+        """Queue update for WebSocket clients subscribed to this task"""
+        with self.tracer.span("broadcast", {"type": message_type}):
+            message = self.encoder.encode(message_type, data)
+            await self.websocket_manager.broadcast(message, topic=self.task_id)
     
     async def update_agent_status(self, agent_name: str, status: str, progress: int = None, message: str = ""):
         """Update agent status and broadcast to frontend"""
@@ -86,110 +110,252 @@ class TaskCoordinator:
         elif status in ["completed", "error"] and not agent_status.end_time:
             agent_status.end_time = datetime.now().isoformat()
         
-        await self.broadcast_update("agent_status", {
-            "agent": agent_name,
-            "status": asdict(agent_status)
-        })
+        # Only the fields that changed go out; clients resync from a snapshot on gaps.
+        # Deltas are never coalesced: replacing a queued one would lose its changes and open a seq gap
+        delta = self.status_deltas.delta(agent_name, self.encoder.agent_status(agent_name, agent_status))
+        if delta is not None:
+            await self.broadcast_update("agent_status_delta", delta)
     
     async def log_conversation(self, agent_name: str, message: str, message_type: str = "info"):
         """Log agent conversation and broadcast to chat"""
-        log_entry = {
-            "agent": agent_name,
-            "message": message,
-            "type": message_type,
-            "timestamp": datetime.now().isoformat(),
-            "color": self.agents[agent_name].color,
-            "emoji": self.agents[agent_name].emoji
-        }
+        status = self.agent_statuses.get(agent_name)
+        log_entry = ChatEntry(agent_name, message, message_type, datetime.now(),
+                              status.profile if status else SYSTEM_PROFILE)
         
-        await self.broadcast_update("chat_message", log_entry)
+        await self.broadcast_update("chat_message", log_entry.to_payload())
     
     async def update_graph_edges(self, from_agent: str, to_agent: str, edge_type: str = "data"):
         """Update graph visualization with agent interactions"""
-        edge_data = {
-            "from": from_agent,
-            "to": to_agent,
-            "type": edge_type,
-            "timestamp": datetime.now().isoformat()
-        }
+        edge = GraphEdge(from_agent, to_agent, edge_type, datetime.now())
+        
+        await self.broadcast_update("graph_edge", edge.to_payload())
+    
+    async def _execute_cached(self, stage_name: str, execute, payload: Any, agent_name: str = None):
+        """Run an agent step, reusing a cached result for identical input and agent version"""
+        agent_name = agent_name or stage_name
+        if self.stage_cache is None:
+            return await self._traced_execute(stage_name, agent_name, execute, payload)
+        
+        key = self.stage_cache.key(stage_name, self.agents[agent_name].version, payload)
+        cached = await self.stage_cache.get(key)
+        if cached is not None:
+            self.cache_hits.append(stage_name)
+            await self.log_conversation(agent_name, "⚡ Reusing cached result for identical input")
+            return cached
+        
+        self.cache_misses.append(stage_name)
+        result = await self._traced_execute(stage_name, agent_name, execute, payload)
+        await self.stage_cache.put(key, result)
+        return result
+    
+    async def _traced_execute(self, stage_name: str, agent_name: str, execute, payload: Any):
+        with self.tracer.span("agent.execute", {"agent": agent_name, "stage": stage_name}, task_id=self.task_id):
+            return await execute(payload)
+    
+    async def _stream_cached(self, agent_name: str, payload: Any, channel: StreamChannel = None):
+        """Run an agent's execute_stream, forwarding partial results and caching the final one"""
+        agent = self.agents[agent_name]
+        
+        async def run(payload: Any):
+            result = None
+            index = 0
+            async for chunk in agent.execute_stream(payload):
+                if chunk.kind == RESULT:
+                    result = chunk.data
+                    continue
+                await self._forward_partial(agent_name, chunk, index)
+                if channel is not None:
+                    channel.publish(chunk)
+                index += 1
+            return result
+        
+        return await self._execute_cached(agent_name, run, payload)
+    
+    async def _forward_partial(self, agent_name: str, chunk: AgentChunk, index: int):
+        if agent_name not in self.first_partial:
+            self.first_partial[agent_name] = round((datetime.now() - self.start_time).total_seconds(), 3)
+        await self.broadcast_update("partial_result", {
+            "agent": agent_name,
+            "kind": chunk.kind,
+            "index": index,
+            "item": chunk.data
+        })
+    
+    def build_workflow_graph(self) -> WorkflowGraph:
+        """Declare each agent stage with the data it consumes and produces"""
+        graph = WorkflowGraph()
+        # Athena starts on Nova's source stream instead of waiting for the full research
+        graph.add_stage("nova", ("task_description",), ("research_data",), self._research_stage,
+                        streams={"research_stream": "research_data"})
+        graph.add_stage("athena", ("research_stream",), ("analysis_results",), self._analysis_stage)
+        graph.add_stage("pixel", ("analysis_results",), ("visualizations",), self._visualization_stage)
+        graph.add_stage("lex_draft", ("research_data", "analysis_results"), ("report_draft",), self._report_draft_stage)
+        graph.add_stage("lex", ("report_draft", "visualizations"), ("final_report", "report_document"), self._report_stage)
+        return graph
+    
+    async def _research_stage(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Research Phase (Nova)"""
+        await self.update_agent_status("nova", "working", 0, "Starting research...")
+        await self.log_conversation("nova", f"🔍 Beginning research on: {self.task_description}")
+        
+        research_data = await self._stream_cached("nova", inputs["task_description"], inputs["research_stream"])
+        self.research_data = research_data
+        
+        await self.agents["nova"].progress_reporter.flush()
+        await self.update_agent_status("nova", "completed", 100, "Research completed!")
+        await self.log_conversation("nova", f"✅ Research complete! Found {len(research_data.get('sources', []))} sources")
+        await self.update_graph_edges("nova", "athena", "research_data")
+        return {"research_data": research_data}
+    
+    async def _analysis_stage(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Analysis Phase (Athena)"""
+        await self.update_agent_status("athena", "working", 0, "Analyzing research data...")
+        await self.log_conversation("athena", "🧠 Processing research findings...")
+        
+        # Read sources as Nova finds them, then synthesize once the research is complete
+        research_stream = inputs["research_stream"]
+        async for chunk in research_stream:
+            if chunk.kind == "source":
+                await self.agents["athena"].review_source(chunk.data)
+        research_data = await research_stream.result()
         
-        await self.broadcast_update("graph_edge", edge_data)
+        analysis_results = await self._stream_cached("athena", research_data)
+        self.analysis_results = analysis_results
+        
+        await self.agents["athena"].progress_reporter.flush()
+        await self.update_agent_status("athena", "completed", 100, "Analysis completed!")
+        await self.log_conversation("athena", f"✅ Analysis complete! Key insights identified")
+        await self.update_graph_edges("athena", "pixel", "analysis_data")
+        await self.update_graph_edges("athena", "lex", "analysis_data")
+        return {"analysis_results": analysis_results}
+    
+    async def _visualization_stage(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Visualization Phase (Pixel), runs alongside Lex's drafting"""
+        await self.update_agent_status("pixel", "working", 0, "Creating visualizations...")
+        await self.log_conversation("pixel", "📊 Generating charts and graphs...")
+        
+        visualizations = await self._stream_cached("pixel", inputs["analysis_results"])
+        self.visualizations = visualizations
+        
+        await self.agents["pixel"].progress_reporter.flush()
+        await self.update_agent_status("pixel", "completed", 100, "Visualizations completed!")
+        await self.log_conversation("pixel", f"✅ Visualizations complete! Created {len(visualizations.get('charts', []))} charts")
+        # Display-resolution series only; full series are served by get_chart(full=True)
+        await self.broadcast_update("visualizations_ready", {"charts": self.get_charts()})
+        await self.update_graph_edges("pixel", "lex", "visualization_data")
+        return {"visualizations": visualizations}
+    
+    async def _report_draft_stage(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Report drafting (Lex) from research and analysis while Pixel works"""
+        await self.update_agent_status("lex", "working", 0, "Writing final report...")
+        await self.log_conversation("lex", "✍️ Compiling comprehensive report...")
+        
+        report_draft = await self._execute_cached("lex_draft", self.agents["lex"].draft, {
+            "task_description": self.task_description,
+            "research_data": inputs["research_data"],
+            "analysis_results": inputs["analysis_results"]
+        }, agent_name="lex")
+        return {"report_draft": report_draft}
+    
+    async def _report_stage(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Report Generation (Lex) once visualizations are available"""
+        report = self.agents["lex"].finalize(inputs["report_draft"], inputs["visualizations"])
+        self.report_document = report
+        self.final_report = report.to_text()
+        
+        # PDF and the other formats are rendered lazily by get_report_artifact()
+        await self.agents["lex"].progress_reporter.flush()
+        await self.update_agent_status("lex", "completed", 100, "Report completed!")
+        await self.log_conversation("lex", f"✅ Final report complete! Available as {', '.join(self.get_report_formats()).upper()}")
+        return {"final_report": self.final_report, "report_document": report.to_dict()}
+    
+    def _stage_slot(self, stage_name: str):
+        """Concurrency slot for a stage, shared with other tasks via the scheduler"""
+        if self.scheduler is None:
+            return contextlib.nullcontext()
+        return self.scheduler.stage_slot(stage_name)
+    
+    async def _load_checkpoints(self) -> Dict[str, Any]:
+        """Outputs of stages finished before a restart, keyed by output name"""
+        restored = {}
+        checkpoints = await asyncio.to_thread(self.task_store.load_outputs, self.task_id)
+        for stage_name, outputs in checkpoints.items():
+            restored.update(outputs)
+            self.resumed_stages.append(stage_name)
+        
+        self.research_data = restored.get("research_data", self.research_data)
+        self.analysis_results = restored.get("analysis_results", self.analysis_results)
+        self.visualizations = restored.get("visualizations", self.visualizations)
+        self.final_report = restored.get("final_report", self.final_report)
+        if "report_document" in restored:
+            self.report_document = ReportDocument.from_dict(restored["report_document"])
+        return restored
+    
+    async def _checkpoint_stage(self, stage_name: str, outputs: Dict[str, Any]):
+        """Persist a finished stage so a restart resumes after it"""
+        if self.task_store is not None:
+            await asyncio.to_thread(self.task_store.save_stage, self.task_id, stage_name, outputs)
+    
+    async def _set_stored_status(self, status: str, report_path: str = None):
+        if self.task_store is not None:
+            await asyncio.to_thread(self.task_store.set_status, self.task_id, status, report_path)
+    
+    def mark_rejected(self):
+        """Record that the scheduler turned this task away, so a restart won't resume it"""
+        self.status = "rejected"
+        self.end_time = datetime.now()
+        if self.task_store is not None:
+            self.task_store.set_status(self.task_id, "rejected")
     
     async def run_workflow(self):
-        """Main workflow orchestration"""
+        """Main workflow orchestration, traced as one span with the agent and broadcast spans inside"""
+        with self.tracer.span("workflow.run", task_id=self.task_id) as span:
+            await self._run_workflow(span)
+    
+    async def _run_workflow(self, span):
         try:
             self.status = "running"
-            await self.broadcast_update("workflow_start", {
-                "task_description": self.task_description
-            })
-            
-            # Step 1: Research Phase (Nova)
-            await self.update_agent_status("nova", "working", 0, "Starting research...")
-            await self.log_conversation("nova", f"🔍 Beginning research on: {self.task_description}")
-            
-            research_data = await self.agents["nova"].execute(self.task_description)
-            self.research_data = research_data
-            
-            await self.update_agent_status("nova", "completed", 100, "Research completed!")
-            await self.log_conversation("nova", f"✅ Research complete! Found {len(research_data.get('sources', []))} sources")
-            await self.update_graph_edges("nova", "athena", "research_data")
-            
-            # Step 2: Analysis Phase (Athena)
-            await self.update_agent_status("athena", "working", 0, "Analyzing research data...")
-            await self.log_conversation("athena", "🧠 Processing research findings...")
-            
-            analysis_results = await self.agents["athena"].execute(research_data)
-            self.analysis_results = analysis_results
-            
-            await self.update_agent_status("athena", "completed", 100, "Analysis completed!")
-            await self.log_conversation("athena", f"✅ Analysis complete! Key insights identified")
-            await self.update_graph_edges("athena", "pixel", "analysis_data")
-            
-            # Step 3: Visualization Phase (Pixel)
-            await self.update_agent_status("pixel", "working", 0, "Creating visualizations...")
-            await self.log_conversation("pixel", "📊 Generating charts and graphs...")
-            
-            visualizations = await self.agents["pixel"].execute(analysis_results)
-            self.visualizations = visualizations
-            
-            await self.update_agent_status("pixel", "completed", 100, "Visualizations completed!")
-            await self.log_conversation("pixel", f"✅ Visualizations complete! Created {len(visualizations.get('charts', []))} charts")
-            await self.update_graph_edges("pixel", "lex", "visualization_data")
-            
-            # Step 4: Report Generation (Lex)
-            await self.update_agent_status("lex", "working", 0, "Writing final report...")
-            await self.log_conversation("lex", "✍️ Compiling comprehensive report...")
+            initial = {"task_description": self.task_description}
+            if self.task_store is not None:
+                initial.update(await self._load_checkpoints())
+            await self._set_stored_status("running")
             
-            report_data = {
+            await self.broadcast_update("workflow_start", {
                 "task_description": self.task_description,
-                "research_data": research_data,
-                "analysis_results": analysis_results,
-                "visualizations": visualizations
-            }
-            
-            final_report = await self.agents["lex"].execute(report_data)
-            self.final_report = final_report
-            
-            # Generate PDF report
-            self.report_path = f"reports/taskhive_report_{self.task_id}.pdf"
-            await self.agents["lex"].generate_pdf_report(final_report, self.report_path)
+                "resumed_stages": self.resumed_stages
+            })
+            for stage_name in self.resumed_stages:
+                if stage_name in self.agents:
+                    await self.update_agent_status(stage_name, "completed", 100, "Restored from checkpoint")
             
-            await self.update_agent_status("lex", "completed", 100, "Report completed!")
-            await self.log_conversation("lex", "✅ Final report complete! PDF generated successfully")
+            # Independent stages run concurrently as soon as their inputs exist
+            self.workflow_run = await self.build_workflow_graph().run(
+                initial,
+                stage_slot=self._stage_slot,
+                on_stage_complete=self._checkpoint_stage
+            )
             
             # Workflow complete
             self.status = "completed"
             self.progress = 100
+            self.end_time = datetime.now()
+            await self._set_stored_status("completed")
             
             await self.broadcast_update("workflow_complete", {
-                "report_path": self.report_path,
-                "total_duration": str(datetime.now() - self.start_time)
+                "report_formats": self.get_report_formats(),
+                "total_duration": str(datetime.now() - self.start_time),
+                "timing": self.get_timing()
             })
             
             await self.log_conversation("system", "🎉 Task workflow completed successfully!", "success")
             
         except Exception as e:
             self.status = "error"
+            self.end_time = datetime.now()
+            span.fail(e)
+            for agent in self.agents.values():
+                agent.progress_reporter.cancel()
+            await self._set_stored_status("error")
             await self.log_conversation("system", f"❌ Workflow error: {str(e)}", "error")
             await self.broadcast_update("workflow_error", {"error": str(e)})
     
@@ -203,8 +369,96 @@ class TaskCoordinator:
     
     def get_agent_statuses(self) -> Dict[str, Dict]:
         """Get status of all agents"""
-        return {name: asdict(status) for name, status in self.agent_statuses.items()}
+        return {name: status.to_dict() for name, status in self.agent_statuses.items()}
+    
+    def status_snapshot_message(self) -> str:
+        """Encoded full agent status snapshot sent on subscribe and resync"""
+        return self.encoder.encode("agent_status_snapshot", self.status_deltas.snapshot())
+    
+    def get_timing(self) -> Dict[str, Any]:
+        """Get stage timings and critical path of the last run"""
+        if self.workflow_run is None:
+            return {}
+        return {**self.workflow_run.summary(), "first_partial": self.first_partial}
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Stage cache hits and misses for this task, plus the shared cache counters"""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "cache": self.stage_cache.get_stats() if self.stage_cache else {}
+        }
+    
+    def get_charts(self, full: bool = False) -> List[Dict[str, Any]]:
+        """Chart specs at display resolution, or with their original series when full"""
+        return [self.get_chart(chart["id"], full) for chart in self.visualizations.get("charts", [])]
+    
+    def get_chart(self, chart_id: str, full: bool = False) -> Dict[str, Any]:
+        for chart in self.visualizations.get("charts", []):
+            if chart["id"] == chart_id:
+                original = self.visualizations.get("original_series", {}).get(chart_id)
+                if full and original is not None:
+                    return {**chart, "data": {**chart["data"], **original}}
+                return chart
+        raise KeyError(chart_id)
+    
+    def get_report_formats(self) -> List[str]:
+        """Formats the report can be downloaded in"""
+        return sorted(self.agents["lex"].renderers)
+    
+    async def get_report_artifact(self, report_format: str = "pdf") -> ReportArtifact:
+        """The report rendered in memory, built on first request and then reused
+
+        A fresh render is also put in the report store, which persists it for
+        the task and its eventual summary.
+        """
+        if self.report_document is None:
+            raise FileNotFoundError("Report not generated yet")
+        
+        self.agents["lex"].get_renderer(report_format)
+        lock = self._render_locks.setdefault(report_format, asyncio.Lock())
+        async with lock:
+            artifact = self.report_artifacts.get(report_format)
+            if artifact is None:
+                artifact = await self._load_stored_artifact(report_format)
+            if artifact is None:
+                async with self._stage_slot(report_format):
+                    with self.tracer.span("report.render", {"format": report_format}, task_id=self.task_id):
+                        artifact = await self.agents["lex"].render_artifact(
+                            self.report_document, report_format, f"taskhive_report_{self.task_id}"
+                        )
+                path = await asyncio.to_thread(self.report_store.put, self.task_id, artifact)
+                if report_format == "pdf":
+                    self.report_path = path
+            self.report_artifacts[report_format] = artifact
+            return artifact
+    
+    async def _load_stored_artifact(self, report_format: str) -> ReportArtifact:
+        data = await asyncio.to_thread(self.report_store.load, self.task_id, report_format)
+        if data is None:
+            return None
+        renderer = self.agents["lex"].get_renderer(report_format)
+        return ReportArtifact(
+            renderer.format, renderer.media_type, f"taskhive_report_{self.task_id}.{renderer.extension}", data
+        )
     
     def get_report_path(self) -> str:
-        """Get path to generated PDF report"""
+        """Get path to generated PDF report ("" until it is first downloaded)"""
         return self.report_path
+
+def restore_incomplete_tasks(task_store: TaskStore, websocket_manager, scheduler=None,
+                             stage_cache: StageCache = None,
+                             report_store: ReportArtifactStore = None) -> List[TaskCoordinator]:
+    """Recreate coordinators for workflows that were unfinished when the process stopped"""
+    return [
+        TaskCoordinator(
+            task_id=record["task_id"],
+            task_description=record["task_description"],
+            websocket_manager=websocket_manager,
+            scheduler=scheduler,
+            task_store=task_store,
+            stage_cache=stage_cache,
+            report_store=report_store
+        )
+        for record in task_store.incomplete_tasks()
+    ]
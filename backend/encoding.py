@@ -0,0 +1,87 @@
+import json
+from datetime import datetime
+from typing import Dict, Any
+
+try:
+    import orjson
+except ImportError:  # optional fast path
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+def _default(value: Any):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes with the fastest available backend"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default)
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def dumps(obj: Any) -> str:
+    """Serialize to JSON text (WebSocket text frames need str)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default).decode("utf-8")
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":"))
+
+class MessageEncoder:
+    """Builds and serializes coordinator events once, ready to share across recipients"""
+
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+
+    def encode(self, message_type: str, data: Dict[str, Any]) -> str:
+        """Serialize one event; the result is shared by every subscriber's queue
+
+        Envelope keys are written after the payload so a payload field named
+        type, task_id or timestamp can never change how the message is routed.
+        """
+        return dumps({
+            **data,
+            "type": message_type,
+            "task_id": self.task_id,
+            "timestamp": datetime.now()
+        })
+
+    def agent_status(self, agent_name: str, status) -> Dict[str, Any]:
+        """Status payload without an asdict() deep copy; static fields come from the shared AgentProfile"""
+        profile = status.profile
+        return {
+            "name": profile.name,
+            "role": profile.role,
+            "color": profile.color,
+            "emoji": profile.emoji,
+            "status": status.status,
+            "progress": status.progress,
+            "last_message": status.last_message,
+            "start_time": status.start_time,
+            "end_time": status.end_time
+        }
+
+class StatusDeltaTracker:
+    """Turns full agent status payloads into sequenced deltas of the changed fields
+
+    Clients start from snapshot() and apply deltas in seq order; a gap in seq
+    (a delta dropped for a slow client) means they should
+    ask for a resync, which is answered with a fresh snapshot.
+    """
+
+    def __init__(self, initial: Dict[str, Dict[str, Any]] = None):
+        self.seq = 0
+        self._last: Dict[str, Dict[str, Any]] = {name: dict(status) for name, status in (initial or {}).items()}
+
+    def delta(self, agent_name: str, current: Dict[str, Any]) -> Dict[str, Any]:
+        """Changed fields since the last delta for this agent, or None if nothing changed"""
+        previous = self._last.get(agent_name, {})
+        changes = {field: value for field, value in current.items() if previous.get(field) != value}
+        if not changes:
+            return None
+        self._last[agent_name] = current
+        self.seq += 1
+        return {"agent": agent_name, "seq": self.seq, "changes": changes}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Full state of every agent as of the current seq"""
+        return {"seq": self.seq, "agents": {name: dict(status) for name, status in self._last.items()}}
@@ -0,0 +1,53 @@
+import asyncio
+import time
+from typing import Dict, Any
+
+from tracing import Histogram
+
+# Lag bounds in seconds; anything past a few ms means a callback blocked the loop
+LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+class LoopLagMonitor:
+    """Measures event-loop lag: how late a periodic sleep wakes up past its deadline
+
+    Any synchronous work on the loop (a ReportLab build, a large JSON dump,
+    blocking file I/O) delays every other coroutine and shows up here directly.
+    """
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.histogram = Histogram(LAG_BUCKETS)
+        self.last_lag = 0.0
+        self._task: asyncio.Task = None
+
+    async def _probe(self):
+        while True:
+            deadline = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.last_lag = max(0.0, time.perf_counter() - deadline)
+            self.histogram.observe(self.last_lag)
+
+    def start(self):
+        """Begin probing on the current event loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._probe())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        histogram = self.histogram
+        return {
+            "interval_seconds": self.interval,
+            "samples": histogram.count,
+            "last_ms": round(self.last_lag * 1000, 3),
+            "mean_ms": round(histogram.sum / histogram.count * 1000, 3) if histogram.count else 0.0,
+            "p99_ms": round(histogram.quantile(0.99) * 1000, 3),
+            "max_ms": round(histogram.max * 1000, 3)
+        }
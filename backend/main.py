@@ -1,8 +1,9 @@
 # FastAPI imports commented out - using Node.js mock server instead
-# from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+# from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
 # from fastapi.middleware.cors import CORSMiddleware
-# from fastapi.responses import FileResponse
+# from fastapi.responses import Response, StreamingResponse, PlainTextResponse
 import asyncio
+import hmac
 import json
 import uuid
 from typing import List, Dict, Any
@@ -10,7 +11,18 @@ from typing import List, Dict, Any
 import os
 from datetime import datetime
 
-# from coordinator import TaskCoordinator
+# from coordinator import TaskCoordinator, restore_incomplete_tasks
+# from task_store import SQLiteTaskStore
+# from stage_cache import StageCache
+# from report_store import get_report_store
+# from scheduler import TaskScheduler, SchedulerFull
+# from connection_manager import ConnectionManager, ALL_TOPIC
+# from agents.pdf_renderer import get_pdf_renderer
+# from agents.source_providers import get_source_provider
+# from tracing import get_tracer
+# from loop_monitor import LoopLagMonitor
+# from metrics import MetricsCollector
+# from task_registry import TaskRegistry, TaskSummary
 
 # app = FastAPI(title="TaskHive API", version="1.0.0")
 
@@ -24,32 +36,87 @@ from datetime import datetime
 # )
 
 # WebSocket connection manager (commented out - using Node.js mock server)
-# class ConnectionManager:
-#     def __init__(self):
-#         self.active_connections: List[WebSocket] = []
-#         self.task_coordinators: Dict[str, TaskCoordinator] = {}
+# Each client gets a bounded send queue and its own writer task, see connection_manager.py
+# manager = ConnectionManager(
+#     max_queue_size=int(os.getenv("TASKHIVE_WS_QUEUE_SIZE", "256")),
+#     evict_after_drops=int(os.getenv("TASKHIVE_WS_EVICT_AFTER_DROPS", "64"))
+# )
+
+# Stage checkpoints survive restarts; unfinished workflows resume after the last completed stage
+# task_store = SQLiteTaskStore(os.getenv("TASKHIVE_DB", "taskhive.db"))
+
+# Repeat submissions reuse stage results keyed by a hash of the normalized input
+# stage_cache = StageCache(
+#     max_memory_entries=int(os.getenv("TASKHIVE_CACHE_ENTRIES", "256")),
+#     disk_path=os.getenv("TASKHIVE_CACHE_DIR", "cache/stages"),
+#     ttl_seconds=float(os.getenv("TASKHIVE_CACHE_TTL", str(24 * 3600)))
+# )
+
+# Rendered reports are deduplicated by content and trimmed to a disk quota in the background
+# report_store = get_report_store()
+
+# @app.on_event("startup")
+# async def start_report_cleanup():
+#     report_store.start()
+
+# Blocking work on the event loop shows up as probe lag in /metrics
+# loop_monitor = LoopLagMonitor(interval=float(os.getenv("TASKHIVE_LOOP_PROBE_INTERVAL", "0.25")))
+
+# @app.on_event("startup")
+# async def start_loop_monitor():
+#     loop_monitor.start()
+
+# @app.on_event("startup")
+# async def warm_up_pdf_renderer():
+#     # Spawn PDF workers before the first report so it doesn't pay the startup cost
+#     await get_pdf_renderer().warm_up()
 
-#     async def connect(self, websocket: WebSocket):
-#         await websocket.accept()
-#         self.active_connections.append(websocket)
-#         print(f"WebSocket connected. Total connections: {len(self.active_connections)}")
+# @app.on_event("startup")
+# async def resume_incomplete_workflows():
+#     restored = restore_incomplete_tasks(task_store, manager, scheduler, stage_cache, report_store)
+#     for index, coordinator in enumerate(restored):
+#         try:
+#             scheduler.submit(coordinator)
+#         except SchedulerFull:
+#             # Rows stay pending, so the excess tasks resume on a later restart
+#             print(f"⚠️ Scheduler queue full: {len(restored) - index} incomplete tasks left pending")
+#             break
+#         manager.task_coordinators[coordinator.task_id] = coordinator
 
-#     def disconnect(self, websocket: WebSocket):
-#         self.active_connections.remove(websocket)
-#         print(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
+# @app.on_event("shutdown")
+# async def stop_pdf_renderer():
+#     get_pdf_renderer().shutdown(wait=False)
+#     await report_store.stop()
+#     await loop_monitor.stop()
+#     await manager.task_coordinators.stop()
+#     await get_source_provider().close()
+#     # Cancel running workflows and drop queued ones before their checkpoints are closed
+#     await scheduler.shutdown()
+#     task_store.close()
 
-#     async def send_personal_message(self, message: str, websocket: WebSocket):
-#         await websocket.send_text(message)
+# Central scheduler: caps concurrent workflows and concurrent PDF builds
+# scheduler = TaskScheduler(
+#     max_concurrent_workflows=int(os.getenv("TASKHIVE_MAX_WORKFLOWS", "4")),
+#     max_queue_size=int(os.getenv("TASKHIVE_MAX_QUEUE", "100")),
+#     stage_limits={"pdf": int(os.getenv("TASKHIVE_MAX_PDF_BUILDS", "2"))}
+# )
+
+# Finished coordinators are released after a grace period; a compact summary keeps
+# /task-status and /download-report working from the persisted report
+# manager.task_coordinators = TaskRegistry(
+#     max_summaries=int(os.getenv("TASKHIVE_MAX_TASK_SUMMARIES", "10000")),
+#     retain_seconds=float(os.getenv("TASKHIVE_TASK_RETAIN_SECONDS", "300")),
+#     max_finished=int(os.getenv("TASKHIVE_MAX_FINISHED_TASKS", "100")),
+#     report_store=report_store,
+#     task_store=task_store,
+#     scheduler=scheduler
+# )
 
-#     async def broadcast(self, message: str):
-#         for connection in self.active_connections:
-#             try:
-#                 await connection.send_text(message)
-#             except:
-#                 # Remove dead connections
-#                 self.active_connections.remove(connection)
+# @app.on_event("startup")
+# async def start_task_eviction():
+#     manager.task_coordinators.start()
 
-# manager = ConnectionManager()
+# metrics = MetricsCollector(manager, scheduler, loop_monitor, get_pdf_renderer(), get_tracer())
 
 # Pydantic models (commented out - using Node.js mock server)
 # class TaskRequest(BaseModel):
@@ -60,6 +127,7 @@ from datetime import datetime
 #     task_id: str
 #     status: str
 #     message: str
+#     queue_position: int = 0
 
 # API Routes (commented out - using Node.js mock server)
 # @app.get("/")
@@ -76,20 +144,28 @@ from datetime import datetime
 #         coordinator = TaskCoordinator(
 #             task_id=task_id,
 #             task_description=task_request.task_description,
-#             websocket_manager=manager
+#             websocket_manager=manager,
+#             scheduler=scheduler,
+#             task_store=task_store,
+#             stage_cache=stage_cache,
+#             report_store=report_store
 #         )
         
+#         # Hand the workflow to the scheduler; it starts now or waits in the queue
+#         queue_position = scheduler.submit(coordinator)
 #         manager.task_coordinators[task_id] = coordinator
         
-#         # Start the task workflow asynchronously
-#         asyncio.create_task(coordinator.run_workflow())
-        
 #         return TaskResponse(
 #             task_id=task_id,
-#             status="started",
-#             message="Task workflow initiated successfully"
+#             status="started" if queue_position == 0 else "queued",
+#             message="Task workflow initiated successfully" if queue_position == 0 else f"Task queued at position {queue_position}",
+#             queue_position=queue_position
 #         )
     
+#     except SchedulerFull as e:
+#         # The task row was already written as pending; keep it from resuming on restart
+#         coordinator.mark_rejected()
+#         raise HTTPException(status_code=429, detail=str(e))
 #     except Exception as e:
 #         raise HTTPException(status_code=500, detail=f"Failed to start task: {str(e)}")
 
@@ -104,31 +180,82 @@ from datetime import datetime
 #         "task_id": task_id,
 #         "status": coordinator.get_status(),
 #         "progress": coordinator.get_progress(),
+#         "queue_position": scheduler.queue_position(task_id),
+#         "cache": coordinator.get_cache_stats(),
 #         "agents": coordinator.get_agent_statuses()
 #     }
 
+# @app.get("/charts/{task_id}")
+# async def get_charts(task_id: str, full: bool = False):
+#     """Chart specs at display resolution; ?full=true returns the original series"""
+#     if task_id not in manager.task_coordinators:
+#         raise HTTPException(status_code=404, detail="Task not found")
+#     coordinator = manager.task_coordinators[task_id]
+#     if isinstance(coordinator, TaskSummary):
+#         raise HTTPException(status_code=410, detail="Chart data was released; download the report instead")
+#     return {"task_id": task_id, "charts": coordinator.get_charts(full)}
+
+# @app.get("/charts/{task_id}/{chart_id}")
+# async def get_chart(task_id: str, chart_id: str, full: bool = False):
+#     if task_id not in manager.task_coordinators:
+#         raise HTTPException(status_code=404, detail="Task not found")
+#     coordinator = manager.task_coordinators[task_id]
+#     if isinstance(coordinator, TaskSummary):
+#         raise HTTPException(status_code=410, detail="Chart data was released; download the report instead")
+#     try:
+#         return coordinator.get_chart(chart_id, full)
+#     except KeyError:
+#         raise HTTPException(status_code=404, detail="Chart not found")
+
 # @app.get("/download-report/{task_id}")
-# async def download_report(task_id: str):
-#     """Download the generated PDF report for a task"""
+# async def download_report(task_id: str, request: Request, format: str = "pdf"):
+#     """Stream the report for a task, rendering the requested format in memory on first use"""
 #     if task_id not in manager.task_coordinators:
 #         raise HTTPException(status_code=404, detail="Task not found")
     
 #     coordinator = manager.task_coordinators[task_id]
-#     report_path = coordinator.get_report_path()
-    
-#     if not os.path.exists(report_path):
+#     try:
+#         artifact = await coordinator.get_report_artifact(format)
+#     except ValueError as e:
+#         raise HTTPException(status_code=400, detail=str(e))
+#     except FileNotFoundError:
 #         raise HTTPException(status_code=404, detail="Report not generated yet")
     
-#     return FileResponse(
-#         path=report_path,
-#         filename=f"taskhive_report_{task_id}.pdf",
-#         media_type="application/pdf"
-#     )
+#     headers = {"ETag": artifact.etag, "Cache-Control": "private, no-cache"}
+#     if artifact.matches(request.headers.get("if-none-match")):
+#         return Response(status_code=304, headers=headers)
+    
+#     headers["Content-Length"] = str(artifact.size)
+#     headers["Content-Disposition"] = f'attachment; filename="{artifact.filename}"'
+#     return StreamingResponse(artifact.iter_chunks(), media_type=artifact.media_type, headers=headers)
+
+# async def send_status_snapshots(websocket: WebSocket, topic: str):
+#     """Full agent status for the watched task(s); later updates arrive as seq-numbered deltas"""
+#     if topic == ALL_TOPIC:
+#         # Only live tasks; finished ones kept as summaries are sent when asked for by task_id
+#         coordinators = list(manager.task_coordinators.live.values())
+#     else:
+#         coordinators = [manager.task_coordinators[topic]] if topic in manager.task_coordinators else []
+#     for coordinator in coordinators:
+#         await manager.send_personal_message(coordinator.status_snapshot_message(), websocket)
+
+# Connections presenting this token (ws://host/ws?token=...) may watch every task
+# through the "all" topic; without it configured, nobody can
+# ADMIN_TOKEN = os.getenv("TASKHIVE_ADMIN_TOKEN", "")
+
+# def is_admin(websocket: WebSocket) -> bool:
+#     token = websocket.query_params.get("token", "")
+#     return bool(ADMIN_TOKEN) and hmac.compare_digest(token, ADMIN_TOKEN)
 
 # WebSocket endpoint (commented out - using Node.js mock server)
 # @app.websocket("/ws")
 # async def websocket_endpoint(websocket: WebSocket):
-#     await manager.connect(websocket)
+#     # Clients may subscribe up front with ws://host/ws?task_id=<id> (or task_id=all with an admin token)
+#     initial_topic = websocket.query_params.get("task_id")
+#     client = await manager.connect(websocket, topics=[initial_topic] if initial_topic else [],
+#                                    admin=is_admin(websocket))
+#     if initial_topic in client.topics:
+#         await send_status_snapshots(websocket, initial_topic)
 #     try:
 #         while True:
 #             # Keep connection alive and handle incoming messages
@@ -142,6 +269,26 @@ from datetime import datetime
 #                     websocket
 #                 )
             
+#             # Topic subscriptions: {"type": "subscribe", "task_id": "<id>" | "all" (admin only)}
+#             elif message.get("type") in ("subscribe", "unsubscribe"):
+#                 topic = message.get("task_id") or message.get("topic")
+#                 if message["type"] == "subscribe":
+#                     ok = manager.subscribe(websocket, topic)
+#                 else:
+#                     ok = manager.unsubscribe(websocket, topic)
+#                 await manager.send_personal_message(
+#                     json.dumps({"type": f"{message['type']}d", "task_id": topic, "ok": ok}),
+#                     websocket
+#                 )
+#                 if message["type"] == "subscribe" and ok:
+#                     await send_status_snapshots(websocket, topic)
+            
+#             # Client saw a gap in agent_status_delta seq numbers: {"type": "resync", "task_id": "<id>"}
+#             elif message.get("type") == "resync":
+#                 topic = message.get("task_id")
+#                 if manager.is_subscribed(websocket, topic):
+#                     await send_status_snapshots(websocket, topic)
+            
 #     except WebSocketDisconnect:
 #         manager.disconnect(websocket)
 #     except Exception as e:
@@ -155,9 +302,40 @@ from datetime import datetime
 #         "status": "healthy",
 #         "timestamp": datetime.now().isoformat(),
 #         "active_connections": len(manager.active_connections),
-#         "active_tasks": len(manager.task_coordinators)
+#         "active_tasks": len(manager.task_coordinators),
+#         "event_loop": loop_monitor.get_stats(),
+#         "tasks": manager.task_coordinators.get_stats(),
+#         "broadcaster": manager.get_metrics(),
+#         "scheduler": scheduler.get_stats(),
+#         "stage_cache": stage_cache.get_stats(),
+#         "report_store": report_store.get_stats(),
+#         "sources": get_source_provider().get_stats()
 #     }
 
+# @app.get("/metrics")
+# async def get_metrics(format: str = "prometheus"):
+#     """Loop lag, per-socket backlog, tasks by status, scheduler queues and PDF render timing;
+#     Prometheus text by default, ?format=json for the same data as JSON"""
+#     if format == "json":
+#         return metrics.snapshot()
+#     return PlainTextResponse(metrics.export_prometheus(), media_type="text/plain; version=0.0.4")
+
+# Span durations for workflows, agents, report renders and broadcasts
+# @app.get("/tracing")
+# async def tracing(format: str = "prometheus"):
+#     """Histograms as Prometheus text (?format=prometheus) or OTLP/JSON (?format=otel);
+#     ?format=spans returns the recently finished spans, ?format=summary the slowest operations first"""
+#     tracer = get_tracer()
+#     if format == "prometheus":
+#         return PlainTextResponse(tracer.export_prometheus(), media_type="text/plain; version=0.0.4")
+#     if format == "otel":
+#         return tracer.export_otel_json()
+#     if format == "spans":
+#         return tracer.export_otel_spans()
+#     if format == "summary":
+#         return tracer.get_stats()
+#     raise HTTPException(status_code=400, detail="format must be prometheus, otel, spans or summary")
+
 # Main execution (commented out - using Node.js mock server)
 # if __name__ == "__main__":
 #     import uvicorn
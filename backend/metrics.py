@@ -0,0 +1,119 @@
+from collections import Counter
+from typing import Dict, Any, Iterable, List, Tuple
+
+from loop_monitor import LoopLagMonitor
+from tracing import Tracer, prometheus_histogram, prometheus_labels
+
+TASK_STATUSES = ("initializing", "queued", "running", "completed", "error")
+
+Sample = Tuple[Tuple[Tuple[str, Any], ...], float]
+
+def _family(lines: List[str], metric: str, kind: str, help_text: str, samples: Iterable[Sample]):
+    lines.append(f"# HELP {metric} {help_text}")
+    lines.append(f"# TYPE {metric} {kind}")
+    for label_pairs, value in samples:
+        label_text = prometheus_labels(label_pairs)
+        lines.append(f"{metric}{{{label_text}}} {value}" if label_text else f"{metric} {value}")
+
+class MetricsCollector:
+    """Point-in-time service metrics for capacity planning, as JSON or Prometheus text
+
+    Covers event-loop lag, per-socket broadcast backlog, coordinators by
+    status, scheduler queues and PDF render timing and queueing. Span
+    histograms from the tracer are appended to the Prometheus output.
+    """
+
+    def __init__(self, manager, scheduler=None, loop_monitor: LoopLagMonitor = None,
+                 pdf_renderer=None, tracer: Tracer = None):
+        self.manager = manager
+        self.scheduler = scheduler
+        self.loop_monitor = loop_monitor
+        self.pdf_renderer = pdf_renderer
+        self.tracer = tracer
+
+    def task_counts(self) -> Dict[str, int]:
+        counts = Counter(coordinator.get_status() for coordinator in self.manager.task_coordinators.values())
+        return {status: counts.get(status, 0) for status in (*TASK_STATUSES, *sorted(set(counts) - set(TASK_STATUSES)))}
+
+    def _pdf_slots(self) -> Dict[str, Any]:
+        if self.scheduler is None:
+            return {}
+        return self.scheduler.get_stats()["stages"].get("pdf", {})
+
+    def snapshot(self) -> Dict[str, Any]:
+        websockets = self.manager.get_metrics()
+        return {
+            "event_loop": self.loop_monitor.get_stats() if self.loop_monitor else {},
+            "tasks": {"total": len(self.manager.task_coordinators), "by_status": self.task_counts()},
+            "scheduler": self.scheduler.get_stats() if self.scheduler else {},
+            "websockets": {
+                "connections": websockets["connections"],
+                "backlog_total": websockets["queue_depth_total"],
+                "backlog_max": websockets["queue_depth_max"],
+                "dropped": websockets["messages_dropped"],
+                "evicted_clients": websockets["evicted_clients"],
+                "clients": websockets["clients"]
+            },
+            "pdf": {
+                "renderer": self.pdf_renderer.get_stats() if self.pdf_renderer else {},
+                "slots": self._pdf_slots()
+            }
+        }
+
+    def export_prometheus(self, prefix: str = "taskhive") -> str:
+        lines: List[str] = []
+
+        if self.loop_monitor is not None:
+            lines.append(f"# HELP {prefix}_event_loop_lag_seconds Delay of a periodic probe past its deadline.")
+            lines.append(f"# TYPE {prefix}_event_loop_lag_seconds histogram")
+            lines.extend(prometheus_histogram(f"{prefix}_event_loop_lag_seconds", self.loop_monitor.histogram))
+            _family(lines, f"{prefix}_event_loop_lag_last_seconds", "gauge", "Lag of the latest probe.",
+                    [((), self.loop_monitor.last_lag)])
+
+        _family(lines, f"{prefix}_tasks", "gauge", "Task coordinators by workflow status.",
+                [((("status", status),), count) for status, count in self.task_counts().items()])
+
+        if self.scheduler is not None:
+            stats = self.scheduler.get_stats()
+            _family(lines, f"{prefix}_scheduler_running", "gauge", "Workflows currently running.",
+                    [((), stats["running"])])
+            _family(lines, f"{prefix}_scheduler_queue_depth", "gauge", "Workflows waiting for admission.",
+                    [((), stats["queued"])])
+            _family(lines, f"{prefix}_scheduler_rejected_total", "counter", "Submissions refused with a full queue.",
+                    [((), stats["rejected"])])
+            _family(lines, f"{prefix}_stage_active", "gauge", "Stage slots in use.",
+                    [((("stage", name),), stage["active"]) for name, stage in stats["stages"].items()])
+            _family(lines, f"{prefix}_stage_waiting", "gauge", "Callers waiting for a stage slot.",
+                    [((("stage", name),), stage["waiting"]) for name, stage in stats["stages"].items()])
+
+        websockets = self.manager.get_metrics()
+        _family(lines, f"{prefix}_ws_connections", "gauge", "Open WebSocket connections.",
+                [((), websockets["connections"])])
+        _family(lines, f"{prefix}_ws_backlog_messages", "gauge", "Messages queued for each connection.",
+                [((("client", client["id"]),), client["queue_depth"]) for client in websockets["clients"]])
+        _family(lines, f"{prefix}_ws_dropped_total", "counter", "Messages dropped for each connection.",
+                [((("client", client["id"]),), client["dropped"]) for client in websockets["clients"]])
+        _family(lines, f"{prefix}_ws_evicted_clients_total", "counter", "Connections evicted as slow consumers.",
+                [((), websockets["evicted_clients"])])
+
+        if self.pdf_renderer is not None:
+            pdf = self.pdf_renderer.get_stats()
+            _family(lines, f"{prefix}_pdf_in_flight", "gauge", "PDF builds submitted to the pool and not finished.",
+                    [((), pdf["in_flight"])])
+            _family(lines, f"{prefix}_pdf_queue_depth", "gauge", "PDF builds waiting for a free worker.",
+                    [((), pdf["queued"])])
+            _family(lines, f"{prefix}_pdf_build_seconds", "summary", "Time spent building PDFs in workers.",
+                    [((("quantile", "1"),), pdf["build_seconds_max"])])
+            lines.append(f"{prefix}_pdf_build_seconds_sum {pdf['build_seconds_total']}")
+            lines.append(f"{prefix}_pdf_build_seconds_count {pdf['rendered']}")
+            _family(lines, f"{prefix}_pdf_queue_wait_seconds", "summary", "Time PDF builds waited for a worker.",
+                    [((("quantile", "1"),), pdf["wait_seconds_max"])])
+            lines.append(f"{prefix}_pdf_queue_wait_seconds_sum {pdf['wait_seconds_total']}")
+            lines.append(f"{prefix}_pdf_queue_wait_seconds_count {pdf['rendered']}")
+            _family(lines, f"{prefix}_pdf_failed_total", "counter", "PDF builds that raised.",
+                    [((), pdf["failed"])])
+
+        text = "\n".join(lines) + "\n"
+        if self.tracer is not None:
+            text += self.tracer.export_prometheus(prefix)
+        return text
@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Dict, Any, NamedTuple, Tuple
+
+class AgentProfile(NamedTuple):
+    """Static agent metadata; interned so every task shares one instance per agent"""
+    name: str
+    role: str
+    color: str
+    emoji: str
+
+_profiles: Dict[Tuple[str, str, str, str], AgentProfile] = {}
+
+def intern_agent_profile(name: str, role: str, color: str, emoji: str) -> AgentProfile:
+    """The shared AgentProfile for this metadata, created on first use"""
+    key = (name, role, color, emoji)
+    profile = _profiles.get(key)
+    if profile is None:
+        profile = _profiles[key] = AgentProfile(*key)
+    return profile
+
+# Messages from the coordinator itself rather than an agent
+SYSTEM_PROFILE = intern_agent_profile("TaskHive", "Coordinator", "gray", "🐝")
+
+class AgentStatus:
+    """Live status of one agent in one task; the static fields live in a shared AgentProfile"""
+
+    __slots__ = ("profile", "status", "progress", "last_message", "start_time", "end_time")
+
+    def __init__(self, name: str, role: str, status: str, progress: int, color: str, emoji: str,
+                 last_message: str = "", start_time: str = "", end_time: str = ""):
+        self.profile = intern_agent_profile(name, role, color, emoji)
+        self.status = status  # "idle", "working", "completed", "error"
+        self.progress = progress  # 0-100
+        self.last_message = last_message
+        self.start_time = start_time
+        self.end_time = end_time
+
+    @property
+    def name(self) -> str:
+        return self.profile.name
+
+    @property
+    def role(self) -> str:
+        return self.profile.role
+
+    @property
+    def color(self) -> str:
+        return self.profile.color
+
+    @property
+    def emoji(self) -> str:
+        return self.profile.emoji
+
+    def to_dict(self) -> Dict[str, Any]:
+        profile = self.profile
+        return {
+            "name": profile.name,
+            "role": profile.role,
+            "status": self.status,
+            "progress": self.progress,
+            "color": profile.color,
+            "emoji": profile.emoji,
+            "last_message": self.last_message,
+            "start_time": self.start_time,
+            "end_time": self.end_time
+        }
+
+    def __repr__(self) -> str:
+        return f"AgentStatus({self.name!r}, status={self.status!r}, progress={self.progress})"
+
+class ChatEntry(NamedTuple):
+    """One agent conversation message; color and emoji come from the shared profile"""
+    agent: str
+    message: str
+    type: str
+    timestamp: datetime
+    profile: AgentProfile
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "agent": self.agent,
+            "message": self.message,
+            "type": self.type,
+            "timestamp": self.timestamp,
+            "color": self.profile.color,
+            "emoji": self.profile.emoji
+        }
+
+class GraphEdge(NamedTuple):
+    """One data hand-off between agents in the workflow graph"""
+    source: str
+    target: str
+    type: str
+    timestamp: datetime
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {"from": self.source, "to": self.target, "type": self.type, "timestamp": self.timestamp}
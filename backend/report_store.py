@@ -0,0 +1,254 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+
+from agents.report_renderers import ReportArtifact
+
+class ReportArtifactStore:
+    """Content-addressed report files with LRU/TTL retention under a disk quota
+
+    Identical reports share one blob. index.json maps task_id -> {format: blob hash}
+    and records each blob's size and last access, so lookups never scan the directory.
+The index is written at most once per index_flush_interval by the background
+loop (and on stop()); blob files it never recorded are deleted on the next load.
+    Dedup is by exact bytes, so for PDFs it is best-effort: each build embeds its
+    "Generated on" time and ReportLab's creation date, and only matches a copy of itself.
+    """
+
+    INDEX_FILE = "index.json"
+    BLOB_FILE = re.compile(r"^[0-9a-f]{64}\.\w+(\.tmp)?$")
+
+    def __init__(self, path: str = "reports/artifacts", max_bytes: int = 512 * 1024 * 1024,
+                 ttl_seconds: float = 7 * 24 * 3600, cleanup_interval: float = 600.0,
+                 index_flush_interval: float = 5.0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.cleanup_interval = cleanup_interval
+        self.index_flush_interval = index_flush_interval
+        self.total_bytes = 0
+        self.dedup_hits = 0
+        self.evictions = 0
+        self.index_writes = 0
+        # blob hash -> {"size", "ext", "last_access"}, least recently used first
+        self._blobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._tasks: Dict[str, Dict[str, str]] = {}
+        self._dirty = False
+        # Blocking file work runs on worker threads via asyncio.to_thread
+        self._lock = threading.Lock()
+        self._cleanup_task: asyncio.Task = None
+        os.makedirs(path, exist_ok=True)
+        self._load_index()
+
+    def _blob_path(self, blob: str, ext: str) -> str:
+        return os.path.join(self.path, f"{blob}.{ext}")
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.path, self.INDEX_FILE), "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {"blobs": {}, "tasks": {}}
+
+        blobs = sorted(index.get("blobs", {}).items(), key=lambda item: item[1]["last_access"])
+        for blob, meta in blobs:
+            if os.path.exists(self._blob_path(blob, meta["ext"])):
+                self._blobs[blob] = meta
+                self.total_bytes += meta["size"]
+        self._tasks = {
+            task_id: {fmt: blob for fmt, blob in formats.items() if blob in self._blobs}
+            for task_id, formats in index.get("tasks", {}).items()
+        }
+        self._remove_unindexed_files()
+        self._cleanup()
+        self._save_index()
+
+    def _remove_unindexed_files(self):
+        """Delete blobs written after the last index flush of a process that then stopped"""
+        indexed = {f"{blob}.{meta['ext']}" for blob, meta in self._blobs.items()}
+        for name in os.listdir(self.path):
+            if self.BLOB_FILE.match(name) and name not in indexed:
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    pass
+
+    def _save_index(self):
+        index_path = os.path.join(self.path, self.INDEX_FILE)
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"blobs": self._blobs, "tasks": self._tasks}, f, separators=(",", ":"))
+        os.replace(tmp_path, index_path)
+        self._dirty = False
+        self.index_writes += 1
+
+    def put(self, task_id: str, artifact: ReportArtifact) -> str:
+        """Store the artifact for a task and return its file path"""
+        blob = hashlib.sha256(artifact.data).hexdigest()
+        ext = artifact.filename.rsplit(".", 1)[-1]
+        with self._lock:
+            blob_path = self._blob_path(blob, ext)
+            if blob in self._blobs:
+                self.dedup_hits += 1
+            else:
+                tmp_path = blob_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(artifact.data)
+                os.replace(tmp_path, blob_path)
+                self._blobs[blob] = {"size": artifact.size, "ext": ext}
+                self.total_bytes += artifact.size
+            self._touch(blob)
+            self._tasks.setdefault(task_id, {})[artifact.format] = blob
+            self._cleanup(keep=blob)
+            return blob_path
+
+    def get_path(self, task_id: str, report_format: str) -> Optional[str]:
+        with self._lock:
+            blob = self._live_blob(task_id, report_format)
+            if blob is None:
+                return None
+            self._touch(blob)
+            return self._blob_path(blob, self._blobs[blob]["ext"])
+
+    def load(self, task_id: str, report_format: str) -> Optional[bytes]:
+        path = self.get_path(task_id, report_format)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def formats(self, task_id: str) -> List[str]:
+        """Formats currently stored for a task"""
+        with self._lock:
+            return sorted(fmt for fmt, blob in self._tasks.get(task_id, {}).items() if blob in self._blobs)
+
+    def remove_task(self, task_id: str):
+        """Forget a task; its blobs go once no other task references them"""
+        with self._lock:
+            if self._tasks.pop(task_id, None) is not None:
+                self._dirty = True
+                self._cleanup()
+
+    def flush(self) -> bool:
+        """Write index.json if anything changed since the last write"""
+        with self._lock:
+            if not self._dirty:
+                return False
+            self._save_index()
+            return True
+
+    def _live_blob(self, task_id: str, report_format: str) -> Optional[str]:
+        blob = self._tasks.get(task_id, {}).get(report_format)
+        if blob is None or blob not in self._blobs:
+            return None
+        if time.time() - self._blobs[blob]["last_access"] > self.ttl_seconds:
+            self._remove_blob(blob)
+            return None
+        return blob
+
+    def _touch(self, blob: str):
+        # Access times only reach index.json on the next flush
+        self._blobs[blob]["last_access"] = time.time()
+        self._blobs.move_to_end(blob)
+        self._dirty = True
+
+    def cleanup(self) -> int:
+        """Expire, orphan-collect and quota-trim blobs; returns how many were removed"""
+        with self._lock:
+            removed = self._cleanup()
+            if removed or self._dirty:
+                self._save_index()
+            return removed
+
+    def _cleanup(self, keep: str = None) -> int:
+        removed = 0
+        now = time.time()
+        referenced = {blob for formats in self._tasks.values() for blob in formats.values()}
+        for blob, meta in list(self._blobs.items()):
+            if blob != keep and (blob not in referenced or now - meta["last_access"] > self.ttl_seconds):
+                self._remove_blob(blob)
+                removed += 1
+        # Least recently used first until the store fits its quota
+        for blob in list(self._blobs):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if blob != keep:
+                self._remove_blob(blob)
+                removed += 1
+        self.evictions += removed
+        return removed
+
+    def _remove_blob(self, blob: str):
+        meta = self._blobs.pop(blob)
+        self.total_bytes -= meta["size"]
+        for task_id, formats in list(self._tasks.items()):
+            for fmt in [fmt for fmt, ref in formats.items() if ref == blob]:
+                del formats[fmt]
+            if not formats:
+                del self._tasks[task_id]
+        try:
+            os.remove(self._blob_path(blob, meta["ext"]))
+        except OSError:
+            pass
+        self._dirty = True
+
+    async def _maintenance_loop(self):
+        next_cleanup = time.monotonic() + self.cleanup_interval
+        while True:
+            await asyncio.sleep(min(self.index_flush_interval, self.cleanup_interval))
+            try:
+                if time.monotonic() >= next_cleanup:
+                    next_cleanup = time.monotonic() + self.cleanup_interval
+                    await asyncio.to_thread(self.cleanup)
+                elif self._dirty:
+                    await asyncio.to_thread(self.flush)
+            except Exception as e:
+                print(f"Report store maintenance failed: {e}")
+
+    def start(self):
+        """Flush the index and run cleanup periodically on the current event loop"""
+        if self._cleanup_task is None:
+            self._cleanup_task = asyncio.create_task(self._maintenance_loop())
+
+    async def stop(self):
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            try:
+                await self._cleanup_task
+            except asyncio.CancelledError:
+                pass
+            self._cleanup_task = None
+        await asyncio.to_thread(self.cleanup)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "blobs": len(self._blobs),
+            "tasks": len(self._tasks),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "dedup_hits": self.dedup_hits,
+            "evictions": self.evictions,
+            "index_writes": self.index_writes
+        }
+
+_default_store: ReportArtifactStore = None
+
+def get_report_store() -> ReportArtifactStore:
+    """Process-wide store configured by TASKHIVE_REPORTS_DIR / _MAX_MB / _TTL_HOURS"""
+    global _default_store
+    if _default_store is None:
+        _default_store = ReportArtifactStore(
+            path=os.getenv("TASKHIVE_REPORTS_DIR", "reports/artifacts"),
+            max_bytes=int(os.getenv("TASKHIVE_REPORTS_MAX_MB", "512")) * 1024 * 1024,
+            ttl_seconds=float(os.getenv("TASKHIVE_REPORTS_TTL_HOURS", "168")) * 3600
+        )
+    return _default_store
@@ -0,0 +1,115 @@
+import asyncio
+import contextlib
+from collections import deque
+from typing import Dict, Any, Deque
+
+class SchedulerFull(Exception):
+    """Raised when the scheduler queue cannot accept another workflow"""
+    pass
+
+class TaskScheduler:
+    """Admits workflows into a bounded queue and caps concurrency globally and per stage"""
+
+    def __init__(self, max_concurrent_workflows: int = 4, max_queue_size: int = 100,
+                 stage_limits: Dict[str, int] = None):
+        self.max_concurrent_workflows = max_concurrent_workflows
+        self.max_queue_size = max_queue_size
+        self.stage_limits = dict(stage_limits or {})
+        self.queue: Deque = deque()
+        self.running: Dict[str, asyncio.Task] = {}
+        self._stage_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stage_active: Dict[str, int] = {}
+        self._stage_waiting: Dict[str, int] = {}
+        self.submitted = 0
+        self.rejected = 0
+        self.finished = 0
+
+    def submit(self, coordinator) -> int:
+        """Admit a coordinator; returns its queue position (0 means it started immediately)"""
+        if len(self.running) < self.max_concurrent_workflows and not self.queue:
+            self.submitted += 1
+            self._launch(coordinator)
+            return 0
+
+        if len(self.queue) >= self.max_queue_size:
+            self.rejected += 1
+            raise SchedulerFull(f"Task queue is full ({self.max_queue_size} waiting), try again later")
+
+        self.submitted += 1
+        coordinator.status = "queued"
+        self.queue.append(coordinator)
+        return len(self.queue)
+
+    def queue_position(self, task_id: str) -> int:
+        """1-based position of a waiting task, 0 if it is running or unknown"""
+        for position, coordinator in enumerate(self.queue, 1):
+            if coordinator.task_id == task_id:
+                return position
+        return 0
+
+    def stage_slot(self, stage_name: str):
+        """Async context manager that holds one of the stage's concurrency slots"""
+        limit = self.stage_limits.get(stage_name)
+        if not limit:
+            return contextlib.nullcontext()
+        if stage_name not in self._stage_semaphores:
+            self._stage_semaphores[stage_name] = asyncio.Semaphore(limit)
+        return self._hold_stage(stage_name)
+
+    @contextlib.asynccontextmanager
+    async def _hold_stage(self, stage_name: str):
+        self._stage_waiting[stage_name] = self._stage_waiting.get(stage_name, 0) + 1
+        try:
+            await self._stage_semaphores[stage_name].acquire()
+        finally:
+            self._stage_waiting[stage_name] -= 1
+        self._stage_active[stage_name] = self._stage_active.get(stage_name, 0) + 1
+        try:
+            yield
+        finally:
+            self._stage_active[stage_name] -= 1
+            self._stage_semaphores[stage_name].release()
+
+    def _launch(self, coordinator):
+        self.running[coordinator.task_id] = asyncio.create_task(self._run(coordinator))
+
+    async def _run(self, coordinator):
+        try:
+            await coordinator.run_workflow()
+        finally:
+            self.running.pop(coordinator.task_id, None)
+            self.finished += 1
+            self._drain()
+
+    def _drain(self):
+        """Start queued workflows while capacity is available"""
+        while self.queue and len(self.running) < self.max_concurrent_workflows:
+            self._launch(self.queue.popleft())
+
+    async def shutdown(self):
+        """Drop queued workflows and cancel the running ones"""
+        self.queue.clear()
+        tasks = list(self.running.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of queue depth and concurrency usage"""
+        return {
+            "running": len(self.running),
+            "queued": len(self.queue),
+            "max_concurrent_workflows": self.max_concurrent_workflows,
+            "max_queue_size": self.max_queue_size,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "finished": self.finished,
+            "stages": {
+                name: {
+                    "limit": limit,
+                    "active": self._stage_active.get(name, 0),
+                    "waiting": self._stage_waiting.get(name, 0)
+                }
+                for name, limit in self.stage_limits.items()
+            }
+        }
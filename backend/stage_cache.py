@@ -0,0 +1,184 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from encoding import dumps_bytes
+
+def normalize(value: Any) -> Any:
+    """Canonical form of a stage input: whitespace-collapsed strings, sorted keys"""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {str(key): normalize(item) for key, item in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [normalize(item) for item in value]
+    return value
+
+def stage_cache_key(stage_name: str, agent_version: str, payload: Any) -> str:
+    """Stable content hash of a stage's input plus the agent version"""
+    canonical = json.dumps(
+        [stage_name, agent_version, normalize(payload)],
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class DiskCacheTier:
+    """One JSON file per entry, expired by TTL and trimmed oldest-first to a byte budget"""
+
+    def __init__(self, path: str, ttl_seconds: float, max_bytes: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.evictions = 0
+        # key -> (size, written_at), so eviction never rescans the directory
+        self._index: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        # get/put run on worker threads via asyncio.to_thread
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        self._load_index()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.json")
+
+    def _load_index(self):
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.is_file() and entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[:-5], stat.st_size))
+        for written_at, key, size in sorted(entries):
+            self._index[key] = (size, written_at)
+            self.total_bytes += size
+        self._trim()
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """Stored bytes and their write time, or None if missing or expired"""
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        meta = self._index.get(key)
+        if meta is None:
+            return None
+        if time.time() - meta[1] > self.ttl_seconds:
+            self._remove(key)
+            return None
+        try:
+            with open(self._file(key), "rb") as f:
+                return f.read(), meta[1]
+        except OSError:
+            self._remove(key)
+            return None
+
+    def put(self, key: str, data: bytes):
+        with self._lock:
+            self._put(key, data)
+
+    def _put(self, key: str, data: bytes):
+        if len(data) > self.max_bytes:
+            return
+        if key in self._index:
+            self._remove(key)
+        tmp_path = self._file(key) + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self._file(key))
+        self._index[key] = (len(data), time.time())
+        self.total_bytes += len(data)
+        self._trim()
+
+    def _trim(self):
+        """Drop the oldest entries until the tier fits its byte budget"""
+        while self.total_bytes > self.max_bytes and self._index:
+            self._remove(next(iter(self._index)))
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        size, _ = self._index.pop(key, (0, 0))
+        self.total_bytes -= size
+        try:
+            os.remove(self._file(key))
+        except OSError:
+            pass
+
+class StageCache:
+    """Two-tier (memory LRU + disk) cache of stage outputs keyed by input content hash
+
+    Both tiers expire entries ttl_seconds after they were written; an entry
+    promoted from disk keeps its original write time.
+    """
+
+    def __init__(self, max_memory_entries: int = 256, disk_path: str = None,
+                 ttl_seconds: float = 24 * 3600, max_disk_bytes: int = 256 * 1024 * 1024):
+        self.max_memory_entries = max_memory_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (serialized value, written_at); kept serialized so every hit hands out an independent copy
+        self._memory: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self.disk = DiskCacheTier(disk_path, ttl_seconds, max_disk_bytes) if disk_path else None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.memory_evictions = 0
+
+    def key(self, stage_name: str, agent_version: str, payload: Any) -> str:
+        return stage_cache_key(stage_name, agent_version, payload)
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            data, written_at = entry
+            if time.time() - written_at <= self.ttl_seconds:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return json.loads(data)
+            del self._memory[key]
+
+        if self.disk is not None:
+            entry = await asyncio.to_thread(self.disk.get_entry, key)
+            if entry is not None:
+                self.disk_hits += 1
+                self._remember(key, *entry)
+                return json.loads(entry[0])
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, value: Any):
+        data = dumps_bytes(value)
+        self.stores += 1
+        self._remember(key, data, time.time())
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.put, key, data)
+
+    def _remember(self, key: str, data: bytes, written_at: float):
+        self._memory[key] = (data, written_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.memory_evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+            "stores": self.stores,
+            "memory_entries": len(self._memory),
+            "memory_evictions": self.memory_evictions,
+            "disk_entries": len(self.disk._index) if self.disk else 0,
+            "disk_bytes": self.disk.total_bytes if self.disk else 0,
+            "disk_evictions": self.disk.evictions if self.disk else 0
+        }
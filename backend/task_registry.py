@@ -0,0 +1,266 @@
+import asyncio
+import contextlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterator, List, Optional, Union
+
+from agents.report_model import ReportDocument
+from agents.report_renderers import ReportArtifact
+from agents.report_writer_agent import ReportWriterAgent
+from coordinator import TaskCoordinator
+from report_store import ReportArtifactStore, get_report_store
+from task_store import TaskStore
+
+FINISHED_STATUSES = ("completed", "error")
+
+@dataclass
+class TaskSummary:
+    """What remains of a finished task once its coordinator is released
+
+    Status, timings and final agent states are kept inline. The report itself
+    lives in the report store ("json" plus any format already rendered) or in
+    the task store's "lex" checkpoint, and other formats are rendered from it
+    on demand. Exposes the coordinator's read-only interface.
+    """
+    task_id: str
+    task_description: str
+    status: str
+    progress: int
+    started_at: str
+    finished_at: str
+    timing: Dict[str, Any]
+    agents: Dict[str, Dict[str, Any]]
+    cache: Dict[str, Any]
+    report_formats: List[str]
+    # Formats persisted in the report store when the coordinator was evicted
+    stored_formats: List[str]
+    report_path: str
+    snapshot_message: str
+    registry: "TaskRegistry" = field(default=None, repr=False, compare=False)
+    # One lock per format, held while a missing format is rendered and stored
+    render_locks: Dict[str, asyncio.Lock] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_coordinator(cls, coordinator: TaskCoordinator, stored_formats: List[str],
+                         registry: "TaskRegistry") -> "TaskSummary":
+        return cls(
+            task_id=coordinator.task_id,
+            task_description=coordinator.task_description,
+            status=coordinator.get_status(),
+            progress=coordinator.get_progress(),
+            started_at=coordinator.start_time.isoformat(),
+            finished_at=coordinator.end_time.isoformat() if coordinator.end_time else "",
+            timing=coordinator.get_timing(),
+            agents=coordinator.get_agent_statuses(),
+            cache={"hits": list(coordinator.cache_hits), "misses": list(coordinator.cache_misses)},
+            report_formats=coordinator.get_report_formats() if coordinator.report_document else [],
+            stored_formats=stored_formats,
+            report_path=coordinator.get_report_path(),
+            snapshot_message=coordinator.status_snapshot_message(),
+            registry=registry
+        )
+
+    def get_status(self) -> str:
+        return self.status
+
+    def get_progress(self) -> int:
+        return self.progress
+
+    def get_agent_statuses(self) -> Dict[str, Dict]:
+        return self.agents
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return {**self.cache, "cache": {}}
+
+    def get_timing(self) -> Dict[str, Any]:
+        return self.timing
+
+    def status_snapshot_message(self) -> str:
+        return self.snapshot_message
+
+    def get_report_formats(self) -> List[str]:
+        return self.report_formats
+
+    def get_report_path(self) -> str:
+        return self.report_path
+
+    async def get_report_artifact(self, report_format: str = "pdf") -> ReportArtifact:
+        return await self.registry.summary_artifact(self, report_format)
+
+TaskEntry = Union[TaskCoordinator, TaskSummary]
+
+class TaskRegistry:
+    """task_id -> live TaskCoordinator, or a TaskSummary once the task has finished
+
+    Finished coordinators (with their agents and intermediate data) are
+    released after retain_seconds, or sooner when more than max_finished are
+    held. Their summaries stay in an LRU of max_summaries entries; dropping
+    a summary also forgets its stored reports. Supports the dict operations
+    main.py uses on manager.task_coordinators.
+    """
+
+    def __init__(self, max_summaries: int = 10000, retain_seconds: float = 300.0, max_finished: int = 100,
+                 report_store: ReportArtifactStore = None, task_store: TaskStore = None, scheduler=None,
+                 sweep_interval: float = 30.0):
+        self.max_summaries = max_summaries
+        self.retain_seconds = retain_seconds
+        self.max_finished = max_finished
+        self.report_store = report_store or get_report_store()
+        self.task_store = task_store
+        self.scheduler = scheduler
+        self.sweep_interval = sweep_interval
+        self.live: Dict[str, TaskCoordinator] = {}
+        # Least recently used first
+        self.summaries: "OrderedDict[str, TaskSummary]" = OrderedDict()
+        self.evicted = 0
+        self.summaries_dropped = 0
+        self._report_writer: ReportWriterAgent = None
+        self._sweep_task: asyncio.Task = None
+
+    def __setitem__(self, task_id: str, coordinator: TaskCoordinator):
+        self.summaries.pop(task_id, None)
+        self.live[task_id] = coordinator
+
+    def __getitem__(self, task_id: str) -> TaskEntry:
+        if task_id in self.live:
+            return self.live[task_id]
+        summary = self.summaries[task_id]
+        self.summaries.move_to_end(task_id)
+        return summary
+
+    def get(self, task_id: str, default=None) -> Optional[TaskEntry]:
+        try:
+            return self[task_id]
+        except KeyError:
+            return default
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self.live or task_id in self.summaries
+
+    def __len__(self) -> int:
+        return len(self.live) + len(self.summaries)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self.live)
+        yield from list(self.summaries)
+
+    def values(self) -> List[TaskEntry]:
+        """Live coordinators and summaries, without touching the LRU order"""
+        return [*self.live.values(), *self.summaries.values()]
+
+    def items(self):
+        return [*self.live.items(), *self.summaries.items()]
+
+    async def evict(self, task_id: str) -> TaskSummary:
+        """Replace a finished coordinator by its summary, persisting its report first"""
+        coordinator = self.live[task_id]
+        if coordinator.get_status() not in FINISHED_STATUSES:
+            raise ValueError(f"Task {task_id} is still {coordinator.get_status()}")
+
+        if coordinator.report_document is not None:
+            artifacts = dict(coordinator.report_artifacts)
+            if "json" not in artifacts:
+                artifacts["json"] = await coordinator.get_report_artifact("json")
+            for artifact in artifacts.values():
+                if await asyncio.to_thread(self.report_store.get_path, task_id, artifact.format) is None:
+                    await asyncio.to_thread(self.report_store.put, task_id, artifact)
+        stored_formats = await asyncio.to_thread(self.report_store.formats, task_id)
+
+        # The coordinator may have been replaced (resubmitted) while the report was persisted
+        if self.live.get(task_id) is not coordinator:
+            return None
+        summary = TaskSummary.from_coordinator(coordinator, stored_formats, self)
+        del self.live[task_id]
+        self.summaries[task_id] = summary
+        self.evicted += 1
+        while len(self.summaries) > self.max_summaries:
+            dropped_id, _ = self.summaries.popitem(last=False)
+            self.summaries_dropped += 1
+            await asyncio.to_thread(self.report_store.remove_task, dropped_id)
+        return summary
+
+    async def sweep(self) -> int:
+        """Evict coordinators finished longer than retain_seconds, and the oldest beyond max_finished"""
+        finished = sorted(
+            (c for c in self.live.values() if c.get_status() in FINISHED_STATUSES and c.end_time is not None),
+            key=lambda c: c.end_time
+        )
+        now = time.time()
+        overflow = len(finished) - self.max_finished
+        evicted = 0
+        for index, coordinator in enumerate(finished):
+            if index >= overflow and now - coordinator.end_time.timestamp() < self.retain_seconds:
+                continue
+            try:
+                if await self.evict(coordinator.task_id) is not None:
+                    evicted += 1
+            except Exception as e:
+                print(f"Failed to evict task {coordinator.task_id}: {e}")
+        return evicted
+
+    async def _sweep_loop(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            await self.sweep()
+
+    def start(self):
+        """Sweep periodically on the current event loop"""
+        if self._sweep_task is None:
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+
+    async def stop(self):
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
+
+    def _get_report_writer(self) -> ReportWriterAgent:
+        # Only its renderers are used; shared by every summary
+        if self._report_writer is None:
+            self._report_writer = ReportWriterAgent("Lex", "ReportWriterAgent", "✍️", "green")
+        return self._report_writer
+
+    async def _load_document(self, summary: TaskSummary) -> ReportDocument:
+        data = await asyncio.to_thread(self.report_store.load, summary.task_id, "json")
+        if data is not None:
+            return ReportDocument.from_dict(json.loads(data))
+        if self.task_store is not None:
+            outputs = await asyncio.to_thread(self.task_store.load_outputs, summary.task_id)
+            document = outputs.get("lex", {}).get("report_document")
+            if document is not None:
+                return ReportDocument.from_dict(document)
+        raise FileNotFoundError("Report is no longer available")
+
+    async def summary_artifact(self, summary: TaskSummary, report_format: str) -> ReportArtifact:
+        """Serve a finished task's report from the store, rendering it from the stored document if needed"""
+        writer = self._get_report_writer()
+        renderer = writer.get_renderer(report_format)
+        filename = f"taskhive_report_{summary.task_id}.{renderer.extension}"
+        lock = summary.render_locks.setdefault(report_format, asyncio.Lock())
+        async with lock:
+            data = await asyncio.to_thread(self.report_store.load, summary.task_id, report_format)
+            if data is not None:
+                return ReportArtifact(renderer.format, renderer.media_type, filename, data)
+
+            document = await self._load_document(summary)
+            slot = self.scheduler.stage_slot(report_format) if self.scheduler else contextlib.nullcontext()
+            async with slot:
+                artifact = await writer.render_artifact(document, report_format, f"taskhive_report_{summary.task_id}")
+            await asyncio.to_thread(self.report_store.put, summary.task_id, artifact)
+            return artifact
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "live": len(self.live),
+            "summaries": len(self.summaries),
+            "max_summaries": self.max_summaries,
+            "retain_seconds": self.retain_seconds,
+            "max_finished": self.max_finished,
+            "evicted": self.evicted,
+            "summaries_dropped": self.summaries_dropped
+        }
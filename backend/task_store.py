@@ -0,0 +1,171 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List
+
+from encoding import dumps
+
+# Tasks in these states had not finished when the process stopped
+INCOMPLETE_STATUSES = ("pending", "queued", "running")
+
+class TaskStore(ABC):
+    """Persists task records and per-stage checkpoints so workflows survive restarts"""
+
+    @abstractmethod
+    def create_task(self, task_id: str, task_description: str):
+        """Register a task; a no-op if it already exists"""
+        pass
+
+    @abstractmethod
+    def set_status(self, task_id: str, status: str, report_path: str = None):
+        pass
+
+    @abstractmethod
+    def save_stage(self, task_id: str, stage_name: str, outputs: Dict[str, Any]):
+        """Checkpoint the outputs of a finished stage"""
+        pass
+
+    @abstractmethod
+    def load_outputs(self, task_id: str) -> Dict[str, Dict[str, Any]]:
+        """Checkpointed outputs keyed by stage name"""
+        pass
+
+    @abstractmethod
+    def get_task(self, task_id: str) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def incomplete_tasks(self) -> List[Dict[str, Any]]:
+        pass
+
+    def close(self):
+        pass
+
+class InMemoryTaskStore(TaskStore):
+    """Non-persistent store with the same interface, for tests and benchmarks"""
+
+    def __init__(self):
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.stages: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def create_task(self, task_id: str, task_description: str):
+        if task_id not in self.tasks:
+            now = time.time()
+            self.tasks[task_id] = {
+                "task_id": task_id,
+                "task_description": task_description,
+                "status": "pending",
+                "report_path": "",
+                "created_at": now,
+                "updated_at": now
+            }
+            self.stages[task_id] = {}
+
+    def set_status(self, task_id: str, status: str, report_path: str = None):
+        task = self.tasks[task_id]
+        task["status"] = status
+        task["updated_at"] = time.time()
+        if report_path is not None:
+            task["report_path"] = report_path
+
+    def save_stage(self, task_id: str, stage_name: str, outputs: Dict[str, Any]):
+        # Round-trip through JSON so callers can't share mutable state with the store
+        self.stages[task_id][stage_name] = json.loads(dumps(outputs))
+
+    def load_outputs(self, task_id: str) -> Dict[str, Dict[str, Any]]:
+        return json.loads(dumps(self.stages.get(task_id, {})))
+
+    def get_task(self, task_id: str) -> Dict[str, Any]:
+        task = self.tasks.get(task_id)
+        return dict(task) if task else None
+
+    def incomplete_tasks(self) -> List[Dict[str, Any]]:
+        return [dict(task) for task in self.tasks.values() if task["status"] in INCOMPLETE_STATUSES]
+
+class SQLiteTaskStore(TaskStore):
+    """Default store: one SQLite file with a tasks table and a stage checkpoint table"""
+
+    def __init__(self, path: str = "taskhive.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        # Checkpoints are written from worker threads via asyncio.to_thread
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    task_id TEXT PRIMARY KEY,
+                    task_description TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    report_path TEXT NOT NULL DEFAULT '',
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS stage_outputs (
+                    task_id TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    outputs TEXT NOT NULL,
+                    completed_at REAL NOT NULL,
+                    PRIMARY KEY (task_id, stage)
+                )
+            """)
+
+    def create_task(self, task_id: str, task_description: str):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO tasks (task_id, task_description, status, created_at, updated_at) "
+                "VALUES (?, ?, 'pending', ?, ?)",
+                (task_id, task_description, now, now)
+            )
+
+    def set_status(self, task_id: str, status: str, report_path: str = None):
+        with self._lock, self._conn:
+            if report_path is None:
+                self._conn.execute(
+                    "UPDATE tasks SET status = ?, updated_at = ? WHERE task_id = ?",
+                    (status, time.time(), task_id)
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE tasks SET status = ?, report_path = ?, updated_at = ? WHERE task_id = ?",
+                    (status, report_path, time.time(), task_id)
+                )
+
+    def save_stage(self, task_id: str, stage_name: str, outputs: Dict[str, Any]):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stage_outputs (task_id, stage, outputs, completed_at) VALUES (?, ?, ?, ?)",
+                (task_id, stage_name, dumps(outputs), time.time())
+            )
+
+    def load_outputs(self, task_id: str) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT stage, outputs FROM stage_outputs WHERE task_id = ? ORDER BY completed_at",
+                (task_id,)
+            ).fetchall()
+        return {row["stage"]: json.loads(row["outputs"]) for row in rows}
+
+    def get_task(self, task_id: str) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return dict(row) if row else None
+
+    def incomplete_tasks(self) -> List[Dict[str, Any]]:
+        placeholders = ", ".join("?" for _ in INCOMPLETE_STATUSES)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM tasks WHERE status IN ({placeholders}) ORDER BY created_at",
+                INCOMPLETE_STATUSES
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from report_store import ReportArtifactStore
+from tracing import Tracer
+
+@pytest.fixture
+def report_store(tmp_path):
+    return ReportArtifactStore(path=str(tmp_path / "artifacts"))
+
+@pytest.fixture
+def tracer():
+    return Tracer(max_spans=0)
+
+@pytest.fixture
+def fast_agents(monkeypatch):
+    from agents.base_agent import BaseAgent
+    monkeypatch.setattr(BaseAgent, "time_scale", 0)
+
+@pytest.fixture
+def manager():
+    from connection_manager import ConnectionManager
+    return ConnectionManager()
@@ -0,0 +1,35 @@
+import asyncio
+
+async def settle():
+    """Let writer tasks pick up their first message and start sending it"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+class RecordingSocket:
+    """Accepts every send immediately and keeps what was sent"""
+
+    def __init__(self):
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000):
+        self.closed_with = code
+
+class StalledSocket(RecordingSocket):
+    """Accepts the first send and never completes it, so everything after stays queued"""
+
+    async def send_text(self, message: str):
+        self.sent.append(message)
+        await asyncio.Event().wait()
+
+async def drain(manager):
+    """Wait until every writer has sent its queue and gone back to waiting"""
+    while any(client.queue for client in manager.active_connections.values()):
+        await asyncio.sleep(0)
+    await settle()
@@ -0,0 +1,33 @@
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate
+
+from agents.chart_renderer import chart_drawing, chart_spec_key
+from agents.pdf_renderer import build_pdf_bytes
+
+BAR_CHART = {
+    "id": "budget",
+    "type": "bar_chart",
+    "title": "Budget by phase",
+    "data": {"labels": ["Plan", "Pilot", "Rollout"], "values": [10, 25, 40], "unit": "k"}
+}
+
+def test_cached_drawing_is_copied_per_call():
+    first = chart_drawing(BAR_CHART)
+    second = chart_drawing(dict(BAR_CHART, id="other"))
+
+    assert first is not second
+    assert chart_spec_key(BAR_CHART) == chart_spec_key(dict(BAR_CHART, id="other"))
+
+def test_charts_fit_the_a4_text_frame():
+    frame_width = SimpleDocTemplate(None, pagesize=A4).width - 12  # frame padding on both sides
+    assert chart_drawing(BAR_CHART).width <= frame_width
+
+def test_same_chart_renders_in_consecutive_pdfs_of_one_process():
+    # The body nearly fills the first page, so the chart is pushed to the next one
+    body = "\n\n".join(["Findings paragraph with enough text to take up a line or two of the page."] * 24)
+    layout = [("Visualizations", body, "spacer", [BAR_CHART])]
+
+    first = build_pdf_bytes(layout, "January 01, 2025 at 09:00 AM")
+    second = build_pdf_bytes(layout, "January 01, 2025 at 09:00 AM")
+
+    assert first.startswith(b"%PDF") and second.startswith(b"%PDF")
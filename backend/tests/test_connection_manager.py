@@ -0,0 +1,118 @@
+import asyncio
+
+from connection_manager import ALL_TOPIC, ConnectionManager
+from fake_sockets import RecordingSocket, StalledSocket, drain, settle
+
+def queued(manager: ConnectionManager, socket) -> list:
+    return [message for message, _ in manager.active_connections[socket].queue]
+
+def test_keyed_messages_coalesce_while_queued():
+    async def scenario():
+        manager = ConnectionManager()
+        socket = StalledSocket()
+        await manager.connect(socket)
+        await manager.broadcast("first")
+        await settle()
+        for progress in range(3):
+            await manager.broadcast(f"progress {progress}", coalesce_key="progress")
+        state = queued(manager, socket), manager.active_connections[socket].coalesced
+        manager.disconnect(socket)
+        return state
+
+    assert asyncio.run(scenario()) == (["progress 2"], 2)
+
+def test_full_queue_drops_oldest_message():
+    async def scenario():
+        manager = ConnectionManager(max_queue_size=3, evict_after_drops=10)
+        socket = StalledSocket()
+        await manager.connect(socket)
+        await manager.broadcast("in flight")
+        await settle()
+        for index in range(5):
+            await manager.broadcast(f"m{index}")
+        client = manager.active_connections[socket]
+        state = queued(manager, socket), client.dropped, client.evicted
+        manager.disconnect(socket)
+        return state
+
+    assert asyncio.run(scenario()) == (["m2", "m3", "m4"], 2, False)
+
+def test_client_is_evicted_after_consecutive_drops():
+    async def scenario():
+        manager = ConnectionManager(max_queue_size=2, evict_after_drops=3)
+        slow, fast = StalledSocket(), RecordingSocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+        await manager.broadcast("in flight")
+        await settle()
+        for index in range(6):
+            await manager.broadcast(f"m{index}")
+            await settle()
+        return set(manager.active_connections), manager.evicted_clients, slow, fast
+
+    connected, evicted, slow, fast = asyncio.run(scenario())
+
+    assert connected == {fast}
+    assert evicted == 1
+    assert slow.closed_with == 1013
+    assert fast.sent == ["in flight"] + [f"m{index}" for index in range(6)]
+
+def test_successful_sends_reset_the_drop_streak():
+    async def scenario():
+        manager = ConnectionManager(max_queue_size=1, evict_after_drops=2)
+        socket = RecordingSocket()
+        await manager.connect(socket)
+        client = manager.active_connections[socket]
+        for burst in range(3):
+            # Two messages overflow the one-slot queue once, then the writer catches up
+            await manager.broadcast(f"a{burst}")
+            await manager.broadcast(f"b{burst}")
+            await settle()
+        return socket in manager.active_connections, socket, client
+
+    connected, socket, client = asyncio.run(scenario())
+
+    assert connected
+    assert not client.evicted
+    assert client.dropped == 3
+    assert socket.sent == ["b0", "b1", "b2"]
+
+def test_topic_messages_reach_only_their_subscribers_and_admins():
+    async def scenario():
+        manager = ConnectionManager()
+        watcher, other, admin, idle = RecordingSocket(), RecordingSocket(), RecordingSocket(), RecordingSocket()
+        await manager.connect(watcher, topics=["t1"])
+        await manager.connect(other, topics=["t2"])
+        await manager.connect(admin, topics=[ALL_TOPIC], admin=True)
+        await manager.connect(idle)
+        await manager.broadcast("t1 update", topic="t1")
+        await manager.broadcast("t2 update", topic="t2")
+        await manager.broadcast("announcement")
+        await drain(manager)
+        manager.unsubscribe(watcher, "t1")
+        await manager.broadcast("after unsubscribe", topic="t1")
+        await drain(manager)
+        return watcher, other, admin, idle, dict(manager.topics)
+
+    watcher, other, admin, idle, topics = asyncio.run(scenario())
+
+    assert watcher.sent == ["t1 update", "announcement"]
+    assert other.sent == ["t2 update", "announcement"]
+    assert admin.sent == ["t1 update", "t2 update", "announcement", "after unsubscribe"]
+    assert idle.sent == ["announcement"]
+    assert "t1" not in topics
+
+def test_all_topic_requires_an_admin_connection():
+    async def scenario():
+        manager = ConnectionManager()
+        client = await manager.connect(RecordingSocket(), topics=[ALL_TOPIC])
+        refused = manager.subscribe(client.websocket, ALL_TOPIC)
+        admin = await manager.connect(RecordingSocket(), admin=True)
+        accepted = manager.subscribe(admin.websocket, ALL_TOPIC)
+        return client.topics, refused, accepted, manager.is_subscribed(admin.websocket, ALL_TOPIC)
+
+    topics, refused, accepted, admin_subscribed = asyncio.run(scenario())
+
+    assert topics == set()
+    assert not refused
+    assert accepted and admin_subscribed
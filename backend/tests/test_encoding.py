@@ -0,0 +1,45 @@
+import json
+from datetime import datetime
+
+from encoding import MessageEncoder, StatusDeltaTracker
+from records import AgentStatus, ChatEntry, GraphEdge, intern_agent_profile
+
+def test_payload_keys_cannot_override_the_envelope():
+    encoder = MessageEncoder("t1")
+    profile = intern_agent_profile("Nova", "ResearchAgent", "blue", "🔍")
+    chat = ChatEntry("nova", "Found 3 sources", "success", datetime(2024, 1, 1), profile)
+    edge = GraphEdge("nova", "athena", "research_data", datetime(2024, 1, 1))
+
+    chat_message = json.loads(encoder.encode("chat_message", chat.to_payload()))
+    edge_message = json.loads(encoder.encode("graph_edge", {**edge.to_payload(), "task_id": "other"}))
+
+    assert chat_message["type"] == "chat_message"
+    assert chat_message["task_id"] == "t1"
+    assert chat_message["message"] == "Found 3 sources"
+    assert chat_message["emoji"] == "🔍"
+    assert edge_message["type"] == "graph_edge"
+    assert edge_message["task_id"] == "t1"
+    assert (edge_message["from"], edge_message["to"]) == ("nova", "athena")
+
+def test_agent_status_payload_uses_the_shared_profile():
+    status = AgentStatus(name="Nova", role="ResearchAgent", color="blue", emoji="🔍",
+                         status="working", progress=40, last_message="Searching")
+
+    payload = MessageEncoder("t1").agent_status("nova", status)
+
+    assert payload == status.to_dict()
+    assert payload["name"] == "Nova" and payload["progress"] == 40
+
+def test_status_deltas_carry_changed_fields_in_sequence():
+    idle = {"status": "idle", "progress": 0, "last_message": ""}
+    tracker = StatusDeltaTracker({"nova": idle})
+
+    first = tracker.delta("nova", {**idle, "status": "working", "progress": 10})
+    unchanged = tracker.delta("nova", {**idle, "status": "working", "progress": 10})
+    second = tracker.delta("nova", {**idle, "status": "working", "progress": 50})
+    snapshot = tracker.snapshot()
+
+    assert first == {"agent": "nova", "seq": 1, "changes": {"status": "working", "progress": 10}}
+    assert unchanged is None
+    assert second == {"agent": "nova", "seq": 2, "changes": {"progress": 50}}
+    assert snapshot == {"seq": 2, "agents": {"nova": {**idle, "status": "working", "progress": 50}}}
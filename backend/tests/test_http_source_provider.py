@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from agents.http_source_provider import HTTPSourceProvider
+from agents.research_agent import ResearchAgent
+from benchmarks.fixture_server import FixtureServer
+
+@pytest.fixture
+def fixture_server():
+    with FixtureServer(latency_ms=10, default_results=12) as server:
+        yield server
+
+async def collect(provider: HTTPSourceProvider, task: str):
+    try:
+        return [source async for source in provider.search(task)]
+    finally:
+        await provider.close()
+
+def test_search_follows_result_links_into_sources(fixture_server):
+    provider = HTTPSourceProvider([fixture_server.search_url()], max_sources=8)
+    sources = asyncio.run(collect(provider, "solar energy"))
+
+    assert [source["id"] for source in sources] == [f"source_{index}" for index in range(1, 9)]
+    assert all(source["url"].startswith(f"{fixture_server.base_url}/doc/") for source in sources)
+    assert all("solar energy study" in source["title"] for source in sources)
+    assert all(source["summary"].startswith("Findings on solar energy") for source in sources)
+    assert all(source["relevance_score"] == 1.0 for source in sources)
+    assert provider.get_stats()["fetched"] == 9
+
+def test_fetches_share_a_bounded_keep_alive_pool(fixture_server):
+    provider = HTTPSourceProvider([fixture_server.search_url()], max_sources=12, per_host_limit=3)
+    sources = asyncio.run(collect(provider, "pooling"))
+
+    assert len(sources) == 12
+    assert fixture_server.peak_in_flight <= 3
+    assert fixture_server.connections <= 3
+    assert fixture_server.requests == 13
+
+def test_failed_fetches_are_counted_and_skipped(fixture_server):
+    provider = HTTPSourceProvider([f"{fixture_server.base_url}/missing?q={{query}}", fixture_server.search_url(2)])
+    sources = asyncio.run(collect(provider, "resilience"))
+
+    assert len(sources) == 2
+    assert provider.get_stats()["failed"] == 1
+
+def test_research_agent_streams_http_sources(fixture_server, fast_agents):
+    async def scenario():
+        provider = HTTPSourceProvider([fixture_server.search_url(4)], max_sources=4)
+        agent = ResearchAgent("Nova", "ResearchAgent", "🔍", "blue", source_provider=provider)
+        try:
+            return await agent.execute("remote work policy")
+        finally:
+            await provider.close()
+
+    research = asyncio.run(scenario())
+
+    assert len(research["sources"]) == 4
+    assert research["metadata"]["source_provider"] == "http"
+
+def test_unknown_charset_falls_back_to_utf8():
+    body = "<html><head><title>Café study</title></head></html>".encode("utf-8")
+
+    page = HTTPSourceProvider._parse(body, "not-a-charset")
+
+    assert page.title == "Café study"
@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+from connection_manager import ConnectionManager
+from fake_sockets import StalledSocket, settle
+from loop_monitor import LoopLagMonitor
+from metrics import MetricsCollector
+from scheduler import TaskScheduler
+from tracing import Tracer
+
+class StubCoordinator:
+    def __init__(self, status: str):
+        self.status = status
+
+    def get_status(self) -> str:
+        return self.status
+
+def test_loop_monitor_sees_a_blocking_callback():
+    async def scenario():
+        monitor = LoopLagMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        # Blocks the loop, so the probe wakes about this much past its deadline
+        time.sleep(0.1)
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+        return monitor
+
+    monitor = asyncio.run(scenario())
+    stats = monitor.get_stats()
+
+    assert monitor._task is None
+    assert stats["samples"] >= 3
+    assert stats["max_ms"] >= 80
+    assert monitor.histogram.bucket_counts[0] >= 1
+
+def test_snapshot_and_prometheus_report_tasks_sockets_and_stages():
+    async def scenario():
+        manager = ConnectionManager()
+        socket = StalledSocket()
+        await manager.connect(socket, topics=["t1"])
+        for index in range(3):
+            await manager.broadcast(f"update {index}", topic="t1")
+        await settle()
+        manager.task_coordinators.update({
+            "t1": StubCoordinator("running"),
+            "t2": StubCoordinator("completed"),
+            "t3": StubCoordinator("completed"),
+            "t4": StubCoordinator("rejected")
+        })
+        tracer = Tracer(max_spans=0)
+        with tracer.span("broadcast", {"type": "chat_message"}):
+            pass
+        collector = MetricsCollector(manager, TaskScheduler(stage_limits={"pdf": 2}), LoopLagMonitor(), tracer=tracer)
+        state = collector.snapshot(), collector.export_prometheus()
+        manager.disconnect(socket)
+        return state
+
+    snapshot, text = asyncio.run(scenario())
+    lines = text.splitlines()
+
+    assert snapshot["tasks"] == {
+        "total": 4,
+        "by_status": {"initializing": 0, "queued": 0, "running": 1, "completed": 2, "error": 0, "rejected": 1}
+    }
+    # The first message is stuck in send_text; the other two wait in the queue
+    assert (snapshot["websockets"]["backlog_total"], snapshot["websockets"]["backlog_max"]) == (2, 2)
+    assert snapshot["pdf"]["slots"] == {"limit": 2, "active": 0, "waiting": 0}
+    assert 'taskhive_tasks{status="completed"} 2' in lines
+    assert 'taskhive_tasks{status="rejected"} 1' in lines
+    assert "taskhive_ws_connections 1" in lines
+    assert 'taskhive_stage_active{stage="pdf"} 0' in lines
+    assert "taskhive_scheduler_queue_depth 0" in lines
+    assert 'taskhive_event_loop_lag_seconds_bucket{le="+Inf"} 0' in lines
+    assert 'taskhive_span_duration_seconds_count{span="broadcast",type="chat_message"} 1' in lines
+    families = [line.split()[2] for line in lines if line.startswith("# TYPE")]
+    assert len(families) == len(set(families))
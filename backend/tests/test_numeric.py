@@ -0,0 +1,48 @@
+import math
+
+import pytest
+
+from agents import numeric
+from agents.downsampling import ChartDownsampler
+
+def wave(count: int):
+    return [math.sin(index / 7.0) * 50 + (index % 13) * 3 for index in range(count)]
+
+@pytest.mark.skipif(numeric.np is None, reason="NumPy not installed")
+@pytest.mark.parametrize("count,target", [(10, 5), (500, 60), (1000, 3), (97, 96)])
+def test_lttb_numpy_and_python_paths_pick_the_same_points(monkeypatch, count, target):
+    values = wave(count)
+    vectorized = numeric.lttb_indices(values, target)
+    monkeypatch.setattr(numeric, "np", None)
+
+    assert numeric.lttb_indices(values, target) == vectorized
+
+def test_lttb_keeps_endpoints_and_peaks():
+    values = [0.0] * 200
+    values[77] = 100.0
+    indices = numeric.lttb_indices(values, 20)
+
+    assert len(indices) == 20
+    assert indices[0] == 0 and indices[-1] == 199
+    assert 77 in indices
+    assert indices == sorted(indices)
+
+def test_short_series_are_returned_whole():
+    assert numeric.lttb_indices([1, 2, 3], 10) == [0, 1, 2]
+
+@pytest.mark.skipif(numeric.np is None, reason="NumPy not installed")
+def test_bucket_means_numpy_and_python_paths_agree(monkeypatch):
+    values = wave(103)
+    vectorized = numeric.bucket_means(values, 10, decimals=6)
+    monkeypatch.setattr(numeric, "np", None)
+
+    assert numeric.bucket_means(values, 10, decimals=6) == pytest.approx(vectorized)
+
+def test_downsampler_reduces_line_charts_to_target():
+    downsampler = ChartDownsampler({"line_chart": 50})
+    labels = [f"p{index}" for index in range(400)]
+    reduced_labels, reduced_values, method = downsampler.reduce("line_chart", labels, wave(400))
+
+    assert len(reduced_labels) == len(reduced_values) == 50
+    assert method == "lttb"
+    assert reduced_labels[0] == "p0" and reduced_labels[-1] == "p399"
@@ -0,0 +1,62 @@
+import asyncio
+
+from agents.progress import ProgressReporter
+
+def recording_reporter(max_rate: float = 20.0):
+    sent = []
+
+    async def emit(progress: int):
+        sent.append(progress)
+
+    return ProgressReporter(emit, max_rate=max_rate), sent
+
+def test_fast_updates_coalesce_to_the_latest_value():
+    async def scenario():
+        reporter, sent = recording_reporter()
+        for progress in range(10):
+            await reporter.report(progress * 10)
+        immediate = list(sent)
+        await asyncio.sleep(reporter.min_interval * 3)
+        return reporter, immediate, sent
+
+    reporter, immediate, sent = asyncio.run(scenario())
+
+    # The first update goes out at once; the trailing timer sends only the newest of the rest
+    assert immediate == [0]
+    assert sent == [0, 90]
+    assert (reporter.reported, reporter.emitted) == (10, 2)
+
+def test_flush_sends_the_pending_value_and_stops_the_timer():
+    async def scenario():
+        reporter, sent = recording_reporter()
+        await reporter.report(10)
+        await reporter.report(60)
+        await reporter.flush()
+        flushed = list(sent)
+        await asyncio.sleep(reporter.min_interval * 3)
+        return flushed, sent
+
+    flushed, sent = asyncio.run(scenario())
+
+    assert flushed == [10, 60]
+    assert sent == [10, 60]
+
+def test_cancel_discards_the_trailing_update():
+    async def scenario():
+        reporter, sent = recording_reporter()
+        await reporter.report(10)
+        await reporter.report(60)
+        reporter.cancel()
+        await asyncio.sleep(reporter.min_interval * 3)
+        return sent
+
+    assert asyncio.run(scenario()) == [10]
+
+def test_zero_rate_forwards_every_update():
+    async def scenario():
+        reporter, sent = recording_reporter(max_rate=0)
+        for progress in (10, 20, 30):
+            await reporter.report(progress)
+        return sent
+
+    assert asyncio.run(scenario()) == [10, 20, 30]
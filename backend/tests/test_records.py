@@ -0,0 +1,47 @@
+from datetime import datetime
+
+import pytest
+
+from records import AgentStatus, ChatEntry, GraphEdge, SYSTEM_PROFILE, intern_agent_profile
+
+# Field order of the dataclass AgentStatus these records replaced
+LEGACY_FIELDS = ["name", "role", "status", "progress", "color", "emoji", "last_message", "start_time", "end_time"]
+
+def nova_status(status: str = "idle", progress: int = 0) -> AgentStatus:
+    return AgentStatus(name="Nova", role="ResearchAgent", status=status, progress=progress, color="blue", emoji="🔍")
+
+def test_statuses_share_one_interned_profile():
+    first, second = nova_status(), nova_status("working", 50)
+
+    assert first.profile is second.profile
+    assert first.profile is intern_agent_profile("Nova", "ResearchAgent", "blue", "🔍")
+    assert intern_agent_profile("TaskHive", "Coordinator", "gray", "🐝") is SYSTEM_PROFILE
+    assert (second.name, second.role, second.color, second.emoji) == ("Nova", "ResearchAgent", "blue", "🔍")
+
+def test_agent_status_is_slotted():
+    status = nova_status()
+
+    assert not hasattr(status, "__dict__")
+    with pytest.raises(AttributeError):
+        status.unexpected = True
+
+def test_to_dict_keeps_the_legacy_field_order():
+    status = nova_status("working", 40)
+    status.last_message = "Searching"
+
+    payload = status.to_dict()
+
+    assert list(payload) == LEGACY_FIELDS
+    assert payload["status"] == "working" and payload["progress"] == 40
+    assert payload["last_message"] == "Searching"
+
+def test_chat_entry_and_graph_edge_payloads():
+    timestamp = datetime(2024, 1, 1, 12, 0)
+    profile = intern_agent_profile("Athena", "AnalyzerAgent", "purple", "🧠")
+
+    chat = ChatEntry("athena", "Key insights identified", "success", timestamp, profile).to_payload()
+    edge = GraphEdge("athena", "pixel", "analysis_data", timestamp).to_payload()
+
+    assert chat == {"agent": "athena", "message": "Key insights identified", "type": "success",
+                    "timestamp": timestamp, "color": "purple", "emoji": "🧠"}
+    assert edge == {"from": "athena", "to": "pixel", "type": "analysis_data", "timestamp": timestamp}
@@ -0,0 +1,90 @@
+import asyncio
+
+from agents.report_renderers import ReportArtifact
+from coordinator import TaskCoordinator
+from report_store import ReportArtifactStore
+
+def artifact(data: bytes, report_format: str = "md") -> ReportArtifact:
+    return ReportArtifact(report_format, "text/markdown", f"report.{report_format}", data)
+
+def test_download_puts_fresh_render_in_store(report_store, tracer, manager, fast_agents):
+    async def scenario():
+        coordinator = TaskCoordinator("t1", "Store downloads", manager, report_store=report_store, tracer=tracer)
+        await coordinator.run_workflow()
+        first = await coordinator.get_report_artifact("md")
+        again = await coordinator.get_report_artifact("md")
+        return first, again
+
+    first, again = asyncio.run(scenario())
+
+    assert again is first
+    assert report_store.load("t1", "md") == first.data
+    assert report_store.formats("t1") == ["md"]
+    assert report_store.get_stats()["dedup_hits"] == 0
+
+def test_identical_reports_share_one_blob(report_store):
+    first = report_store.put("t1", artifact(b"same report"))
+    second = report_store.put("t2", artifact(b"same report"))
+
+    assert first == second
+    assert report_store.get_stats()["blobs"] == 1
+    assert report_store.get_stats()["dedup_hits"] == 1
+
+    report_store.remove_task("t1")
+    assert report_store.load("t2", "md") == b"same report"
+    report_store.remove_task("t2")
+    assert report_store.get_stats()["blobs"] == 0
+
+def test_quota_evicts_least_recently_used(tmp_path):
+    store = ReportArtifactStore(path=str(tmp_path), max_bytes=250)
+    store.put("t1", artifact(b"a" * 100))
+    store.put("t2", artifact(b"b" * 100))
+    store.load("t1", "md")
+    store.put("t3", artifact(b"c" * 100))
+
+    assert store.formats("t2") == []
+    assert store.load("t1", "md") == b"a" * 100
+    assert store.load("t3", "md") == b"c" * 100
+    assert store.get_stats()["bytes"] <= 250
+
+def test_index_survives_restart(tmp_path):
+    store = ReportArtifactStore(path=str(tmp_path))
+    store.put("t1", artifact(b"kept"))
+    store.flush()
+
+    assert ReportArtifactStore(path=str(tmp_path)).load("t1", "md") == b"kept"
+
+def test_index_writes_are_batched_until_flush(tmp_path):
+    store = ReportArtifactStore(path=str(tmp_path))
+    writes = store.index_writes
+    for index in range(5):
+        store.put(f"t{index}", artifact(f"report {index}".encode()))
+    store.remove_task("t0")
+
+    assert store.index_writes == writes
+    assert store.flush()
+    assert not store.flush()
+    assert store.index_writes == writes + 1
+
+def test_background_loop_and_stop_flush_the_index(tmp_path):
+    async def scenario():
+        store = ReportArtifactStore(path=str(tmp_path), index_flush_interval=0.01)
+        store.start()
+        store.put("t1", artifact(b"flushed by the loop"))
+        await asyncio.sleep(0.05)
+        flushed_by_loop = ReportArtifactStore(path=str(tmp_path)).formats("t1")
+        store.put("t2", artifact(b"flushed by stop"))
+        await store.stop()
+        return flushed_by_loop
+
+    assert asyncio.run(scenario()) == ["md"]
+    assert ReportArtifactStore(path=str(tmp_path)).load("t2", "md") == b"flushed by stop"
+
+def test_blobs_missing_from_the_index_are_removed_on_load(tmp_path):
+    ReportArtifactStore(path=str(tmp_path)).put("t1", artifact(b"never indexed"))
+    assert len(list(tmp_path.glob("*.md"))) == 1
+
+    store = ReportArtifactStore(path=str(tmp_path))
+
+    assert store.formats("t1") == []
+    assert list(tmp_path.glob("*.md")) == []
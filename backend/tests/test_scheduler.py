@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from scheduler import SchedulerFull, TaskScheduler
+
+class BlockedWorkflow:
+    """Stands in for a TaskCoordinator whose workflow runs until released"""
+
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+        self.status = "initializing"
+        self.release = asyncio.Event()
+        self.cancelled = False
+
+    async def run_workflow(self):
+        self.status = "running"
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        self.status = "completed"
+
+def test_admits_up_to_the_limit_then_queues_in_order():
+    async def scenario():
+        scheduler = TaskScheduler(max_concurrent_workflows=2, max_queue_size=5)
+        workflows = [BlockedWorkflow(f"t{index}") for index in range(4)]
+        positions = [scheduler.submit(workflow) for workflow in workflows]
+        await asyncio.sleep(0)
+        state = (positions, [w.status for w in workflows], scheduler.queue_position("t3"), scheduler.queue_position("t0"))
+        await scheduler.shutdown()
+        return state
+
+    positions, statuses, t3_position, t0_position = asyncio.run(scenario())
+
+    assert positions == [0, 0, 1, 2]
+    assert statuses == ["running", "running", "queued", "queued"]
+    assert t3_position == 2
+    assert t0_position == 0
+
+def test_full_queue_rejects_and_counts():
+    async def scenario():
+        scheduler = TaskScheduler(max_concurrent_workflows=1, max_queue_size=1)
+        scheduler.submit(BlockedWorkflow("t0"))
+        scheduler.submit(BlockedWorkflow("t1"))
+        with pytest.raises(SchedulerFull):
+            scheduler.submit(BlockedWorkflow("t2"))
+        stats = scheduler.get_stats()
+        await scheduler.shutdown()
+        return stats
+
+    stats = asyncio.run(scenario())
+
+    assert (stats["running"], stats["queued"], stats["submitted"], stats["rejected"]) == (1, 1, 2, 1)
+
+def test_finished_workflow_starts_the_next_queued_one():
+    async def scenario():
+        scheduler = TaskScheduler(max_concurrent_workflows=1)
+        first, second = BlockedWorkflow("t0"), BlockedWorkflow("t1")
+        scheduler.submit(first)
+        scheduler.submit(second)
+        await asyncio.sleep(0)
+        first.release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        state = (first.status, second.status, list(scheduler.running), scheduler.finished)
+        await scheduler.shutdown()
+        return state
+
+    assert asyncio.run(scenario()) == ("completed", "running", ["t1"], 1)
+
+def test_stage_slot_caps_concurrency_per_stage():
+    async def scenario():
+        scheduler = TaskScheduler(stage_limits={"pdf": 2})
+        active, peak = 0, 0
+
+        async def build():
+            nonlocal active, peak
+            async with scheduler.stage_slot("pdf"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        builds = asyncio.gather(*(build() for _ in range(5)))
+        await asyncio.sleep(0.001)
+        busy = dict(scheduler.get_stats()["stages"]["pdf"])
+        await builds
+        return peak, busy, scheduler.get_stats()["stages"]["pdf"]
+
+    peak, busy, idle = asyncio.run(scenario())
+
+    assert peak == 2
+    assert (busy["limit"], busy["active"], busy["waiting"]) == (2, 2, 3)
+    assert (idle["active"], idle["waiting"]) == (0, 0)
+
+def test_unlimited_stage_is_not_gated():
+    scheduler = TaskScheduler(stage_limits={"pdf": 1})
+
+    async def scenario():
+        async with scheduler.stage_slot("md"):
+            pass
+
+    asyncio.run(scenario())
+    assert "md" not in scheduler.get_stats()["stages"]
+
+def test_shutdown_cancels_running_and_drops_queued():
+    async def scenario():
+        scheduler = TaskScheduler(max_concurrent_workflows=1)
+        running, queued = BlockedWorkflow("t0"), BlockedWorkflow("t1")
+        scheduler.submit(running)
+        scheduler.submit(queued)
+        await asyncio.sleep(0)
+        await scheduler.shutdown()
+        return running, queued, scheduler
+
+    running, queued, scheduler = asyncio.run(scenario())
+
+    assert running.cancelled
+    assert queued.status == "queued"
+    assert not scheduler.queue and not scheduler.running
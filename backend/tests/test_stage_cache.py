@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+import pytest
+
+from stage_cache import StageCache, stage_cache_key
+
+class Clock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+def test_key_ignores_whitespace_and_key_order():
+    first = stage_cache_key("research", "1", {"query": "solar  power\n", "depth": 2})
+    second = stage_cache_key("research", "1", {"depth": 2, "query": " solar power"})
+    assert first == second
+    assert stage_cache_key("research", "2", {"depth": 2, "query": "solar power"}) != first
+
+def test_hits_are_independent_copies():
+    async def scenario():
+        cache = StageCache()
+        await cache.put("k", {"items": [1, 2]})
+        hit = await cache.get("k")
+        hit["items"].append(3)
+        return await cache.get("k")
+
+    assert asyncio.run(scenario()) == {"items": [1, 2]}
+
+def test_memory_entries_expire_after_ttl(clock):
+    async def scenario():
+        cache = StageCache(ttl_seconds=60)
+        await cache.put("k", {"v": 1})
+        clock.now += 59
+        fresh = await cache.get("k")
+        clock.now += 2
+        return cache, fresh, await cache.get("k")
+
+    cache, fresh, expired = asyncio.run(scenario())
+
+    assert fresh == {"v": 1}
+    assert expired is None
+    assert cache.get_stats()["memory_entries"] == 0
+
+def test_entry_promoted_from_disk_keeps_its_write_time(tmp_path, clock):
+    async def scenario():
+        writer = StageCache(disk_path=str(tmp_path), ttl_seconds=60)
+        await writer.put("k", {"v": 1})
+        clock.now += 50
+        # A second process shares the disk tier and promotes the entry into its memory
+        reader = StageCache(disk_path=str(tmp_path), ttl_seconds=60)
+        promoted = await reader.get("k")
+        clock.now += 20
+        return reader, promoted, await reader.get("k")
+
+    reader, promoted, expired = asyncio.run(scenario())
+
+    assert promoted == {"v": 1}
+    assert expired is None
+    assert reader.get_stats()["disk_hits"] == 1
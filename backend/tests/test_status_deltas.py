@@ -0,0 +1,35 @@
+import asyncio
+import json
+
+from connection_manager import ConnectionManager
+from coordinator import TaskCoordinator
+from fake_sockets import StalledSocket, settle
+
+def test_slow_client_gets_every_delta_without_seq_gaps(report_store, tracer):
+    async def scenario():
+        manager = ConnectionManager()
+        socket = StalledSocket()
+        await manager.connect(socket, topics=["t1"])
+        coordinator = TaskCoordinator("t1", "Deltas", manager, report_store=report_store, tracer=tracer)
+        initial = json.loads(coordinator.status_snapshot_message())
+
+        await coordinator.update_agent_status("nova", "working", 10, "Starting")
+        await coordinator.update_agent_status("athena", "working", 5)
+        await coordinator.update_agent_status("nova", "working", 50)
+        await coordinator.update_agent_status("nova", "completed", 100, "Done")
+        await settle()
+
+        client = manager.active_connections[socket]
+        messages = socket.sent + [message for message, _ in client.queue]
+        final = json.loads(coordinator.status_snapshot_message())
+        manager.disconnect(socket)
+        return initial, [json.loads(message) for message in messages], final
+
+    initial, deltas, final = asyncio.run(scenario())
+
+    assert [delta["seq"] for delta in deltas] == list(range(initial["seq"] + 1, final["seq"] + 1))
+    agents = initial["agents"]
+    for delta in deltas:
+        agents[delta["agent"]].update(delta["changes"])
+    assert agents == final["agents"]
+    assert agents["nova"]["last_message"] == "Done"
@@ -0,0 +1,121 @@
+import asyncio
+import json
+
+import pytest
+
+from coordinator import TaskCoordinator
+from task_registry import TaskRegistry, TaskSummary
+
+def snapshot(entry) -> dict:
+    message = json.loads(entry.status_snapshot_message())
+    del message["timestamp"]
+    return message
+
+async def finished_task(registry: TaskRegistry, task_id: str, manager, report_store, tracer) -> TaskCoordinator:
+    coordinator = TaskCoordinator(task_id, f"Task {task_id}", manager, report_store=report_store, tracer=tracer)
+    registry[task_id] = coordinator
+    await coordinator.run_workflow()
+    return coordinator
+
+def test_evicted_task_keeps_its_read_only_interface(report_store, tracer, manager, fast_agents):
+    async def scenario():
+        registry = TaskRegistry(report_store=report_store)
+        coordinator = await finished_task(registry, "t1", manager, report_store, tracer)
+        before = (coordinator.get_status(), coordinator.get_agent_statuses(), snapshot(coordinator))
+        summary = await registry.evict("t1")
+        return registry, summary, before
+
+    registry, summary, before = asyncio.run(scenario())
+
+    assert isinstance(registry["t1"], TaskSummary)
+    assert registry["t1"] is summary
+    assert (summary.get_status(), summary.get_agent_statuses(), snapshot(summary)) == before
+    assert "json" in summary.stored_formats
+    assert registry.get_stats()["live"] == 0
+
+def test_running_task_is_not_evicted(report_store, tracer, manager):
+    registry = TaskRegistry(report_store=report_store)
+    registry["t1"] = TaskCoordinator("t1", "Still running", manager, report_store=report_store, tracer=tracer)
+
+    with pytest.raises(ValueError):
+        asyncio.run(registry.evict("t1"))
+
+def test_sweep_keeps_max_finished_and_drops_oldest_summaries(report_store, tracer, manager, fast_agents):
+    async def scenario():
+        registry = TaskRegistry(report_store=report_store, max_finished=1, max_summaries=2)
+        for task_id in ("t1", "t2", "t3", "t4"):
+            await finished_task(registry, task_id, manager, report_store, tracer)
+        evicted = await registry.sweep()
+        return registry, evicted
+
+    registry, evicted = asyncio.run(scenario())
+
+    assert evicted == 3
+    assert list(registry.live) == ["t4"]
+    assert list(registry.summaries) == ["t2", "t3"]
+    assert "t1" not in registry
+    assert report_store.formats("t1") == []
+
+def test_concurrent_summary_downloads_render_once(report_store, tracer, manager, fast_agents):
+    async def scenario():
+        registry = TaskRegistry(report_store=report_store)
+        await finished_task(registry, "t1", manager, report_store, tracer)
+        summary = await registry.evict("t1")
+
+        writer = registry._get_report_writer()
+        render_artifact = writer.render_artifact
+        renders = []
+
+        async def counting_render(*args):
+            renders.append(args[1])
+            await asyncio.sleep(0.01)
+            return await render_artifact(*args)
+
+        writer.render_artifact = counting_render
+        artifacts = await asyncio.gather(*(summary.get_report_artifact("html") for _ in range(4)))
+        late = await summary.get_report_artifact("html")
+        return renders, artifacts, late
+
+    renders, artifacts, late = asyncio.run(scenario())
+
+    assert renders == ["html"]
+    assert len({artifact.data for artifact in artifacts + [late]}) == 1
+    assert report_store.formats("t1") == ["html", "json"]
+
+def test_waiter_and_newcomer_never_render_concurrently(report_store, tracer, manager, fast_agents):
+    async def scenario():
+        registry = TaskRegistry(report_store=report_store)
+        await finished_task(registry, "t1", manager, report_store, tracer)
+        summary = await registry.evict("t1")
+
+        writer = registry._get_report_writer()
+        render_artifact = writer.render_artifact
+        active = []
+        overlaps = []
+        calls = []
+
+        async def flaky_render(*args):
+            calls.append(args[1])
+            active.append(args[1])
+            overlaps.append(len(active))
+            try:
+                await asyncio.sleep(0.01)
+                if len(calls) == 1:
+                    raise RuntimeError("render failed")
+                return await render_artifact(*args)
+            finally:
+                active.pop()
+
+        writer.render_artifact = flaky_render
+        first = asyncio.create_task(summary.get_report_artifact("md"))
+        waiter = asyncio.create_task(summary.get_report_artifact("md"))
+        with pytest.raises(RuntimeError):
+            await first
+        # Arrives once the failed render released the lock and the waiter is rendering
+        newcomer = await summary.get_report_artifact("md")
+        return overlaps, await waiter, newcomer
+
+    overlaps, waited, newcomer = asyncio.run(scenario())
+
+    assert max(overlaps) == 1
+    assert waited.data == newcomer.data
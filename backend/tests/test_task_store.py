@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from connection_manager import ConnectionManager
+from coordinator import TaskCoordinator, restore_incomplete_tasks
+from scheduler import SchedulerFull, TaskScheduler
+from task_store import InMemoryTaskStore, SQLiteTaskStore
+
+def finished_stage_outputs(report_store, tracer):
+    """Checkpoints of a complete run, to seed a store as if a process had stopped mid-task"""
+    store = InMemoryTaskStore()
+    coordinator = TaskCoordinator("source", "Resume test", ConnectionManager(), task_store=store,
+                                  report_store=report_store, tracer=tracer)
+    asyncio.run(coordinator.run_workflow())
+    return store.load_outputs("source")
+
+def test_restart_resumes_after_checkpointed_stages(tmp_path, report_store, tracer, fast_agents):
+    outputs = finished_stage_outputs(report_store, tracer)
+    path = str(tmp_path / "tasks.db")
+
+    store = SQLiteTaskStore(path)
+    TaskCoordinator("t1", "Resume test", ConnectionManager(), task_store=store, report_store=report_store, tracer=tracer)
+    store.set_status("t1", "running")
+    for stage_name in ("nova", "athena"):
+        store.save_stage("t1", stage_name, outputs[stage_name])
+    store.close()
+
+    store = SQLiteTaskStore(path)
+    restored = restore_incomplete_tasks(store, ConnectionManager(), report_store=report_store)
+    assert [coordinator.task_id for coordinator in restored] == ["t1"]
+    coordinator = restored[0]
+    coordinator.tracer = tracer
+    asyncio.run(coordinator.run_workflow())
+
+    assert coordinator.resumed_stages == ["nova", "athena"]
+    assert sorted(coordinator.workflow_run.skipped) == ["athena", "nova"]
+    assert coordinator.research_data == outputs["nova"]["research_data"]
+    assert coordinator.get_status() == "completed"
+    assert store.get_task("t1")["status"] == "completed"
+    assert store.incomplete_tasks() == []
+    store.close()
+
+def test_rejected_task_is_not_resumed(tmp_path, report_store, tracer):
+    path = str(tmp_path / "tasks.db")
+    store = SQLiteTaskStore(path)
+    scheduler = TaskScheduler(max_concurrent_workflows=0, max_queue_size=0)
+    coordinator = TaskCoordinator("t1", "Rejected", ConnectionManager(), scheduler=scheduler, task_store=store,
+                                  report_store=report_store, tracer=tracer)
+    with pytest.raises(SchedulerFull):
+        scheduler.submit(coordinator)
+    coordinator.mark_rejected()
+    store.close()
+
+    store = SQLiteTaskStore(path)
+    assert restore_incomplete_tasks(store, ConnectionManager(), report_store=report_store) == []
+    assert store.get_task("t1")["status"] == "rejected"
+    store.close()
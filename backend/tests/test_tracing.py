@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from tracing import Histogram, Tracer
+
+def histogram_of(*values, bounds=(0.1, 1.0)) -> Histogram:
+    histogram = Histogram(bounds)
+    for value in values:
+        histogram.observe(value)
+    return histogram
+
+def test_nested_spans_share_the_trace_and_point_at_their_parent():
+    tracer = Tracer(max_spans=10)
+
+    async def child():
+        with tracer.span("child") as span:
+            return span
+
+    async def scenario():
+        with tracer.span("root") as root:
+            with tracer.span("inner") as inner:
+                pass
+            # Tasks copy the context, so spans started in them nest under the current one
+            children = await asyncio.gather(child(), child())
+        with tracer.span("next") as unrelated:
+            pass
+        return root, inner, children, unrelated
+
+    root, inner, children, unrelated = asyncio.run(scenario())
+
+    assert root.parent_id == ""
+    assert len(root.trace_id) == 32 and len(root.span_id) == 16
+    assert (inner.trace_id, inner.parent_id) == (root.trace_id, root.span_id)
+    assert all((span.trace_id, span.parent_id) == (root.trace_id, root.span_id) for span in children)
+    assert children[0].span_id != children[1].span_id
+    assert unrelated.trace_id != root.trace_id and unrelated.parent_id == ""
+    assert [span.name for span in tracer.recent_spans] == ["inner", "child", "child", "root", "next"]
+
+def test_failed_span_records_the_error_and_reraises():
+    tracer = Tracer(max_spans=10)
+
+    with pytest.raises(ValueError):
+        with tracer.span("render", {"format": "pdf"}):
+            raise ValueError("bad font")
+
+    assert tracer.recent_spans[0].error == "ValueError: bad font"
+    assert tracer.histograms[("render", (("format", "pdf"),))].errors == 1
+
+def test_prometheus_buckets_are_cumulative():
+    tracer = Tracer(buckets=(0.1, 1.0))
+    tracer.histograms[("broadcast", (("type", "chat_message"),))] = histogram_of(0.05, 0.5, 0.5, 5.0)
+
+    lines = tracer.export_prometheus().splitlines()
+
+    assert lines[:2] == [
+        "# HELP taskhive_span_duration_seconds Duration of traced operations in seconds.",
+        "# TYPE taskhive_span_duration_seconds histogram"
+    ]
+    labels = 'span="broadcast",type="chat_message"'
+    assert lines[2:7] == [
+        f'taskhive_span_duration_seconds_bucket{{{labels},le="0.1"}} 1',
+        f'taskhive_span_duration_seconds_bucket{{{labels},le="1.0"}} 3',
+        f'taskhive_span_duration_seconds_bucket{{{labels},le="+Inf"}} 4',
+        f"taskhive_span_duration_seconds_sum{{{labels}}} 6.05",
+        f"taskhive_span_duration_seconds_count{{{labels}}} 4"
+    ]
+    assert f"taskhive_span_errors_total{{{labels}}} 0" in lines
+
+def test_otel_json_keeps_per_bucket_counts():
+    tracer = Tracer(service_name="taskhive-test", buckets=(0.1, 1.0))
+    tracer.histograms[("broadcast", ())] = histogram_of(0.05, 0.5, 0.5, 5.0)
+
+    resource_metrics = tracer.export_otel_json()["resourceMetrics"][0]
+    metric = resource_metrics["scopeMetrics"][0]["metrics"][0]
+    point = metric["histogram"]["dataPoints"][0]
+
+    assert resource_metrics["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "taskhive-test"}}
+    ]
+    assert metric["histogram"]["aggregationTemporality"] == 2
+    assert point["attributes"] == [{"key": "span.name", "value": {"stringValue": "broadcast"}}]
+    assert point["bucketCounts"] == ["1", "2", "1"]
+    assert point["explicitBounds"] == [0.1, 1.0]
+    assert (point["count"], point["min"], point["max"]) == ("4", 0.05, 5.0)
+
+def test_quantile_interpolates_inside_the_bucket():
+    histogram = histogram_of(0.5, 1.5, 1.5, 3.0, bounds=(1.0, 2.0, 4.0))
+
+    assert histogram.quantile(0.5) == pytest.approx(1.5)
+    assert histogram.quantile(0.25) == pytest.approx(1.0)
+    # Never beyond the largest value actually observed
+    assert histogram.quantile(1.0) == 3.0
+    assert Histogram().quantile(0.99) == 0.0
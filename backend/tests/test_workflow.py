@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from workflow import WorkflowGraph
+
+def stage(log, name, outputs, delay=0.0):
+    async def run(inputs):
+        log.append(("start", name))
+        await asyncio.sleep(delay)
+        log.append(("end", name))
+        return {key: f"{name}:{key}" for key in outputs}
+    return run
+
+def diamond(log):
+    graph = WorkflowGraph()
+    graph.add_stage("research", ("task",), ("sources",), stage(log, "research", ("sources",)))
+    graph.add_stage("analysis", ("sources",), ("analysis",), stage(log, "analysis", ("analysis",), 0.02))
+    graph.add_stage("charts", ("sources",), ("charts",), stage(log, "charts", ("charts",), 0.01))
+    graph.add_stage("report", ("analysis", "charts"), ("report",), stage(log, "report", ("report",)))
+    return graph
+
+def test_stages_start_after_their_inputs_and_independent_ones_overlap():
+    log = []
+    run = asyncio.run(diamond(log).run({"task": "t"}))
+
+    position = {event: index for index, event in enumerate(log)}
+    assert position[("end", "research")] < position[("start", "analysis")]
+    assert position[("end", "research")] < position[("start", "charts")]
+    assert position[("start", "charts")] < position[("end", "analysis")]
+    assert position[("end", "analysis")] < position[("start", "report")]
+    assert run.outputs["report"] == "report:report"
+    assert run.critical_path == ["research", "analysis", "report"]
+
+def test_stages_with_restored_outputs_are_skipped():
+    log = []
+    run = asyncio.run(diamond(log).run({"task": "t", "sources": "restored", "analysis": "restored"}))
+
+    assert sorted(run.skipped) == ["analysis", "research"]
+    assert {name for _, name in log} == {"charts", "report"}
+
+def test_missing_inputs_and_cycles_are_rejected():
+    graph = WorkflowGraph()
+    graph.add_stage("a", ("b_out",), ("a_out",), stage([], "a", ("a_out",)))
+    graph.add_stage("b", ("a_out",), ("b_out",), stage([], "b", ("b_out",)))
+    with pytest.raises(ValueError, match="Cycle"):
+        graph.validate()
+
+    graph = WorkflowGraph()
+    graph.add_stage("a", ("nothing",), ("a_out",), stage([], "a", ("a_out",)))
+    with pytest.raises(ValueError, match="nothing produces"):
+        graph.validate()
+
+    with pytest.raises(ValueError, match="already produced"):
+        graph.add_stage("c", (), ("a_out",), stage([], "c", ("a_out",)))
+
+def test_stream_consumer_starts_before_producer_finishes():
+    seen = []
+
+    async def produce(inputs):
+        channel = inputs["partial_sources"]
+        for item in range(3):
+            channel.publish(item)
+            await asyncio.sleep(0.005)
+        return {"sources": [0, 1, 2]}
+
+    async def consume(inputs):
+        async for item in inputs["partial_sources"]:
+            seen.append((item, "sources" in finished))
+        return {"analysis": await inputs["partial_sources"].result()}
+
+    finished = {}
+
+    async def record(name, outputs):
+        finished.update(outputs)
+
+    graph = WorkflowGraph()
+    graph.add_stage("research", ("task",), ("sources",), produce, streams={"partial_sources": "sources"})
+    graph.add_stage("analysis", ("partial_sources",), ("analysis",), consume)
+    run = asyncio.run(graph.run({"task": "t"}, on_stage_complete=record))
+
+    assert [item for item, _ in seen] == [0, 1, 2]
+    assert not seen[0][1]
+    assert run.outputs["analysis"] == [0, 1, 2]
+
+def test_failing_producer_fails_its_stream_consumers():
+    async def produce(inputs):
+        inputs["partial"].publish("first")
+        raise RuntimeError("source down")
+
+    async def consume(inputs):
+        return {"analysis": [item async for item in inputs["partial"]]}
+
+    graph = WorkflowGraph()
+    graph.add_stage("research", ("task",), ("sources",), produce, streams={"partial": "sources"})
+    graph.add_stage("analysis", ("partial",), ("analysis",), consume)
+
+    with pytest.raises(RuntimeError, match="source down"):
+        asyncio.run(graph.run({"task": "t"}))
@@ -0,0 +1,293 @@
+import bisect
+import contextlib
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Any, Deque, Iterator, List, Optional, Tuple
+
+# Upper bounds in seconds; covers sub-millisecond broadcasts up to minute-long workflows
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+class Histogram:
+    """Cumulative duration histogram with fixed bucket bounds, as in Prometheus"""
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        # One count per bound plus the overflow (+Inf) bucket; not cumulative
+        self.bucket_counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.errors = 0
+        self.start_time_ns = time.time_ns()
+
+    def observe(self, value: float, error: bool = False):
+        self.bucket_counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if error:
+            self.errors += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate by linear interpolation inside the bucket, like histogram_quantile()"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for index, count in enumerate(self.bucket_counts):
+            upper = self.bounds[index] if index < len(self.bounds) else self.max
+            if count and seen + count >= rank:
+                return min(self.max, lower + (upper - lower) * (rank - seen) / count)
+            seen += count
+            lower = upper
+        return self.max
+
+@dataclass
+class Span:
+    """One timed operation; nested spans share the trace_id of the outermost one"""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str = ""
+    labels: Dict[str, str] = field(default_factory=dict)
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_time_ns: int = 0
+    end_time_ns: int = 0
+    error: str = ""
+
+    @property
+    def duration(self) -> float:
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def fail(self, error: BaseException):
+        """Mark the span failed when the error is handled inside it"""
+        self.error = f"{type(error).__name__}: {error}"
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("taskhive_current_span", default=None)
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+def prometheus_labels(label_pairs) -> str:
+    """Render (name, value) pairs as the inside of a Prometheus label set"""
+    return ",".join(f'{key}="{_escape_label(str(value))}"' for key, value in label_pairs)
+
+def prometheus_histogram(metric: str, histogram: Histogram, label_pairs=()) -> List[str]:
+    """_bucket/_sum/_count sample lines for one histogram series"""
+    label_text = prometheus_labels(label_pairs)
+    prefix = f"{label_text}," if label_text else ""
+    suffix = f"{{{label_text}}}" if label_text else ""
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.bucket_counts):
+        cumulative += count
+        lines.append(f'{metric}_bucket{{{prefix}le="{_format_bound(bound)}"}} {cumulative}')
+    lines.append(f'{metric}_bucket{{{prefix}le="+Inf"}} {histogram.count}')
+    lines.append(f"{metric}_sum{suffix} {histogram.sum!r}")
+    lines.append(f"{metric}_count{suffix} {histogram.count}")
+    return lines
+
+def _otel_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+def _otel_attributes(values: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otel_value(value)} for key, value in values.items()]
+
+class Tracer:
+    """In-process spans with per-name duration histograms; no collector required
+
+    labels become histogram dimensions and must stay low-cardinality (agent,
+    format, message type); attributes such as task_id are kept on the span
+    only. Finished spans are retained in a bounded buffer for inspection.
+    Histograms export as Prometheus text or OpenTelemetry (OTLP/JSON) metrics.
+    """
+
+    def __init__(self, service_name: str = "taskhive", buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+                 max_spans: int = 1000, enabled: bool = True):
+        self.service_name = service_name
+        self.buckets = tuple(buckets)
+        self.enabled = enabled
+        self.histograms: Dict[LabelKey, Histogram] = {}
+        self.recent_spans: Deque[Span] = deque(maxlen=max_spans)
+        self.max_spans = max_spans
+        # Spans may finish on worker threads (asyncio.to_thread)
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name: str, labels: Dict[str, str] = None, **attributes) -> Iterator[Span]:
+        """Time the enclosed block; exceptions mark the span failed and propagate"""
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else _new_id(128),
+            span_id=_new_id(64),
+            parent_id=parent.span_id if parent is not None else "",
+            labels=labels or {},
+            attributes=attributes,
+            start_time_ns=time.time_ns()
+        )
+        token = _current_span.set(span)
+        started = time.perf_counter_ns()
+        try:
+            yield span
+        except BaseException as e:
+            span.fail(e)
+            raise
+        finally:
+            span.end_time_ns = span.start_time_ns + (time.perf_counter_ns() - started)
+            _current_span.reset(token)
+            if self.enabled:
+                self._record(span)
+
+    def _record(self, span: Span):
+        key = (span.name, tuple(sorted(span.labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(span.duration, error=bool(span.error))
+            if self.max_spans:
+                self.recent_spans.append(span)
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.recent_spans.clear()
+
+    def _snapshot(self) -> List[Tuple[LabelKey, Histogram]]:
+        with self._lock:
+            return sorted(self.histograms.items())
+
+    def export_prometheus(self, prefix: str = "taskhive") -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        metric = f"{prefix}_span_duration_seconds"
+        errors = f"{prefix}_span_errors_total"
+        lines = [
+            f"# HELP {metric} Duration of traced operations in seconds.",
+            f"# TYPE {metric} histogram"
+        ]
+        error_lines = [
+            f"# HELP {errors} Traced operations that raised or were marked failed.",
+            f"# TYPE {errors} counter"
+        ]
+        for (name, labels), histogram in self._snapshot():
+            label_pairs = (("span", name), *labels)
+            lines.extend(prometheus_histogram(metric, histogram, label_pairs))
+            error_lines.append(f"{errors}{{{prometheus_labels(label_pairs)}}} {histogram.errors}")
+        return "\n".join(lines + error_lines) + "\n"
+
+    def _resource(self) -> Dict[str, Any]:
+        return {"attributes": _otel_attributes({"service.name": self.service_name})}
+
+    def export_otel_json(self) -> Dict[str, Any]:
+        """Histograms as an OTLP/JSON ExportMetricsServiceRequest (cumulative temporality)"""
+        now = str(time.time_ns())
+        data_points = [
+            {
+                "attributes": _otel_attributes({"span.name": name, **dict(labels)}),
+                "startTimeUnixNano": str(histogram.start_time_ns),
+                "timeUnixNano": now,
+                "count": str(histogram.count),
+                "sum": histogram.sum,
+                "min": histogram.min if histogram.count else 0.0,
+                "max": histogram.max,
+                "bucketCounts": [str(count) for count in histogram.bucket_counts],
+                "explicitBounds": list(self.buckets)
+            }
+            for (name, labels), histogram in self._snapshot()
+        ]
+        return {"resourceMetrics": [{
+            "resource": self._resource(),
+            "scopeMetrics": [{
+                "scope": {"name": "taskhive.tracing"},
+                "metrics": [{
+                    "name": "taskhive.span.duration",
+                    "unit": "s",
+                    "description": "Duration of traced operations",
+                    "histogram": {"aggregationTemporality": 2, "dataPoints": data_points}
+                }]
+            }]
+        }]}
+
+    def export_otel_spans(self) -> Dict[str, Any]:
+        """Recently finished spans as an OTLP/JSON ExportTraceServiceRequest"""
+        with self._lock:
+            spans = list(self.recent_spans)
+        return {"resourceSpans": [{
+            "resource": self._resource(),
+            "scopeSpans": [{
+                "scope": {"name": "taskhive.tracing"},
+                "spans": [
+                    {
+                        "traceId": span.trace_id,
+                        "spanId": span.span_id,
+                        "parentSpanId": span.parent_id,
+                        "name": span.name,
+                        "kind": 1,  # SPAN_KIND_INTERNAL
+                        "startTimeUnixNano": str(span.start_time_ns),
+                        "endTimeUnixNano": str(span.end_time_ns),
+                        "attributes": _otel_attributes({**span.labels, **span.attributes}),
+                        "status": {"code": 2, "message": span.error} if span.error else {"code": 1}
+                    }
+                    for span in spans
+                ]
+            }]
+        }]}
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """Per span name and labels, ordered by total time spent, largest first"""
+        stats = [
+            {
+                "span": name,
+                "labels": dict(labels),
+                "count": histogram.count,
+                "errors": histogram.errors,
+                "total_seconds": round(histogram.sum, 6),
+                "mean_ms": round(histogram.sum / histogram.count * 1000, 3) if histogram.count else 0.0,
+                "p50_ms": round(histogram.quantile(0.5) * 1000, 3),
+                "p99_ms": round(histogram.quantile(0.99) * 1000, 3),
+                "max_ms": round(histogram.max * 1000, 3)
+            }
+            for (name, labels), histogram in self._snapshot()
+        ]
+        return sorted(stats, key=lambda entry: entry["total_seconds"], reverse=True)
+
+_default_tracer: Tracer = None
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer; TASKHIVE_TRACING=0 disables recording, TASKHIVE_TRACE_SPANS sizes the span buffer"""
+    global _default_tracer
+    if _default_tracer is None:
+        _default_tracer = Tracer(
+            max_spans=int(os.getenv("TASKHIVE_TRACE_SPANS", "1000")),
+            enabled=os.getenv("TASKHIVE_TRACING", "1") != "0"
+        )
+    return _default_tracer
@@ -0,0 +1,282 @@
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Callable, Awaitable, Tuple
+
+StageFunc = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+StageSlot = Callable[[str], Any]
+StageCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+class StreamChannel:
+    """Partial results of a running stage, closed with one of its final outputs
+
+    Consumers iterate every item from the start, so a late consumer misses
+    nothing; result() waits for the producing stage to finish.
+    """
+
+    def __init__(self):
+        self.items: List[Any] = []
+        self.closed = False
+        self._result: Any = None
+        self._error: BaseException = None
+        self._updated = asyncio.Event()
+
+    @classmethod
+    def completed(cls, result: Any) -> "StreamChannel":
+        """An already-closed channel, for stages restored from a checkpoint"""
+        channel = cls()
+        channel.close(result)
+        return channel
+
+    def publish(self, item: Any):
+        if self.closed:
+            raise RuntimeError("Cannot publish to a closed stream")
+        self.items.append(item)
+        self._wake()
+
+    def close(self, result: Any):
+        if not self.closed:
+            self.closed = True
+            self._result = result
+            self._wake()
+
+    def fail(self, error: BaseException):
+        if not self.closed:
+            self.closed = True
+            self._error = error
+            self._wake()
+
+    def _wake(self):
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+    async def __aiter__(self):
+        index = 0
+        while True:
+            updated = self._updated
+            while index < len(self.items):
+                yield self.items[index]
+                index += 1
+            if self.closed:
+                if self._error is not None:
+                    raise self._error
+                return
+            await updated.wait()
+
+    async def result(self) -> Any:
+        while not self.closed:
+            await self._updated.wait()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+@dataclass
+class Stage:
+    """A unit of work in the workflow graph with declared inputs and outputs
+
+    streams maps a stream key to the output it previews: the stage receives an
+    open StreamChannel under that key and consumers of the key start as soon as
+    the stage does.
+    """
+    name: str
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    run: StageFunc
+    streams: Dict[str, str] = field(default_factory=dict)
+
+@dataclass
+class StageTiming:
+    name: str
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+@dataclass
+class WorkflowRun:
+    """Outputs and timing information collected from one graph execution"""
+    outputs: Dict[str, Any]
+    timings: Dict[str, StageTiming] = field(default_factory=dict)
+    wall_duration: float = 0.0
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_duration: float = 0.0
+    skipped: List[str] = field(default_factory=list)
+
+    @property
+    def serial_duration(self) -> float:
+        """Time the stages would have taken if run one after another"""
+        return sum(timing.duration for timing in self.timings.values())
+
+    @property
+    def overlap_savings(self) -> float:
+        """Latency saved by running independent stages concurrently"""
+        return max(0.0, self.serial_duration - self.wall_duration)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "wall_duration": round(self.wall_duration, 3),
+            "serial_duration": round(self.serial_duration, 3),
+            "critical_path": self.critical_path,
+            "critical_path_duration": round(self.critical_path_duration, 3),
+            "overlap_savings": round(self.overlap_savings, 3),
+            "skipped_stages": self.skipped,
+            "stage_durations": {name: round(t.duration, 3) for name, t in self.timings.items()}
+        }
+
+class WorkflowGraph:
+    """Declarative stage graph that runs every stage as soon as its inputs exist"""
+
+    def __init__(self):
+        self.stages: Dict[str, Stage] = {}
+        self.producers: Dict[str, str] = {}
+
+    def add_stage(self, name: str, inputs: Tuple[str, ...], outputs: Tuple[str, ...], run: StageFunc,
+                  streams: Dict[str, str] = None) -> Stage:
+        """Register a stage; each output or stream key may only be produced by one stage"""
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' already registered")
+        streams = dict(streams or {})
+        for stream_key, output_key in streams.items():
+            if output_key not in outputs:
+                raise ValueError(f"Stream '{stream_key}' must preview one of the outputs of stage '{name}'")
+        for key in (*outputs, *streams):
+            if key in self.producers:
+                raise ValueError(f"Output '{key}' already produced by stage '{self.producers[key]}'")
+        stage = Stage(name=name, inputs=tuple(inputs), outputs=tuple(outputs), run=run, streams=streams)
+        self.stages[name] = stage
+        for key in (*outputs, *streams):
+            self.producers[key] = name
+        return stage
+
+    def dependencies(self, stage_name: str) -> List[str]:
+        """Names of the stages whose outputs the given stage consumes"""
+        stage = self.stages[stage_name]
+        return sorted({self.producers[key] for key in stage.inputs if key in self.producers})
+
+    def validate(self, initial_keys: Tuple[str, ...] = ()):
+        """Ensure every input is available and the graph has no cycles"""
+        for stage in self.stages.values():
+            for key in stage.inputs:
+                if key not in self.producers and key not in initial_keys:
+                    raise ValueError(f"Stage '{stage.name}' needs '{key}' but nothing produces it")
+
+        visiting, visited = set(), set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle detected at stage '{name}'")
+            visiting.add(name)
+            for dependency in self.dependencies(name):
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    async def run(self, initial: Dict[str, Any], stage_slot: StageSlot = None,
+                  on_stage_complete: StageCallback = None) -> WorkflowRun:
+        """Execute all stages, launching each one once its inputs are ready
+
+        stage_slot, if given, returns an async context manager per stage name
+        that is held while the stage runs (used for per-stage concurrency caps).
+        Stages whose outputs are already present in initial are skipped, which
+        lets a checkpointed workflow resume; on_stage_complete is awaited with
+        each finished stage's outputs. Stream channels are closed with their
+        output when the producing stage finishes, or failed if it raises.
+        """
+        self.validate(tuple(initial))
+
+        values = dict(initial)
+        result = WorkflowRun(outputs=values)
+        pending = {}
+        for name, stage in self.stages.items():
+            if all(key in values for key in stage.outputs):
+                result.skipped.append(name)
+                for stream_key, output_key in stage.streams.items():
+                    values[stream_key] = StreamChannel.completed(values[output_key])
+            else:
+                pending[name] = stage
+        running: Dict[asyncio.Task, str] = {}
+        started = time.perf_counter()
+
+        async def execute(stage: Stage) -> Dict[str, Any]:
+            stage_start = time.perf_counter()
+            stage_inputs = {key: values[key] for key in (*stage.inputs, *stage.streams)}
+            try:
+                async with stage_slot(stage.name) if stage_slot else contextlib.nullcontext():
+                    produced = await stage.run(stage_inputs)
+                missing = [key for key in stage.outputs if key not in produced]
+                if missing:
+                    raise ValueError(f"Stage '{stage.name}' did not produce {missing}")
+            except BaseException as e:
+                for stream_key in stage.streams:
+                    values[stream_key].fail(e)
+                raise
+            for stream_key, output_key in stage.streams.items():
+                values[stream_key].close(produced[output_key])
+            result.timings[stage.name] = StageTiming(stage.name, stage_start, time.perf_counter())
+            if on_stage_complete is not None:
+                await on_stage_complete(stage.name, {key: produced[key] for key in stage.outputs})
+            return produced
+
+        try:
+            while pending or running:
+                launched = True
+                while launched:
+                    # A launched stage's streams may unblock consumers immediately
+                    launched = False
+                    for name, stage in list(pending.items()):
+                        if all(key in values for key in stage.inputs):
+                            for stream_key in stage.streams:
+                                values[stream_key] = StreamChannel()
+                            running[asyncio.create_task(execute(stage))] = name
+                            del pending[name]
+                            launched = True
+
+                if not running:
+                    raise RuntimeError(f"Workflow stalled with unresolved stages: {sorted(pending)}")
+
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = running.pop(task)
+                    produced = task.result()
+                    for key in self.stages[name].outputs:
+                        values[key] = produced[key]
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        result.wall_duration = time.perf_counter() - started
+        result.critical_path, result.critical_path_duration = self._critical_path(result.timings)
+        return result
+
+    def _critical_path(self, timings: Dict[str, StageTiming]) -> Tuple[List[str], float]:
+        """Longest chain of dependent stages weighted by measured duration"""
+        best: Dict[str, Tuple[float, List[str]]] = {}
+
+        def longest(name: str) -> Tuple[float, List[str]]:
+            if name not in best:
+                timing = timings[name]
+                candidates = [(timing.duration, [name])]
+                # Skipped (restored) stages took no time in this run
+                for dep in self.dependencies(name):
+                    if dep in timings:
+                        length, path = longest(dep)
+                        # A stream consumer overlaps its producer; only the time after it counts
+                        tail = timing.end - max(timing.start, timings[dep].end)
+                        candidates.append((length + max(tail, 0.0), path + [name]))
+                best[name] = max(candidates, key=lambda item: item[0])
+            return best[name]
+
+        if not timings:
+            return [], 0.0
+        length, path = max((longest(name) for name in timings), key=lambda item: item[0])
+        return path, length
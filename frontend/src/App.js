@@ -26,7 +26,7 @@ function App() {
   const [toast, setToast] = useState({ message: '', type: 'info', isVisible: false });
   const [isAuthenticated, setIsAuthenticated] = useState(false);
   
-  const { messages, agentStatuses, graphData, sendMessage, isConnected, isConnecting, taskStatus } = useWebSocket();
+  const { messages, agentStatuses, graphData, sendMessage, subscribe, isConnected, isConnecting, taskStatus } = useWebSocket();
   const { startTask, downloadReport } = useTaskManager();
   
   const handleStartTask = async (taskDescription) => {
@@ -34,6 +34,7 @@ function App() {
       const taskId = await startTask(taskDescription);
       setCurrentTask({ id: taskId, description: taskDescription });
       setShowFinalOutput(false);
+      subscribe(taskId);
       
       // Send ping to keep WebSocket alive
       sendMessage({ type: 'ping' });
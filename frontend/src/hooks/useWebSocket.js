@@ -9,6 +9,9 @@ export const useWebSocket = () => {
   const [taskStatus, setTaskStatus] = useState('idle');
   const wsRef = useRef(null);
   const reconnectTimeoutRef = useRef(null);
+  // Task whose updates this client receives, and the last agent status seq applied for it
+  const taskIdRef = useRef(null);
+  const statusSeqRef = useRef(null);
 
   const connect = useCallback(() => {
     try {
@@ -26,6 +29,12 @@ export const useWebSocket = () => {
           clearTimeout(reconnectTimeoutRef.current);
           reconnectTimeoutRef.current = null;
         }
+
+        // Subscriptions do not survive a reconnect; the server answers with a fresh snapshot
+        if (taskIdRef.current) {
+          statusSeqRef.current = null;
+          ws.send(JSON.stringify({ type: 'subscribe', task_id: taskIdRef.current }));
+        }
       };
 
       ws.onmessage = (event) => {
@@ -103,6 +112,30 @@ export const useWebSocket = () => {
         }
         break;
 
+      case 'agent_status_snapshot':
+        // Full state of every agent; later agent_status_delta messages continue from its seq
+        statusSeqRef.current = data.seq;
+        setAgentStatuses(Object.fromEntries(
+          Object.entries(data.agents).map(([agentId, agent]) => [agentId, toAgentStatus(agent)])
+        ));
+        break;
+
+      case 'agent_status_delta':
+        if (statusSeqRef.current === null || data.seq !== statusSeqRef.current + 1) {
+          // Missed a delta (or no snapshot yet): ask for a snapshot instead of applying out of order
+          statusSeqRef.current = null;
+          if (wsRef.current && wsRef.current.readyState === WebSocket.OPEN) {
+            wsRef.current.send(JSON.stringify({ type: 'resync', task_id: data.task_id }));
+          }
+          break;
+        }
+        statusSeqRef.current = data.seq;
+        setAgentStatuses(prev => ({
+          ...prev,
+          [data.agent]: { ...prev[data.agent], ...toAgentStatus(data.changes) }
+        }));
+        break;
+
       case 'graph_edge':
         setGraphData(prev => [...prev, {
           source: data.data.source,
@@ -173,6 +206,16 @@ export const useWebSocket = () => {
     }
   }, []);
 
+  // Receive only this task's updates, replacing any previous subscription
+  const subscribe = useCallback((taskId) => {
+    if (taskIdRef.current && taskIdRef.current !== taskId) {
+      sendMessage({ type: 'unsubscribe', task_id: taskIdRef.current });
+    }
+    taskIdRef.current = taskId;
+    statusSeqRef.current = null;
+    sendMessage({ type: 'subscribe', task_id: taskId });
+  }, [sendMessage]);
+
   // Connect on mount
   useEffect(() => {
     connect();
@@ -206,6 +249,16 @@ export const useWebSocket = () => {
     isConnected,
     isConnecting,
     taskStatus,
-    sendMessage
+    sendMessage,
+    subscribe
   };
 };
+
+// Fields the dashboard shows, from a status snapshot entry or the changed fields of a delta
+const AGENT_STATUS_FIELDS = ['status', 'progress', 'role', 'emoji', 'color'];
+
+function toAgentStatus(agent) {
+  return Object.fromEntries(
+    AGENT_STATUS_FIELDS.filter(field => field in agent).map(field => [field, agent[field]])
+  );
+}